@@ -0,0 +1,58 @@
+"""Measures the memory held by each map tile entity.
+
+Builds tiles the way the map loaders do (a shared image, plus a SolidBodyComponent with one
+HitBox for solid tiles) and reports the bytes allocated per tile, as traced by tracemalloc.
+
+Usage:
+    python benchmarks/tile_memory.py [tiles]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import sys
+import tracemalloc
+from typing import Any
+
+import pygame
+
+from apu.collision import HitBox
+from apu.objects.components import SolidBodyComponent
+from apu.objects.entities import BaseSprite, CompactSprite
+
+
+def measure(factory: Callable[[int], Any], count: int) -> float:
+    """Returns the bytes allocated per object built by factory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main(count: int = 65536) -> None:
+    pygame.init()
+    image = pygame.Surface((16, 16))
+    kinds: dict[str, type[Any]] = {"BaseSprite": BaseSprite, "CompactSprite": CompactSprite}
+
+    print(f"{'entity':<16}{'static tile':>16}{'solid tile':>16}")
+    for name, sprite_type in kinds.items():
+
+        def static_tile(index: int, sprite_type: type[Any] = sprite_type) -> Any:
+            return sprite_type((index % 256 * 16, index // 256 * 16), 0, image)
+
+        def solid_tile(index: int, sprite_type: type[Any] = sprite_type) -> Any:
+            sprite = sprite_type((index % 256 * 16, index // 256 * 16), 0, image)
+            sprite.add_component(SolidBodyComponent(box1=HitBox(pygame.Rect(0, 0, 16, 16))))
+            return sprite
+
+        static = measure(static_tile, count)
+        solid = measure(solid_tile, count)
+        print(f"{name:<16}{static:>14.0f} B{solid:>14.0f} B")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 65536)
@@ -2,33 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
 import pygame
 from typing_extensions import override
 
+from apu.core.masks import MASK_CACHE
+from apu.events import Channel, Collision
+
 if TYPE_CHECKING:
     from apu.objects.components import SolidBodyComponent
 
 # from APU.scene import Scene
 
-# COLLISION_EVENT = pygame.USEREVENT + 1
-
-
-# def check_collision(sprite1, sprite2):
-#     # Controllo delle collisioni tra le hitbox dei due sprite
-#     for hitbox1_name, hitbox1 in sprite1.hitboxes.items():
-#         for hitbox2_name, hitbox2 in sprite2.hitboxes.items():
-#             if hitbox1.colliderect(hitbox2):
-#                 # Collisione rilevata, emetti un evento COLLISION
-#                 pygame.event.post(pygame.event.Event(COLLISION_EVENT, {
-#                     'sprite1': sprite1,
-#                     'sprite2': sprite2,
-#                     'hitbox1_name': hitbox1_name,
-#                     'hitbox2_name': hitbox2_name
-#                 }))
-
-
 # class CollisionDetector:
 #     def __init__(self, scene: Scene):
 #         self.threads = None
@@ -67,25 +54,104 @@ if TYPE_CHECKING:
 
 
 class HitBox:
-    def __init__(self, rect: pygame.rect.Rect, visible: bool = False) -> None:
+    __slots__ = (
+        "_body",
+        "_rect",
+        "_world",
+        "_world_version",
+        "border_color",
+        "border_width",
+        "precise",
+        "visible",
+    )
+
+    def __init__(
+        self, rect: pygame.rect.Rect, visible: bool = False, precise: bool = False
+    ) -> None:
+        """Constructs a hitbox.
+
+        Args:
+            rect (pygame.Rect): hitbox rect, relative to the entity position.
+            visible (bool, optional): draw the hitbox border. Defaults to False.
+            precise (bool, optional): once the rects overlap, collide only with the opaque
+                pixels of the entity image inside the rect. Defaults to False.
+        """
         self._body: SolidBodyComponent | None = None
-        self.rect = rect
+        self.precise = precise
+        self._rect = rect
+        self._world: pygame.Rect | None = None
+        self._world_version = -1
         self.visible = visible
         self.border_width = 1
         self.border_color = (255, 0, 0)
 
+    @property
+    def rect(self) -> pygame.Rect:
+        """Returns the hitbox rect, relative to the entity position.
+
+        Call invalidate() after changing it in place, or assign a new rect.
+        """
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: pygame.Rect) -> None:
+        self._rect = value
+        self._world_version = -1
+
+    def invalidate(self) -> None:
+        """Discards the cached world rect, recomputed on the next access."""
+        self._world_version = -1
+
+    @property
+    def world_rect(self) -> pygame.Rect:
+        """Returns the hitbox rect in world space, based on the entity position.
+
+        The rect is cached and updated in place only when the entity position version
+        changed, so it must not be modified nor kept across frames by the caller. Without an
+        entity the relative rect is returned.
+        """
+        body = self._body
+        entity = body.entity if body is not None else None
+        if entity is None:
+            return self._rect
+        version = entity.position_version
+        world = self._world
+        if world is None or version != self._world_version:
+            rect = self._rect
+            x, y = entity.position
+            if world is None:
+                world = self._world = rect.move(x, y)
+            else:
+                world.update(rect.x + x, rect.y + y, rect.w, rect.h)
+            self._world_version = version
+        return world
+
+    def world_mask(self) -> tuple[pygame.mask.Mask, int, int]:
+        """Returns the collision mask of the hitbox and its world space position.
+
+        Precise hitboxes use the cached mask of the current entity image, clipped to the
+        rect, so every animation frame (and flipped variant) is converted once. The others,
+        or precise ones whose entity has no image (or an empty one), use a mask filling the
+        rect. A precise rect outside the image gets an empty mask.
+        """
+        world = self.world_rect
+        body = self._body
+        entity = body.entity if body is not None else None
+        image = entity.image if entity is not None else None
+        if self.precise and image is not None and image.get_width() and image.get_height():
+            rect = self._rect
+            mask = MASK_CACHE.mask(image, rect)
+            # The mask area starts at the rect, unless clipped by the image bounds.
+            return mask, world.x + max(-rect.x, 0), world.y + max(-rect.y, 0)
+        return MASK_CACHE.filled(world.size), world.x, world.y
+
     def absolute_rect(self, offset: tuple[int, int]) -> pygame.Rect:
         """Returns an offsetted rect object, based on the entity position."""
-        return self.rect.move(offset)
+        return self._rect.move(offset)
 
     def draw(self, surface: pygame.surface.Surface) -> None:
         if self.visible and self._body is not None and self._body.entity is not None:
-            pygame.draw.rect(
-                surface,
-                self.border_color,
-                self.absolute_rect(self._body.entity.position),
-                width=self.border_width,
-            )
+            pygame.draw.rect(surface, self.border_color, self.world_rect, width=self.border_width)
 
     @override
     def __str__(self) -> str:
@@ -95,3 +161,349 @@ class HitBox:
         Border width: {self.border_width} 
         Border color: {self.border_color} 
         """
+
+
+def hitboxes_overlap(hitbox_a: HitBox, hitbox_b: HitBox) -> bool:
+    """Returns True if two hitboxes overlap, testing their masks when either is precise.
+
+    The mask test runs only after the rects overlap, as the narrow phase of the rect test.
+    """
+    if not hitbox_a.world_rect.colliderect(hitbox_b.world_rect):
+        return False
+    if not (hitbox_a.precise or hitbox_b.precise):
+        return True
+    mask_a, x_a, y_a = hitbox_a.world_mask()
+    mask_b, x_b, y_b = hitbox_b.world_mask()
+    return mask_a.overlap(mask_b, (x_b - x_a, y_b - y_a)) is not None
+
+
+def check_collision(
+    body_a: SolidBodyComponent, body_b: SolidBodyComponent, channel: Channel[Collision]
+) -> int:
+    """Posts a Collision event to the given channel for every pair of overlapping hitboxes.
+
+    Args:
+        body_a (SolidBodyComponent): first body.
+        body_b (SolidBodyComponent): second body.
+        channel (Channel[Collision]): channel the events are posted to, delivered on flush.
+
+    Returns:
+        int: the number of posted events.
+    """
+    pairs = body_a.collides_with(body_b)
+    for hitbox_a, hitbox_b in pairs:
+        channel.post(Collision(body_a, body_b, hitbox_a, hitbox_b))
+    return len(pairs)
+
+
+def batch_collide(
+    body: SolidBodyComponent, candidates: Iterable[SolidBodyComponent]
+) -> list[Collision]:
+    """Narrow phase of a body against many candidate bodies at once.
+
+    The world rects of every candidate hitbox are flattened into a single list, tested by
+    Rect.collidelistall() for each hitbox of the body, and the hit indices mapped back to
+    their (body, hitbox) owners, so the inner loop over the candidates runs in C.
+
+    Args:
+        body (SolidBodyComponent): tested body.
+        candidates (Iterable[SolidBodyComponent]): bodies tested against it. The body itself
+            and bodies without an entity are skipped.
+
+    Returns:
+        list[Collision]: a Collision for every pair of overlapping hitboxes, with the given
+            body as body_a.
+    """
+    if body.entity is None:
+        return []
+    rects: list[pygame.Rect] = []
+    owners: list[tuple[SolidBodyComponent, HitBox]] = []
+    for other in candidates:
+        if other is body or other.entity is None:
+            continue
+        for hitbox in other.hitboxes.values():
+            rects.append(hitbox.world_rect)
+            owners.append((other, hitbox))
+
+    collisions: list[Collision] = []
+    if not rects:
+        return collisions
+    for hitbox_a in body.hitboxes.values():
+        for index in hitbox_a.world_rect.collidelistall(rects):
+            other, hitbox_b = owners[index]
+            if (hitbox_a.precise or hitbox_b.precise) and not hitboxes_overlap(hitbox_a, hitbox_b):
+                continue
+            collisions.append(Collision(body, other, hitbox_a, hitbox_b))
+    return collisions
+
+
+Cell = tuple[int, int]
+
+
+def sweep_rect(
+    rect: pygame.FRect | pygame.Rect, dx: float, dy: float, obstacle: pygame.Rect
+) -> tuple[float, int, int] | None:
+    """Swept AABB test of a rect moving by (dx, dy) against a still obstacle.
+
+    Args:
+        rect (pygame.FRect): moving rect, at its start position.
+        dx (float): horizontal displacement.
+        dy (float): vertical displacement.
+        obstacle (pygame.Rect): still rect.
+
+    Returns:
+        tuple[float, int, int] | None: the time of impact, as a fraction of the displacement
+            in [0, 1), and the (x, y) normal of the hit face; None if the rect does not hit
+            the obstacle, or already overlaps it.
+    """
+    if dx > 0:
+        x_entry, x_exit = (obstacle.left - rect.right) / dx, (obstacle.right - rect.left) / dx
+    elif dx < 0:
+        x_entry, x_exit = (obstacle.right - rect.left) / dx, (obstacle.left - rect.right) / dx
+    elif rect.right <= obstacle.left or rect.left >= obstacle.right:
+        return None
+    else:
+        x_entry, x_exit = float("-inf"), float("inf")
+
+    if dy > 0:
+        y_entry, y_exit = (obstacle.top - rect.bottom) / dy, (obstacle.bottom - rect.top) / dy
+    elif dy < 0:
+        y_entry, y_exit = (obstacle.bottom - rect.top) / dy, (obstacle.top - rect.bottom) / dy
+    elif rect.bottom <= obstacle.top or rect.top >= obstacle.bottom:
+        return None
+    else:
+        y_entry, y_exit = float("-inf"), float("inf")
+
+    entry = max(x_entry, y_entry)
+    if entry < 0 or entry >= 1 or entry >= min(x_exit, y_exit):
+        return None
+    if x_entry > y_entry:
+        return entry, -1 if dx > 0 else 1, 0
+    return entry, 0, -1 if dy > 0 else 1
+
+
+class CollisionWorld:
+    """Broad phase collision world
+
+    Registers solid bodies into a spatial hash of square cells, by the bounding box of their
+    hitboxes. Static bodies (e.g. map tiles) are hashed once; dynamic ones are rehashed by
+    update() only when their entity moved. Candidate pairs are the bodies sharing a cell with
+    a dynamic body, so the cost scales with the moving bodies and the local density instead
+    of the square of the number of bodies.
+    """
+
+    def __init__(self, cell_size: int = 64) -> None:
+        """Constructs an empty collision world.
+
+        Args:
+            cell_size (int, optional): size of the hash cells, in pixels. Best set to about the
+                size of the largest moving bodies. Defaults to 64.
+
+        Raises:
+            ValueError: if cell_size is lower than 1.
+        """
+        if cell_size < 1:
+            raise ValueError(f"Cell size must be a positive integer, got {cell_size}")
+        self.cell_size = cell_size
+        self._cells: dict[Cell, list[SolidBodyComponent]] = {}
+        self._bodies: dict[int, SolidBodyComponent] = {}
+        self._body_cells: dict[int, tuple[Cell, ...]] = {}
+        self._versions: dict[int, int] = {}
+        self._dynamic: dict[int, SolidBodyComponent] = {}
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def __contains__(self, body: object) -> bool:
+        return id(body) in self._bodies
+
+    @staticmethod
+    def bounds(body: SolidBodyComponent) -> pygame.Rect | None:
+        """Returns the world space bounding box of the body hitboxes, if any."""
+        if body.entity is None or not body.hitboxes:
+            return None
+        rects = [hitbox.world_rect for hitbox in body.hitboxes.values()]
+        return rects[0].unionall(rects[1:])
+
+    def _cells_of(self, rect: pygame.Rect) -> tuple[Cell, ...]:
+        size = self.cell_size
+        return tuple(
+            (x, y)
+            for x in range(rect.left // size, (rect.right - 1) // size + 1)
+            for y in range(rect.top // size, (rect.bottom - 1) // size + 1)
+        )
+
+    def _hash(self, body: SolidBodyComponent) -> None:
+        key = id(body)
+        bounds = self.bounds(body)
+        cells = self._cells_of(bounds) if bounds is not None and bounds.size != (0, 0) else ()
+        for cell in cells:
+            self._cells.setdefault(cell, []).append(body)
+        self._body_cells[key] = cells
+        self._versions[key] = body.entity.position_version if body.entity is not None else -1
+
+    def _unhash(self, body: SolidBodyComponent) -> None:
+        for cell in self._body_cells.pop(id(body), ()):
+            bodies = self._cells[cell]
+            bodies.remove(body)
+            if not bodies:
+                del self._cells[cell]
+
+    def add(self, body: SolidBodyComponent, static: bool = False) -> None:
+        """Registers a body, already added to an entity.
+
+        Args:
+            body (SolidBodyComponent): body to register.
+            static (bool, optional): True for bodies that never move, which are hashed only
+                once. Defaults to False.
+
+        Raises:
+            ValueError: if the body has no entity or belongs to another world.
+        """
+        if body.entity is None:
+            raise ValueError("Only bodies added to an entity can be registered")
+        if body._world is not None and body._world is not self:
+            raise ValueError("This body is registered to another collision world")
+        if id(body) in self._bodies:
+            self.remove(body)
+        body._world = self
+        self._bodies[id(body)] = body
+        if not static:
+            self._dynamic[id(body)] = body
+        self._hash(body)
+
+    def remove(self, body: SolidBodyComponent) -> None:
+        """Unregisters a body."""
+        if self._bodies.pop(id(body), None) is None:
+            return
+        body._world = None
+        self._dynamic.pop(id(body), None)
+        self._versions.pop(id(body), None)
+        self._unhash(body)
+
+    def refresh(self, body: SolidBodyComponent) -> None:
+        """Rehashes a registered body, e.g. after its hitboxes changed or a static one moved."""
+        if id(body) not in self._bodies:
+            return
+        self._unhash(body)
+        self._hash(body)
+
+    def update(self) -> list[SolidBodyComponent]:
+        """Rehashes the dynamic bodies whose entity moved since the previous update.
+
+        Returns:
+            list[SolidBodyComponent]: the moved bodies.
+        """
+        moved = []
+        versions = self._versions
+        for key, body in self._dynamic.items():
+            entity = body.entity
+            if entity is not None and entity.position_version != versions[key]:
+                self._unhash(body)
+                self._hash(body)
+                moved.append(body)
+        return moved
+
+    def query(self, rect: pygame.Rect) -> list[SolidBodyComponent]:
+        """Returns the registered bodies whose bounding box overlaps the given rect."""
+        found: dict[int, SolidBodyComponent] = {}
+        for cell in self._cells_of(rect):
+            for body in self._cells.get(cell, ()):
+                if id(body) not in found:
+                    bounds = self.bounds(body)
+                    if bounds is not None and bounds.colliderect(rect):
+                        found[id(body)] = body
+        return list(found.values())
+
+    def _candidates(self) -> Iterator[tuple[SolidBodyComponent, list[SolidBodyComponent]]]:
+        # Each dynamic body with the bodies sharing one of its cells, once per pair.
+        seen: set[tuple[int, int]] = set()
+        cells = self._cells
+        for key, body in self._dynamic.items():
+            candidates = []
+            for cell in self._body_cells[key]:
+                for other in cells[cell]:
+                    other_key = id(other)
+                    if other_key == key:
+                        continue
+                    pair_key = (key, other_key) if key < other_key else (other_key, key)
+                    if pair_key not in seen:
+                        seen.add(pair_key)
+                        candidates.append(other)
+            yield body, candidates
+
+    def pairs(self) -> list[tuple[SolidBodyComponent, SolidBodyComponent]]:
+        """Returns the candidate pairs for the narrow phase: each dynamic body paired with
+        every other body sharing one of its cells, once per pair.
+        """
+        return [(body, other) for body, candidates in self._candidates() for other in candidates]
+
+    def sweep(self, body: SolidBodyComponent, dx: float, dy: float) -> tuple[float, float]:
+        """Resolves the displacement of a body against the other registered bodies.
+
+        The bounding box of the body hitboxes is swept against the hitboxes of the bodies
+        near its path: it stops at the earliest time of impact, then slides along the hit
+        face with the rest of the displacement. Bodies already overlapping the moving one do
+        not block it, so overlapping bodies can separate. The bodies that moved since the
+        previous update are rehashed first, so moving obstacles are found where they are.
+
+        Args:
+            body (SolidBodyComponent): moving body, added to an entity.
+            dx (float): horizontal displacement.
+            dy (float): vertical displacement.
+
+        Returns:
+            tuple[float, float]: the displacement the body can actually make.
+        """
+        bounds = self.bounds(body)
+        if bounds is None or not (dx or dy):
+            return dx, dy
+
+        self.update()
+        rect = pygame.FRect(bounds)
+        moved_x = moved_y = 0.0
+        # The first pass stops at the first hit, the second slides along the hit face.
+        for _ in range(2):
+            path = rect.union(rect.move(dx, dy)).inflate(2, 2)
+            earliest: tuple[float, int, int] | None = None
+            for other in self.query(pygame.Rect(path)):
+                if other is body or other.entity is None:
+                    continue
+                for hitbox in other.hitboxes.values():
+                    hit = sweep_rect(rect, dx, dy, hitbox.world_rect)
+                    if hit is not None and (earliest is None or hit[0] < earliest[0]):
+                        earliest = hit
+
+            if earliest is None:
+                return moved_x + dx, moved_y + dy
+
+            time, normal_x, normal_y = earliest
+            moved_x += dx * time
+            moved_y += dy * time
+            rect.move_ip(dx * time, dy * time)
+            remaining = 1 - time
+            dx = 0.0 if normal_x else dx * remaining
+            dy = 0.0 if normal_y else dy * remaining
+            if not (dx or dy):
+                break
+        return moved_x, moved_y
+
+    def collisions(self, channel: Channel[Collision] | None = None) -> list[Collision]:
+        """Runs the broad phase update and the narrow phase on the candidate pairs.
+
+        Args:
+            channel (Channel[Collision], optional): channel the collisions are also posted
+                to. Defaults to None.
+
+        Returns:
+            list[Collision]: a Collision for every pair of overlapping hitboxes.
+        """
+        self.update()
+        collisions: list[Collision] = []
+        for body, candidates in self._candidates():
+            if candidates:
+                collisions.extend(batch_collide(body, candidates))
+        if channel is not None:
+            for collision in collisions:
+                channel.post(collision)
+        return collisions
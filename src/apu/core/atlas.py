@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pygame
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from apu.core.spritesheet import AnimationSequence, SpriteSheet
+    from apu.font import Font
+
+
+class AtlasRegion:
+    """Atlas region
+
+    Lightweight handle to a packed image: the index of the atlas page holding it and its area
+    inside that page.
+    """
+
+    def __init__(self, page: int, rect: pygame.Rect) -> None:
+        self.page = page
+        self.rect = rect
+        self._surface: pygame.Surface | None = None
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Returns a tuple of int values (width, height)."""
+        return self.rect.size
+
+    @override
+    def __repr__(self) -> str:
+        return f"AtlasRegion(page={self.page}, rect={tuple(self.rect)})"
+
+
+class TextureAtlas:
+    """Texture atlas
+
+    Holds a few large page surfaces and the table of named regions packed into them, providing
+    batched drawing through source rects and (de)serialization of the packed result.
+    """
+
+    def __init__(self, pages: list[pygame.Surface], regions: dict[str, AtlasRegion]) -> None:
+        """Constructs a texture atlas from already packed pages.
+
+        Args:
+            pages (list[pygame.Surface]): atlas page surfaces.
+            regions (dict[str, AtlasRegion]): region table, indexed by image name.
+        """
+        self.pages = pages
+        self.regions = regions
+
+    def __getitem__(self, name: str) -> AtlasRegion:
+        return self.regions[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.regions
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def surface(self, name: str) -> pygame.Surface:
+        """Returns a surface sharing pixels with the atlas page for the given region.
+
+        Args:
+            name (str): region name.
+
+        Returns:
+            pygame.Surface: a subsurface of the page holding the region.
+        """
+        region = self.regions[name]
+        if region._surface is None:
+            region._surface = self.pages[region.page].subsurface(region.rect)
+        return region._surface
+
+    def blit(
+        self, target: pygame.Surface, name: str, dest: tuple[int, int], flags: int = 0
+    ) -> None:
+        """Draws a single region on the target surface.
+
+        Args:
+            target (pygame.Surface): surface to draw to.
+            name (str): region name.
+            dest (tuple[int, int]): (x, y) position on the target surface.
+            flags (int, optional): pygame special_flags. Defaults to 0.
+        """
+        region = self.regions[name]
+        target.blit(self.pages[region.page], dest, region.rect, special_flags=flags)
+
+    def blits(
+        self, target: pygame.Surface, items: Iterable[tuple[str, tuple[int, int]]], flags: int = 0
+    ) -> None:
+        """Draws many regions with a single blits() call, using page surfaces and source rects.
+
+        Args:
+            target (pygame.Surface): surface to draw to.
+            items (Iterable[tuple[str, tuple[int, int]]]): (region name, position) pairs.
+            flags (int, optional): pygame special_flags. Defaults to 0.
+        """
+        pages = self.pages
+        regions = self.regions
+        target.blits(
+            [
+                (pages[region.page], dest, region.rect, flags)
+                for region, dest in ((regions[name], dest) for name, dest in items)
+            ],
+            doreturn=False,
+        )
+
+    def fblits(
+        self, target: pygame.Surface, items: Iterable[tuple[str, tuple[int, int]]], flags: int = 0
+    ) -> None:
+        """Draws many regions with a single fblits() call, using cached page subsurfaces.
+
+        Args:
+            target (pygame.Surface): surface to draw to.
+            items (Iterable[tuple[str, tuple[int, int]]]): (region name, position) pairs.
+            flags (int, optional): pygame special_flags. Defaults to 0.
+        """
+        surface = self.surface
+        target.fblits([(surface(name), dest) for name, dest in items], flags)
+
+    def save(self, path: str) -> None:
+        """Saves the atlas as a JSON region table and one PNG image per page.
+
+        Page images are written next to the table, named after it (<name>_<page>.png).
+
+        Args:
+            path (str): region table path.
+        """
+        table_path = Path(path)
+        page_names = []
+        for index, page in enumerate(self.pages):
+            page_name = f"{table_path.stem}_{index}.png"
+            pygame.image.save(page, str(table_path.with_name(page_name)))
+            page_names.append(page_name)
+
+        data = {
+            "pages": page_names,
+            "regions": {
+                name: [region.page, *region.rect] for name, region in self.regions.items()
+            },
+        }
+        with table_path.open("w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str) -> TextureAtlas:
+        """Loads an atlas previously written with save().
+
+        Args:
+            path (str): region table path.
+
+        Raises:
+            FileNotFoundError: if the given region table does not exist.
+
+        Returns:
+            TextureAtlas: the loaded atlas.
+        """
+        table_path = Path(path)
+        if not table_path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        with table_path.open() as f:
+            data = json.load(f)
+
+        pages = []
+        for page_name in data["pages"]:
+            page = pygame.image.load(str(table_path.with_name(page_name)))
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            pages.append(page)
+
+        regions = {
+            name: AtlasRegion(values[0], pygame.Rect(values[1:]))
+            for name, values in data["regions"].items()
+        }
+        return cls(pages, regions)
+
+
+class AtlasBuilder:
+    """Texture atlas builder
+
+    Collects images from sprite sheets, animation sequences and fonts and bin-packs them into
+    as few atlas pages as possible, using a shelf packer over images sorted by height.
+    """
+
+    def __init__(self, page_size: tuple[int, int] = (1024, 1024), padding: int = 1) -> None:
+        """Constructs an empty atlas builder.
+
+        Args:
+            page_size (tuple[int, int], optional): maximum size of each atlas page.
+                Defaults to (1024, 1024).
+            padding (int, optional): pixels of empty space around each packed image.
+                Defaults to 1.
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self._images: dict[str, pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def add(self, name: str, image: pygame.Surface) -> None:
+        """Adds a single image to the atlas.
+
+        Args:
+            name (str): region name, used to retrieve the image from the built atlas.
+            image (pygame.Surface): image to pack.
+
+        Raises:
+            KeyError: if an image with the same name has already been added.
+        """
+        if name in self._images:
+            raise KeyError(f"An image named {name} has already been added to the atlas")
+        self._images[name] = image
+
+    def add_frames(self, prefix: str, frames: Iterable[pygame.Surface]) -> list[str]:
+        """Adds a list of images, named <prefix>/<index>.
+
+        Args:
+            prefix (str): common prefix of the region names.
+            frames (Iterable[pygame.Surface]): images to pack.
+
+        Returns:
+            list[str]: the region names, in the same order as the given frames.
+        """
+        names = []
+        for index, frame in enumerate(frames):
+            name = f"{prefix}/{index}"
+            self.add(name, frame)
+            names.append(name)
+        return names
+
+    def add_sheet(
+        self,
+        prefix: str,
+        sheet: SpriteSheet,
+        rects: Iterable[pygame.Rect],
+        color_key: pygame.Color | None = None,
+    ) -> list[str]:
+        """Adds the given areas of a sprite sheet.
+
+        Args:
+            prefix (str): common prefix of the region names.
+            sheet (SpriteSheet): sprite sheet to extract the images from.
+            rects (Iterable[pygame.Rect]): areas of the wanted images.
+            color_key (pygame.Color, optional): background color, transparency is applied.
+                Defaults to None.
+
+        Returns:
+            list[str]: the region names, in the same order as the given rects.
+        """
+        return self.add_frames(prefix, sheet.images_at(list(rects), color_key))
+
+    def add_sequence(self, prefix: str, sequence: AnimationSequence) -> list[str]:
+        """Adds every frame of an animation sequence.
+
+        Args:
+            prefix (str): common prefix of the region names.
+            sequence (AnimationSequence): sequence whose frames are packed.
+
+        Returns:
+            list[str]: the region names, in frame order.
+        """
+        return self.add_frames(prefix, sequence.frames)
+
+    def add_font(self, prefix: str, font: Font) -> list[str]:
+        """Adds every character of a font, named <prefix>/<character>.
+
+        Args:
+            prefix (str): common prefix of the region names.
+            font (Font): font whose characters are packed.
+
+        Returns:
+            list[str]: the region names.
+        """
+        names = []
+        for char, image in font.characters.items():
+            name = f"{prefix}/{char}"
+            self.add(name, image)
+            names.append(name)
+        return names
+
+    def build(self) -> TextureAtlas:
+        """Packs every added image into atlas pages.
+
+        Images that are the same surface object are packed once and share their region.
+
+        Raises:
+            ValueError: if an image does not fit in an empty page.
+
+        Returns:
+            TextureAtlas: the packed atlas.
+        """
+        page_width, page_height = self.page_size
+        padding = self.padding
+
+        unique: dict[int, pygame.Surface] = {}
+        for image in self._images.values():
+            unique.setdefault(id(image), image)
+
+        ordered = sorted(
+            unique.values(),
+            key=lambda image: (image.get_height(), image.get_width()),
+            reverse=True,
+        )
+
+        placements: dict[int, AtlasRegion] = {}
+        page_extents: list[tuple[int, int]] = []
+        page = -1
+        shelf_x = shelf_y = shelf_height = 0
+        for image in ordered:
+            width = image.get_width() + padding * 2
+            height = image.get_height() + padding * 2
+            if width > page_width or height > page_height:
+                raise ValueError(
+                    f"Image of size {image.get_size()} does not fit in a {self.page_size} page"
+                )
+
+            if page >= 0 and shelf_x + width > page_width:
+                shelf_x = 0
+                shelf_y += shelf_height
+                shelf_height = height
+            if page < 0 or shelf_y + height > page_height:
+                page += 1
+                page_extents.append((0, 0))
+                shelf_x = shelf_y = 0
+                shelf_height = height
+
+            placements[id(image)] = AtlasRegion(
+                page, pygame.Rect(shelf_x + padding, shelf_y + padding, *image.get_size())
+            )
+            used_width, used_height = page_extents[page]
+            page_extents[page] = (
+                max(used_width, shelf_x + width),
+                max(used_height, shelf_y + height),
+            )
+            shelf_x += width
+
+        pages = [pygame.Surface(extent, pygame.SRCALPHA) for extent in page_extents]
+        for image in ordered:
+            region = placements[id(image)]
+            pages[region.page].blit(image, region.rect)
+
+        regions = {
+            name: AtlasRegion(placements[id(image)].page, placements[id(image)].rect.copy())
+            for name, image in self._images.items()
+        }
+        return TextureAtlas(pages, regions)
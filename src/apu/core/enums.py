@@ -1,4 +1,4 @@
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 
 NEIGHBOUR_MATRIX = [(-1, 0), (-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1)]
 
@@ -8,3 +8,15 @@ class Directions(IntEnum):
     LEFT = 1
     DOWN = 2
     RIGHT = 3
+
+
+class TileKind(IntFlag):
+    """Classification of map tiles, set by the map loaders.
+
+    STATIC tiles never change and need neither updates nor individual drawing, ANIMATED and
+    SOLID ones are flags that can be combined.
+    """
+
+    STATIC = 0
+    ANIMATED = 1
+    SOLID = 2
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import partial
+import weakref
+
+import pygame
+
+from apu.core.transform import TRANSFORM_CACHE, TransformCache
+
+MaskKey = tuple[int, bool, bool, int, int, int, int]
+
+
+class MaskCache:
+    """Collision mask cache
+
+    Computes the pixel mask of an image (or of an area of it) once, keeping it alongside the
+    source surface, so that animation frames and their flipped variants are converted to masks
+    once per asset instead of once per frame. The least recently used masks are discarded when
+    the memory budget is exceeded. Sources are referenced weakly, so the masks of a collected
+    surface are dropped (on the next call) instead of keeping the source alive.
+    """
+
+    def __init__(
+        self,
+        budget: int = 16 * 1024 * 1024,
+        threshold: int = 127,
+        transforms: TransformCache | None = None,
+    ) -> None:
+        """Constructs an empty mask cache.
+
+        Args:
+            budget (int, optional): maximum bytes of mask data held by cached masks.
+                Defaults to 16 MiB.
+            threshold (int, optional): minimum alpha of the pixels set in the masks.
+                Defaults to 127.
+            transforms (TransformCache, optional): cache providing the flipped variants.
+                Defaults to the shared one.
+        """
+        self.budget = budget
+        self.threshold = threshold
+        self.transforms = transforms if transforms is not None else TRANSFORM_CACHE
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._masks: OrderedDict[MaskKey, tuple[weakref.ref[pygame.Surface], pygame.mask.Mask]] = (
+            OrderedDict()
+        )
+        self._expired: list[MaskKey] = []
+        self._filled: dict[tuple[int, int], pygame.mask.Mask] = {}
+
+    def __len__(self) -> int:
+        self._purge()
+        return len(self._masks)
+
+    def clear(self) -> None:
+        """Discards every cached mask."""
+        self._masks.clear()
+        self._expired.clear()
+        self._filled.clear()
+        self.memory = 0
+
+    def _expire(self, key: MaskKey, _: weakref.ref[pygame.Surface]) -> None:
+        self._expired.append(key)
+
+    def _purge(self) -> None:
+        # Keys are queued by the weakref callbacks, which may run at any allocation.
+        while self._expired:
+            key = self._expired.pop()
+            entry = self._masks.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._masks[key]
+                self.memory -= self._mask_bytes(entry[1])
+
+    def mask(
+        self,
+        surface: pygame.Surface,
+        area: pygame.Rect | None = None,
+        flip_x: bool = False,
+        flip_y: bool = False,
+    ) -> pygame.mask.Mask:
+        """Returns the mask of the opaque pixels of an image, computing it only once.
+
+        Args:
+            surface (pygame.Surface): source image, e.g. an animation frame.
+            area (pygame.Rect, optional): area of the (flipped) image covered by the mask,
+                clipped to the image bounds: an area outside of them gets an empty mask.
+                Defaults to None (the whole image).
+            flip_x (bool, optional): mask of the horizontally mirrored image.
+                Defaults to False.
+            flip_y (bool, optional): mask of the vertically mirrored image. Defaults to False.
+
+        Returns:
+            pygame.mask.Mask: the cached mask, which must not be modified.
+        """
+        bounds = surface.get_rect()
+        area = bounds if area is None else area.clip(bounds)
+        if not (area.w and area.h):
+            return self.filled((0, 0))
+        self._purge()
+        key: MaskKey = (id(surface), flip_x, flip_y, area.x, area.y, area.w, area.h)
+        entry = self._masks.get(key)
+        if entry is not None and entry[0]() is surface:
+            self._masks.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        image = self.transforms.variant(surface, flip_x, flip_y)
+        if area != bounds:
+            image = image.subsurface(area)
+        mask = pygame.mask.from_surface(image, self.threshold)
+
+        if entry is not None:
+            self.memory -= self._mask_bytes(entry[1])
+        # A collected source id can be reused, so entries check their source is still alive.
+        self._masks[key] = (
+            weakref.ref(surface, partial(self._expire, key)),
+            mask,
+        )
+        self.memory += self._mask_bytes(mask)
+        while self.memory > self.budget and len(self._masks) > 1:
+            _, (_, evicted) = self._masks.popitem(last=False)
+            self.memory -= self._mask_bytes(evicted)
+        return mask
+
+    def filled(self, size: tuple[int, int]) -> pygame.mask.Mask:
+        """Returns a mask with every bit set, shared by every caller asking for that size."""
+        mask = self._filled.get(size)
+        if mask is None:
+            mask = self._filled[size] = pygame.mask.Mask(size, fill=True)
+        return mask
+
+    @staticmethod
+    def _mask_bytes(mask: pygame.mask.Mask) -> int:
+        width, height = mask.get_size()
+        return (width + 7) // 8 * height
+
+
+MASK_CACHE = MaskCache()
@@ -1,24 +1,34 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import OrderedDict
 from copy import copy
 from pathlib import Path
 from time import perf_counter
 
 import pygame
 
+from apu.core.tools import ImageTools
+from apu.core.transform import TRANSFORM_CACHE, TransformCache
+
 
 class SpriteSheet:
     """Sprite sheet
 
     Represents a sprite sheet object, providing methods to access sprite images directly or extract
     multiple sprites simultaneously.
+
+    Extracted images are memoized by (rect, color key): asking twice for the same area returns
+    the very same surface, so callers must copy it before modifying its pixels.
     """
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, cache_size: int | None = None) -> None:
         """Constructs a sprite sheet object, loading an image from the given path.
 
         Args:
             path (str): sprite sheet path.
+            cache_size (int, optional): maximum number of extracted images kept in memory, the
+                least recently used ones are discarded first. Defaults to None (unbounded).
 
         Raises:
             FileNotFoundError: if the given sprite sheet file does not exist.
@@ -27,24 +37,54 @@ class SpriteSheet:
             raise FileNotFoundError(f"File not found: {path}")
 
         self.sheet = pygame.image.load(path).convert()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[
+            tuple[tuple[int, int, int, int], tuple[int, ...] | None], pygame.Surface
+        ] = OrderedDict()
+
+    @property
+    def cached_images(self) -> int:
+        """Returns the number of extracted images currently memoized."""
+        return len(self._cache)
+
+    def clear_cache(self) -> None:
+        """Discards every memoized image."""
+        self._cache.clear()
 
     def image_at(self, rect: pygame.Rect, color_key: pygame.Color | None = None) -> pygame.Surface:
         """Returns a specific sprite surface from the sprite sheet, given its rect area.
 
+        The surface is memoized and shared: every call for the same rect and color key returns
+        the same object, so it must not be modified (copy it first to draw on it).
+
         Args:
             rect (pygame.Rect): rect area of the wanted image.
-            color_key (pygame.Color, optional): background color, transparency is applied.
-                Defaults to None.
+            color_key (pygame.Color, optional): background color, transparency is applied
+                (with RLE acceleration) only if the image contains it. Defaults to None.
 
         Returns:
-            pygame.Surface: a (pygame) surface.
+            pygame.Surface: the shared (pygame) surface, which must not be modified.
         """
         rect = pygame.Rect(rect)
+        key = (
+            (rect.x, rect.y, rect.w, rect.h),
+            tuple(pygame.Color(color_key)) if color_key is not None else None,
+        )
+
+        image = self._cache.get(key)
+        if image is not None:
+            self._cache.move_to_end(key)
+            return image
+
         image = pygame.Surface(rect.size).convert()
         image.blit(self.sheet, (0, 0), rect)
 
         if color_key is not None:
-            image.set_colorkey(color_key, pygame.RLEACCEL)
+            image = ImageTools.optimize(image, color_key)[0]
+
+        self._cache[key] = image
+        if self.cache_size is not None and len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
         return image
 
     def images_at(
@@ -58,7 +98,7 @@ class SpriteSheet:
                 Defaults to None.
 
         Returns:
-            list[pygame.Surface]: a list of (pygame) surfaces.
+            list[pygame.Surface]: a list of shared (pygame) surfaces, which must not be modified.
         """
         return [self.image_at(rect, color_key) for rect in rects]
 
@@ -75,7 +115,7 @@ class SpriteSheet:
                 Defaults to None.
 
         Returns:
-            list[pygame.Surface]: a list of (pygame) surfaces.
+            list[pygame.Surface]: a list of shared (pygame) surfaces, which must not be modified.
         """
         rects = [
             pygame.Rect(rect[0] + rect[2] * x, rect[1], rect[2], rect[3])
@@ -89,10 +129,20 @@ class AnimationSequence:
 
     This class represents a sprite animation sequence and provides
     an iterator (iter() and next() methods), and a __add__() method for joining strips.
+
+    Besides the self-timed iterator, a sequence can be driven by an externally supplied clock
+    through advance() and seek(), which compute the shown frame directly from the elapsed time
+    and skip frames when more than one frame duration has passed.
+
+    Frames may share a single duration or each have their own: durations are kept as a
+    cumulative timeline, so the frame shown at any time is found with a binary search.
     """
 
     def __init__(
-        self, frames: list[pygame.surface.Surface], loop: bool = False, frame_duration: int = 0
+        self,
+        frames: list[pygame.surface.Surface],
+        loop: bool = False,
+        frame_duration: int | list[int] = 0,
     ) -> None:
         """Constructs a SpriteStripAnimation
 
@@ -101,27 +151,204 @@ class AnimationSequence:
             loop: when True, next() method will loop. If False, raises StopIteration
                 when the animation ends.
             frame_duration: ms of duration, same image will be returned before advancing
-                to the next one.
+                to the next one. A list gives the duration of each frame.
+
+        Raises:
+            ValueError: if a list of durations does not match the number of frames.
         """
         self.frames = frames
         self.loop = loop
-        self.frame_duration: int = frame_duration
         self.running = True
 
+        self.__duration: int = 0
+        self.__durations: list[int] | None = None
+        self.__timeline: list[int] = []
+        self.frame_duration = frame_duration
+
         self.__current_frame: int = 0
         self.__start_time: float = 0.0
+        self.__elapsed: float = 0.0
+
+    @property
+    def frame_duration(self) -> int:
+        """Returns the ms of duration of each frame, the mean one if frames have their own."""
+        if self.__durations is None:
+            return self.__duration
+        return sum(self.__durations) // len(self.__durations) if self.__durations else 0
+
+    @frame_duration.setter
+    def frame_duration(self, duration: int | list[int]) -> None:
+        if isinstance(duration, list):
+            if len(duration) != len(self.frames):
+                raise ValueError(
+                    f"Expected {len(self.frames)} frame durations, got {len(duration)}"
+                )
+            self.__durations = list(duration)
+        else:
+            self.__duration = duration
+            self.__durations = None
+        self._rebuild_timeline()
+
+    @property
+    def frame_durations(self) -> list[int]:
+        """Returns the ms of duration of every frame."""
+        if self.__durations is None:
+            return [self.__duration] * len(self.frames)
+        self._fit_durations()
+        return list(self.__durations)
+
+    def _fit_durations(self) -> None:
+        """Fits the per-frame durations to the frames added or removed since they were set.
+
+        Added frames last the mean duration, the durations of removed frames are dropped.
+        """
+        durations = self.__durations
+        count = len(self.frames)
+        if durations is not None and len(durations) != count:
+            mean = self.frame_duration
+            self.__durations = durations[:count] + [mean] * (count - len(durations))
+
+    @property
+    def duration(self) -> int:
+        """Returns the ms needed to play every frame once."""
+        timeline = self._timeline()
+        return timeline[-1] if timeline else 0
+
+    @property
+    def timeline(self) -> list[int]:
+        """Returns the cumulative ms at which each frame ends."""
+        return self._timeline()
+
+    def _timeline(self) -> list[int]:
+        """Returns the cumulative end time of each frame, rebuilding it if the frames changed."""
+        if len(self.__timeline) != len(self.frames):
+            self._rebuild_timeline()
+        return self.__timeline
+
+    def _rebuild_timeline(self) -> None:
+        # Updated in place: an AnimationSystem keeps a reference to the list.
+        timeline = []
+        total = 0
+        for duration in self.frame_durations:
+            total += duration
+            timeline.append(total)
+        self.__timeline[:] = timeline
+
+    @property
+    def current_frame(self) -> int:
+        """Returns the index of the frame currently shown."""
+        return self.__current_frame
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the ms elapsed since the sequence start, as tracked by advance() and seek()."""
+        return self.__elapsed
+
+    @property
+    def finished(self) -> bool:
+        """Returns True if a non looping sequence has played all of its frames."""
+        return not self.loop and self.__elapsed >= self.duration
+
+    def frame_index(self, elapsed: float) -> int:
+        """Returns the index of the frame shown after the given time from the sequence start.
 
-    def mirror(self, flip_x: bool = True, flip_y: bool = False) -> AnimationSequence:
+        Args:
+            elapsed (float): ms elapsed since the sequence start.
+
+        Returns:
+            int: a frame index, wrapped around when looping or clamped to the last frame.
+        """
+        timeline = self._timeline()
+        if not timeline or timeline[-1] <= 0:
+            return 0
+
+        total = timeline[-1]
+        if elapsed >= total:
+            if not self.loop:
+                return len(timeline) - 1
+            elapsed %= total
+        return bisect_right(timeline, elapsed)
+
+    def advance(self, dt: float) -> pygame.Surface:
+        """Moves the sequence forward by the given time and returns the frame to show.
+
+        A single call may skip several frames, so the animation keeps its speed regardless of
+        the frame rate. Sequences with no frame duration advance by one frame per call instead.
+
+        Args:
+            dt (float): ms elapsed since the previous call.
+
+        Returns:
+            pygame.Surface: the current frame.
+        """
+        if self.running:
+            if self.duration <= 0:
+                next_frame = self.__current_frame + 1
+                if next_frame < len(self.frames):
+                    self.__current_frame = next_frame
+                elif self.loop:
+                    self.__current_frame = 0
+            else:
+                self.seek(self.__elapsed + dt)
+        return self.frames[self.__current_frame]
+
+    def seek(self, elapsed: float) -> pygame.Surface:
+        """Jumps to the frame shown after the given time from the sequence start.
+
+        Args:
+            elapsed (float): ms elapsed since the sequence start.
+
+        Returns:
+            pygame.Surface: the current frame.
+        """
+        total = self.duration
+        if self.loop and total > 0:
+            elapsed %= total
+        self.__elapsed = elapsed
+        self.__current_frame = self.frame_index(elapsed)
+        return self.frames[self.__current_frame]
+
+    def variant(
+        self,
+        flip_x: bool = False,
+        flip_y: bool = False,
+        rotation: int = 0,
+        scale: int = 1,
+        tint: pygame.Color | None = None,
+        cache: TransformCache | None = None,
+    ) -> AnimationSequence:
+        """Returns a copy of the sequence whose frames are transformed variants of these ones.
+
+        Variants come from a transform cache, so every sequence asking for the same variant of
+        the same frames shares a single set of surfaces.
+
+        Args:
+            flip_x (bool, optional): mirror horizontally. Defaults to False.
+            flip_y (bool, optional): mirror vertically. Defaults to False.
+            rotation (int, optional): degrees of rotation, a multiple of 90. Defaults to 0.
+            scale (int, optional): integer scale factor. Defaults to 1.
+            tint (pygame.Color, optional): color the pixels are multiplied by. Defaults to None.
+            cache (TransformCache, optional): cache to use. Defaults to the shared one.
+
+        Returns:
+            AnimationSequence: the transformed sequence.
+        """
+        cache = cache if cache is not None else TRANSFORM_CACHE
         animation = copy(self)
+        animation.__timeline = list(self.__timeline)
         animation.frames = [
-            pygame.transform.flip(image, flip_x, flip_y) for image in animation.frames
+            cache.variant(image, flip_x, flip_y, rotation, scale, tint) for image in self.frames
         ]
         return animation
 
+    def mirror(self, flip_x: bool = True, flip_y: bool = False) -> AnimationSequence:
+        return self.variant(flip_x, flip_y)
+
     def __iter__(self) -> AnimationSequence:
         """Starts an iteration"""
         self.__current_frame = 0
         self.__start_time = perf_counter()
+        self.__elapsed = 0.0
         return self
 
     def __next__(self) -> pygame.Surface:
@@ -135,7 +362,11 @@ class AnimationSequence:
             image = self.frames[self.__current_frame]
 
             current_time = perf_counter()
-            if (current_time - self.__start_time) * 1000 >= self.frame_duration:
+            timeline = self._timeline()
+            frame_duration = timeline[self.__current_frame] - (
+                timeline[self.__current_frame - 1] if self.__current_frame else 0
+            )
+            if (current_time - self.__start_time) * 1000 >= frame_duration:
                 self.__current_frame += 1
                 self.__start_time = perf_counter()
         else:
@@ -144,5 +375,10 @@ class AnimationSequence:
         return image
 
     def __add__(self, sequence: AnimationSequence) -> AnimationSequence:
+        durations = self.frame_durations + sequence.frame_durations
         self.frames.extend(sequence.frames)
+        if self.__durations is not None or len(set(durations)) > 1:
+            self.frame_duration = durations
+        else:
+            self._rebuild_timeline()
         return self
@@ -21,7 +21,99 @@ class ImageTools:
         copy.fill(new_color)
         surf.set_colorkey(old_color)
         copy.blit(surf, (0, 0))
-        return copy.convert_alpha()
+        return ImageTools.optimize(copy)[0]
+
+    @staticmethod
+    def optimize(
+        surf: pygame.Surface,
+        color_key: pygame.Color | None = None,
+        crop: bool = False,
+        crop_ratio: float = 0.5,
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Returns a copy of the given surface in the fastest representation for its pixels.
+
+        Pixels are inspected once: fully opaque images are converted to the display format
+        without transparency, images whose pixels are either opaque or fully transparent use
+        an RLE accelerated color key, and only images with partial transparency keep per-pixel
+        alpha. The given surface is never modified.
+
+        Args:
+            surf (pygame.Surface): surface to optimize.
+            color_key (pygame.Color, optional): background color, transparency is applied only
+                if some pixel actually has this color. Defaults to None (use the surface own
+                color key or per-pixel alpha).
+            crop (bool, optional): when True, mostly transparent images are cropped to their
+                visible area. Sprites do not apply the returned offset, so the loaders and
+                sprite sheets never crop: callers cropping must draw the image at the offset
+                themselves. Defaults to False.
+            crop_ratio (float, optional): maximum ratio between the visible and the full area
+                for an image to be cropped. Defaults to 0.5.
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int]]: the optimized surface and the offset of its
+                top left corner from the original one, (0, 0) unless cropped.
+        """
+        width, height = surf.get_size()
+        area = width * height
+        display_ready = pygame.display.get_surface() is not None
+        if area == 0:
+            return surf.copy(), (0, 0)
+
+        key: pygame.Color | None = None
+        per_pixel_alpha = False
+        if color_key is not None:
+            key = pygame.Color(color_key)
+            visible = pygame.mask.from_threshold(surf, key, (1, 1, 1, 255))
+            visible.invert()
+        elif surf.get_flags() & pygame.SRCALPHA:
+            visible = pygame.mask.from_surface(surf, 0)
+            opaque_count = pygame.mask.from_surface(surf, 254).count()
+            if opaque_count != visible.count():
+                per_pixel_alpha = True
+            elif opaque_count != area:
+                key = ImageTools._free_color(surf, visible)
+                per_pixel_alpha = key is None
+        else:
+            visible = pygame.mask.from_surface(surf)
+            colorkey = surf.get_colorkey()
+            key = pygame.Color(colorkey) if colorkey is not None else None
+
+        visible_count = visible.count()
+        if visible_count == area:
+            key = None
+            per_pixel_alpha = False
+
+        offset = (0, 0)
+        source_rect = surf.get_rect()
+        if crop and visible_count < area * crop_ratio:
+            bounds = visible.get_bounding_rects()
+            source_rect = bounds[0].unionall(bounds[1:]) if bounds else pygame.Rect(0, 0, 0, 0)
+            offset = source_rect.topleft
+
+        if per_pixel_alpha:
+            image = surf.subsurface(source_rect).copy()
+            return (image.convert_alpha() if display_ready else image), offset
+
+        image = pygame.Surface(source_rect.size)
+        if display_ready:
+            image = image.convert()
+        if key is not None:
+            image.fill(key)
+        image.blit(surf, (0, 0), source_rect)
+        if key is not None:
+            image.set_colorkey(key, pygame.RLEACCEL)
+        return image, offset
+
+    @staticmethod
+    def _free_color(surf: pygame.Surface, visible: pygame.mask.Mask) -> pygame.Color | None:
+        """Returns a color no visible pixel of the surface has, to be used as color key."""
+        for candidate in ((255, 0, 255), (0, 255, 255), (1, 2, 3), (254, 1, 253)):
+            color = pygame.Color(candidate)
+            if not pygame.mask.from_threshold(surf, color, (1, 1, 1, 255)).overlap_area(
+                visible, (0, 0)
+            ):
+                return color
+        return None
 
     @staticmethod
     def circle_surface(radius: int, color: pygame.Color) -> pygame.Surface:
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import partial
+import weakref
+
+import pygame
+
+VariantKey = tuple[int, bool, bool, int, int, tuple[int, ...] | None]
+
+
+class TransformCache:
+    """Transform variant cache
+
+    Computes flipped, rotated (by multiples of 90 degrees), integer scaled and tinted variants
+    of surfaces once, sharing them with every caller that asks for the same variant of the same
+    surface. The least recently used variants are discarded when the memory budget is exceeded.
+    Sources are referenced weakly, so the variants of a collected surface are dropped (on the
+    next call) instead of keeping the source alive.
+    """
+
+    def __init__(self, budget: int = 64 * 1024 * 1024) -> None:
+        """Constructs an empty transform cache.
+
+        Args:
+            budget (int, optional): maximum bytes of pixel data held by cached variants.
+                Defaults to 64 MiB.
+        """
+        self.budget = budget
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._variants: OrderedDict[
+            VariantKey, tuple[weakref.ref[pygame.Surface], pygame.Surface]
+        ] = OrderedDict()
+        self._expired: list[VariantKey] = []
+
+    def __len__(self) -> int:
+        self._purge()
+        return len(self._variants)
+
+    def clear(self) -> None:
+        """Discards every cached variant."""
+        self._variants.clear()
+        self._expired.clear()
+        self.memory = 0
+
+    def _expire(self, key: VariantKey, _: weakref.ref[pygame.Surface]) -> None:
+        self._expired.append(key)
+
+    def _purge(self) -> None:
+        # Keys are queued by the weakref callbacks, which may run at any allocation.
+        while self._expired:
+            key = self._expired.pop()
+            entry = self._variants.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._variants[key]
+                self.memory -= self._surface_bytes(entry[1])
+
+    def variant(
+        self,
+        surface: pygame.Surface,
+        flip_x: bool = False,
+        flip_y: bool = False,
+        rotation: int = 0,
+        scale: int = 1,
+        tint: pygame.Color | None = None,
+    ) -> pygame.Surface:
+        """Returns a transformed variant of the given surface, computing it only once.
+
+        Transforms are applied in order: flip, counterclockwise rotation, scale and tint.
+
+        Args:
+            surface (pygame.Surface): source image.
+            flip_x (bool, optional): mirror horizontally. Defaults to False.
+            flip_y (bool, optional): mirror vertically. Defaults to False.
+            rotation (int, optional): degrees of rotation, a multiple of 90. Defaults to 0.
+            scale (int, optional): integer scale factor. Defaults to 1.
+            tint (pygame.Color, optional): color the pixels are multiplied by. Defaults to None.
+
+        Raises:
+            ValueError: if rotation is not a multiple of 90 or scale is lower than 1.
+
+        Returns:
+            pygame.Surface: the variant, or the source itself when no transform is requested.
+        """
+        if rotation % 90:
+            raise ValueError(f"Rotation must be a multiple of 90 degrees, got {rotation}")
+        if scale < 1:
+            raise ValueError(f"Scale must be a positive integer, got {scale}")
+
+        rotation %= 360
+        tint_key = tuple(pygame.Color(tint)) if tint is not None else None
+        if not (flip_x or flip_y or rotation or scale != 1 or tint_key):
+            return surface
+
+        self._purge()
+        key: VariantKey = (id(surface), flip_x, flip_y, rotation, scale, tint_key)
+        entry = self._variants.get(key)
+        if entry is not None and entry[0]() is surface:
+            self._variants.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        image = surface
+        if flip_x or flip_y:
+            image = pygame.transform.flip(image, flip_x, flip_y)
+        if rotation:
+            image = pygame.transform.rotate(image, rotation)
+        if scale != 1:
+            image = pygame.transform.scale(
+                image, (image.get_width() * scale, image.get_height() * scale)
+            )
+        if tint is not None:
+            image = image.copy() if image is surface else image
+            image.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+
+        if entry is not None:
+            self.memory -= self._surface_bytes(entry[1])
+        # A collected source id can be reused, so entries check their source is still alive.
+        self._variants[key] = (
+            weakref.ref(surface, partial(self._expire, key)),
+            image,
+        )
+        self.memory += self._surface_bytes(image)
+        while self.memory > self.budget and len(self._variants) > 1:
+            _, (_, evicted) = self._variants.popitem(last=False)
+            self.memory -= self._surface_bytes(evicted)
+        return image
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+
+TRANSFORM_CACHE = TransformCache()
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+import pygame
+from typing_extensions import Self, override
+
+from apu.objects.entities import BaseSprite
+
+DEFAULT_SCHEMA: dict[str, tuple[str, ...]] = {
+    "position": ("x", "y"),
+    "velocity": ("vx", "vy"),
+}
+
+
+class Archetype:
+    """Archetype table
+
+    Stores every entity holding exactly the same set of components, one contiguous array of
+    doubles per component field. Rows are kept packed: removing an entity moves the last row
+    into its place.
+    """
+
+    def __init__(self, signature: frozenset[str], fields: Sequence[str]) -> None:
+        """Constructs an empty table.
+
+        Args:
+            signature (frozenset[str]): names of the components held by the entities.
+            fields (Sequence[str]): names of the columns.
+        """
+        self.signature = signature
+        self.entities: list[int] = []
+        self.columns: dict[str, array[float]] = {field: array("d") for field in fields}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def append(self, entity: int, values: dict[str, float]) -> int:
+        """Appends a row, missing fields default to 0.
+
+        Args:
+            entity (int): entity id.
+            values (dict[str, float]): field values.
+
+        Returns:
+            int: the row index.
+        """
+        self.entities.append(entity)
+        for field, column in self.columns.items():
+            column.append(values.get(field, 0.0))
+        return len(self.entities) - 1
+
+    def row(self, index: int) -> dict[str, float]:
+        """Returns the field values of a row."""
+        return {field: column[index] for field, column in self.columns.items()}
+
+    def remove(self, index: int) -> int | None:
+        """Removes a row, moving the last one into its place.
+
+        Args:
+            index (int): row index.
+
+        Returns:
+            int | None: the id of the entity moved to the given row, if any.
+        """
+        last = len(self.entities) - 1
+        moved = None
+        if index != last:
+            moved = self.entities[last]
+            self.entities[index] = moved
+            for column in self.columns.values():
+                column[index] = column[last]
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+        return moved
+
+
+class World:
+    """ECS world
+
+    Optional struct-of-arrays storage for entity data. Entities are plain ids and their
+    components are rows of archetype tables, so systems can process every entity with a given
+    set of components by iterating over a few contiguous arrays instead of calling a method
+    per object.
+    """
+
+    def __init__(self, schema: dict[str, tuple[str, ...]] | None = None) -> None:
+        """Constructs an empty world.
+
+        Args:
+            schema (dict[str, tuple[str, ...]], optional): fields of each component type.
+                Defaults to position and velocity.
+
+        Raises:
+            ValueError: if a field name is used by more than one component type.
+        """
+        self.schema: dict[str, tuple[str, ...]] = {}
+        for component, fields in (schema if schema is not None else DEFAULT_SCHEMA).items():
+            self.define(component, fields)
+        self._archetypes: dict[frozenset[str], Archetype] = {}
+        self._locations: dict[int, tuple[Archetype, int]] = {}
+        self._next_entity = 0
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._locations
+
+    def define(self, component: str, fields: tuple[str, ...]) -> None:
+        """Declares a new component type.
+
+        Args:
+            component (str): component name.
+            fields (tuple[str, ...]): names of its fields.
+
+        Raises:
+            KeyError: if the component type is already defined.
+            ValueError: if a field name is already used by another component type, as the
+                fields of all the components of an archetype share a single namespace.
+        """
+        if component in self.schema:
+            raise KeyError(f"Component type {component} is already defined")
+        if len(set(fields)) != len(fields):
+            raise ValueError(f"Component {component} declares the same field twice")
+        for other, other_fields in self.schema.items():
+            clashes = sorted(set(fields) & set(other_fields))
+            if clashes:
+                raise ValueError(
+                    f"Fields {clashes} of component {component} are already used by {other}"
+                )
+        self.schema[component] = fields
+
+    def _archetype(self, signature: frozenset[str]) -> Archetype:
+        table = self._archetypes.get(signature)
+        if table is None:
+            for component in signature:
+                if component not in self.schema:
+                    raise KeyError(f"Unknown component type {component}")
+            fields = [field for component in sorted(signature) for field in self.schema[component]]
+            table = Archetype(signature, fields)
+            self._archetypes[signature] = table
+        return table
+
+    def _values(self, component: str, values: Iterable[float]) -> dict[str, float]:
+        fields = self.schema[component]
+        values = tuple(values)
+        if len(values) != len(fields):
+            raise ValueError(f"Component {component} expects values for {fields}")
+        return dict(zip(fields, values, strict=True))
+
+    def spawn(self, **components: Iterable[float]) -> int:
+        """Creates an entity with the given components.
+
+        Args:
+            **components (Iterable[float]): values of each component, in schema field order.
+
+        Raises:
+            KeyError: if a component type is not defined.
+            ValueError: if the number of values does not match a component fields.
+
+        Returns:
+            int: the new entity id.
+        """
+        values: dict[str, float] = {}
+        for component, component_values in components.items():
+            if component not in self.schema:
+                raise KeyError(f"Unknown component type {component}")
+            values.update(self._values(component, component_values))
+
+        entity = self._next_entity
+        self._next_entity += 1
+        table = self._archetype(frozenset(components))
+        self._locations[entity] = (table, table.append(entity, values))
+        return entity
+
+    def _detach(self, entity: int) -> dict[str, float]:
+        table, row = self._locations.pop(entity)
+        values = table.row(row)
+        moved = table.remove(row)
+        if moved is not None:
+            self._locations[moved] = (table, row)
+        return values
+
+    def despawn(self, entity: int) -> None:
+        """Destroys an entity and its components.
+
+        Raises:
+            KeyError: if the entity does not exist.
+        """
+        self._detach(entity)
+
+    def components(self, entity: int) -> frozenset[str]:
+        """Returns the names of the components held by an entity."""
+        return self._locations[entity][0].signature
+
+    def add(self, entity: int, component: str, values: Iterable[float]) -> None:
+        """Adds (or overwrites) a component, moving the entity to the matching archetype.
+
+        Raises:
+            KeyError: if the entity or the component type does not exist.
+        """
+        if component not in self.schema:
+            raise KeyError(f"Unknown component type {component}")
+        new_values = self._values(component, values)
+        signature = self.components(entity) | {component}
+        row_values = self._detach(entity)
+        row_values.update(new_values)
+        table = self._archetype(signature)
+        self._locations[entity] = (table, table.append(entity, row_values))
+
+    def remove(self, entity: int, component: str) -> None:
+        """Removes a component, moving the entity to the matching archetype.
+
+        Raises:
+            KeyError: if the entity does not exist.
+        """
+        signature = self.components(entity) - {component}
+        row_values = self._detach(entity)
+        table = self._archetype(signature)
+        self._locations[entity] = (table, table.append(entity, row_values))
+
+    def get(self, entity: int, field: str) -> float:
+        """Returns the value of a component field of an entity."""
+        table, row = self._locations[entity]
+        return table.columns[field][row]
+
+    def set(self, entity: int, field: str, value: float) -> None:
+        """Sets the value of a component field of an entity."""
+        table, row = self._locations[entity]
+        table.columns[field][row] = value
+
+    def query(self, *components: str) -> Iterator[Archetype]:
+        """Yields every non empty archetype holding at least the given components.
+
+        Args:
+            *components (str): required component names.
+        """
+        required = frozenset(components)
+        for signature, table in list(self._archetypes.items()):
+            if table.entities and required <= signature:
+                yield table
+
+
+def velocity_system(world: World, dt: float = 1.0) -> None:
+    """Moves every entity with a position and a velocity by velocity * dt.
+
+    Args:
+        world (World): world to update.
+        dt (float, optional): time step. Defaults to 1.0.
+    """
+    for table in world.query("position", "velocity"):
+        columns = table.columns
+        x, y = columns["x"], columns["y"]
+        vx, vy = columns["vx"], columns["vy"]
+        for index in range(len(table)):
+            x[index] += vx[index] * dt
+            y[index] += vy[index] * dt
+
+
+class WorldField:
+    """Descriptor exposing a position field of a WorldSprite entity, stored in its world."""
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+
+    @overload
+    def __get__(self, instance: None, owner: type[WorldSprite]) -> Self: ...
+
+    @overload
+    def __get__(self, instance: WorldSprite, owner: type[WorldSprite]) -> int: ...
+
+    def __get__(self, instance: WorldSprite | None, owner: type[WorldSprite]) -> Self | int:
+        if instance is None:
+            return self
+        return int(instance.world.get(instance.entity_id, self.field))
+
+    def __set__(self, instance: WorldSprite, value: float) -> None:
+        instance.world.set(instance.entity_id, self.field, value)
+
+
+class WorldSprite(BaseSprite):
+    """
+    Thin BaseSprite handle whose position lives in a World, so that code written against
+    BaseSprite keeps working while systems process positions in bulk.
+    """
+
+    def __init__(
+        self,
+        world: World,
+        position: tuple[int, int],
+        layer: int = 0,
+        image: pygame.Surface | None = None,
+        **components: Iterable[float],
+    ) -> None:
+        """Spawns an entity with a position (and any other given component) in the world.
+
+        Args:
+            world (World): world storing the sprite data.
+            position (tuple): x and y coordinates of the sprite.
+            layer (int, optional): the layer to draw the image to. Defaults to 0.
+            image (pygame.Surface, optional): default image to draw. Defaults to a new 0x0 surface.
+            **components (Iterable[float]): other world components of the entity.
+        """
+        self.world = world
+        self.entity_id = world.spawn(position=position, **components)
+        super().__init__(position, layer, image)
+        self._seen_position = self.position
+
+    x = WorldField("x")
+    y = WorldField("y")
+
+    @property
+    @override
+    def position_version(self) -> int:
+        """World systems write positions in bulk, bypassing the sprite: the version changes
+        when the position differs from the one seen by the previous read."""
+        position = self.position
+        if position != self._seen_position:
+            self._seen_position = position
+            self._position_version += 1
+        return self._position_version
+
+    @override
+    def kill(self) -> None:
+        """Removes the sprite from every group and its entity from the world."""
+        super().kill()
+        if self.entity_id in self.world:
+            self.world.despawn(self.entity_id)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from apu.collision import HitBox
+    from apu.objects.components import AnimationComponent, SolidBodyComponent
+    from apu.objects.entities import Entity
+
+T = TypeVar("T")
+
+
+class Collision(NamedTuple):
+    """Two overlapping hitboxes of two solid bodies."""
+
+    body_a: SolidBodyComponent
+    body_b: SolidBodyComponent
+    hitbox_a: HitBox
+    hitbox_b: HitBox
+
+
+class AnimationFinished(NamedTuple):
+    """A non looping animation sequence played its last frame."""
+
+    component: AnimationComponent
+    sequence: str
+
+
+class Trigger(NamedTuple):
+    """A named gameplay trigger fired by an entity."""
+
+    name: str
+    entity: Entity | None = None
+
+
+class Channel(Generic[T]):
+    """Event channel
+
+    Delivers events of a single type to its subscribers, either immediately with emit() or in
+    batches with post() and flush(). Handlers are kept in a tuple rebuilt only when
+    subscriptions change, so delivering an event is a plain loop over bound callables.
+    """
+
+    __slots__ = ("_handlers", "_queue", "event_type", "name")
+
+    def __init__(self, name: str, event_type: type[T]) -> None:
+        """Constructs a channel without subscribers.
+
+        Args:
+            name (str): channel name.
+            event_type (type): type of the events delivered by the channel.
+        """
+        self.name = name
+        self.event_type = event_type
+        self._handlers: tuple[Callable[[T], None], ...] = ()
+        self._queue: list[T] = []
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def handlers(self) -> tuple[Callable[[T], None], ...]:
+        """Returns the subscribed handlers, in subscription order."""
+        return self._handlers
+
+    def subscribe(self, handler: Callable[[T], None]) -> Callable[[T], None]:
+        """Subscribes a handler to the channel. Returns the handler, to be used as decorator."""
+        if handler not in self._handlers:
+            self._handlers = self._handlers + (handler,)
+        return handler
+
+    def unsubscribe(self, handler: Callable[[T], None]) -> None:
+        """Removes a handler from the channel subscribers."""
+        self._handlers = tuple(other for other in self._handlers if other != handler)
+
+    def emit(self, event: T) -> None:
+        """Delivers an event to every subscriber right away."""
+        for handler in self._handlers:
+            handler(event)
+
+    def post(self, event: T) -> None:
+        """Queues an event, delivered by the next flush()."""
+        self._queue.append(event)
+
+    def flush(self) -> int:
+        """Delivers the queued events in order. Events posted by the handlers are queued for
+        the next flush.
+
+        Returns:
+            int: the number of delivered events.
+        """
+        queue = self._queue
+        if not queue:
+            return 0
+        self._queue = []
+        handlers = self._handlers
+        for event in queue:
+            for handler in handlers:
+                handler(event)
+        return len(queue)
+
+    def clear(self) -> None:
+        """Discards the queued events."""
+        self._queue.clear()
+
+
+class EventBus:
+    """Event bus
+
+    In-process replacement for custom pygame events in gameplay code: events are plain
+    objects delivered to typed channels, without going through the SDL event queue.
+    Call flush() once per frame to deliver every event posted during the frame.
+    """
+
+    def __init__(self) -> None:
+        self._channels: dict[str, Channel[Any]] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._channels
+
+    def channel(self, name: str, event_type: type[T]) -> Channel[T]:
+        """Returns the channel with the given name, creating it on first use.
+
+        Args:
+            name (str): channel name.
+            event_type (type): type of the events delivered by the channel.
+
+        Raises:
+            TypeError: if the channel exists with another event type.
+        """
+        channel = self._channels.get(name)
+        if channel is None:
+            channel = self._channels[name] = Channel(name, event_type)
+        elif channel.event_type is not event_type:
+            raise TypeError(
+                f"Channel {name} delivers {channel.event_type.__name__} events, "
+                f"not {event_type.__name__}"
+            )
+        return channel
+
+    def flush(self) -> int:
+        """Flushes every channel, in creation order.
+
+        Returns:
+            int: the number of delivered events.
+        """
+        return sum(channel.flush() for channel in list(self._channels.values()))
+
+    def clear(self) -> None:
+        """Discards the queued events of every channel."""
+        for channel in self._channels.values():
+            channel.clear()
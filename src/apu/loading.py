@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 import json
 from pathlib import Path
 from typing import Any
@@ -8,9 +9,11 @@ import pygame
 from typing_extensions import override
 
 from apu.collision import HitBox
+from apu.core.enums import TileKind
 from apu.core.spritesheet import AnimationSequence, SpriteSheet
+from apu.core.tools import ImageTools
 from apu.objects.components import AnimationComponent, SolidBodyComponent
-from apu.objects.entities import BaseSprite
+from apu.objects.entities import BaseSprite, CompactSprite, Entity
 
 __all__ = ["JSONMapLoader", "MapLoader", "TMXMapLoader", "TiledMapLoader"]
 
@@ -23,7 +26,7 @@ class MapLoader(ABC):
     """
 
     @abstractmethod
-    def load(self, map_path: str, assets_path: str) -> list[BaseSprite]:
+    def load(self, map_path: str, assets_path: str) -> Sequence[Entity]:
         """Loads a map and returns a list of sprites.
 
         Args:
@@ -31,7 +34,7 @@ class MapLoader(ABC):
             assets_path: Path to the assets directory
 
         Returns:
-            List of BaseSprite representing the map elements
+            List of sprites representing the map elements
         """
 
     @abstractmethod
@@ -49,10 +52,16 @@ class MapLoader(ABC):
 class TiledMapLoader(MapLoader):
     """Main loader for Tiled maps that delegates to specific loaders."""
 
-    def __init__(self) -> None:
+    def __init__(self, compact: bool = False) -> None:
+        """Creates the loader and its format specific loaders.
+
+        Args:
+            compact: If True, tiles are loaded as memory compact CompactSprite objects
+                instead of BaseSprite objects
+        """
         self.loaders: list[MapLoader] = [
-            JSONMapLoader(),
-            TMXMapLoader(),
+            JSONMapLoader(compact),
+            TMXMapLoader(compact),
         ]
 
     def add_loader(self, loader: MapLoader) -> None:
@@ -64,7 +73,7 @@ class TiledMapLoader(MapLoader):
         self.loaders.append(loader)
 
     @override
-    def load(self, map_path: str, assets_path: str) -> list[BaseSprite]:
+    def load(self, map_path: str, assets_path: str) -> Sequence[Entity]:
         """Loads a map using the appropriate loader.
 
         Args:
@@ -72,7 +81,7 @@ class TiledMapLoader(MapLoader):
             assets_path: Path to the assets directory
 
         Returns:
-            List of BaseSprite representing the map elements
+            List of sprites representing the map elements
 
         Raises:
             ValueError: If no loader supports the file format
@@ -99,12 +108,22 @@ class TiledMapLoader(MapLoader):
 class JSONMapLoader(MapLoader):
     """Loader for Tiled maps in JSON format."""
 
+    def __init__(self, compact: bool = False) -> None:
+        """Creates the loader.
+
+        Args:
+            compact: If True, tiles are loaded as memory compact CompactSprite objects
+                instead of BaseSprite objects
+        """
+        self.compact = compact
+        self._tile_images: dict[int, pygame.Surface] = {}
+
     @override
     def supports_format(self, file_path: str) -> bool:
         return file_path.lower().endswith(".json")
 
     @override
-    def load(self, map_path: str, assets_path: str) -> list[BaseSprite]:
+    def load(self, map_path: str, assets_path: str) -> list[Entity]:
         """Loads a Tiled map from JSON file.
 
         Args:
@@ -112,10 +131,11 @@ class JSONMapLoader(MapLoader):
             assets_path: Path to the assets directory
 
         Returns:
-            List of BaseSprite representing the map elements
+            List of sprites representing the map elements
         """
         with Path(map_path).open() as f:
             json_data = json.load(f)
+        self._tile_images = {}
 
         tile_size = json_data["tileheight"]
         tileset_path = self._get_tileset_path(json_data, assets_path)
@@ -197,15 +217,14 @@ class JSONMapLoader(MapLoader):
                             image_position[1] * tile_size,
                             image_position[0] * tile_size,
                         )
-                        frame_image = sheet.image_at(
-                            pygame.Rect(image_position, (tile_size, tile_size))
-                        )
-                        frame_image.set_colorkey((0, 0, 0))
+                        frame_image = ImageTools.optimize(
+                            sheet.image_at(pygame.Rect(image_position, (tile_size, tile_size))),
+                            pygame.Color(0, 0, 0),
+                        )[0]
                         anim_frames.append(frame_image)
                     if anim_frames:
-                        animations[tile_id] = [
-                            AnimationSequence(anim_frames, True, tile["animation"][0]["duration"])
-                        ]
+                        durations = [frame["duration"] for frame in tile["animation"]]
+                        animations[tile_id] = [AnimationSequence(anim_frames, True, durations)]
         return animations
 
     def _create_layer_sprites(
@@ -217,7 +236,7 @@ class JSONMapLoader(MapLoader):
         layer_index: int,
         hitboxes: dict[int, HitBox],
         animations: dict[int, list[AnimationSequence]],
-    ) -> list[BaseSprite]:
+    ) -> list[Entity]:
         """Creates sprites for a specific layer.
 
         Args:
@@ -230,9 +249,9 @@ class JSONMapLoader(MapLoader):
             animations: Dictionary of animations
 
         Returns:
-            List of BaseSprite for the layer
+            List of sprites for the layer
         """
-        sprites = []
+        sprites: list[Entity] = []
         map_width = json_data["width"]
 
         for tile_index, tile_id in enumerate(layer["data"]):
@@ -245,9 +264,12 @@ class JSONMapLoader(MapLoader):
 
                 image = self._get_tile_image(tile_id, sheet, tile_size)
 
-                sprite = BaseSprite(position=tile_position, layer=layer_index, image=image)
+                sprite_type = CompactSprite if self.compact else BaseSprite
+                sprite = sprite_type(position=tile_position, layer=layer_index, image=image)
 
+                kind = TileKind.STATIC
                 if tile_id in hitboxes:
+                    kind |= TileKind.SOLID
                     original_hitbox = hitboxes[tile_id]
                     # Crea una nuova istanza di HitBox per ogni sprite.
                     new_hitbox = HitBox(original_hitbox.rect.copy())
@@ -255,9 +277,11 @@ class JSONMapLoader(MapLoader):
                     sprite.add_component(body_component)
 
                 if tile_id in animations:
+                    kind |= TileKind.ANIMATED
                     anim_component = AnimationComponent(animation1=animations[tile_id][0])
                     sprite.add_component(anim_component)
 
+                sprite.kind = kind
                 sprites.append(sprite)
 
         return sprites
@@ -271,8 +295,12 @@ class JSONMapLoader(MapLoader):
             tile_size: Size of tiles
 
         Returns:
-            Pygame surface of the tile
+            Pygame surface of the tile, shared by every tile with the same ID
         """
+        image = self._tile_images.get(tile_id)
+        if image is not None:
+            return image
+
         firstgid = 1
         image_id = tile_id - firstgid
 
@@ -282,20 +310,33 @@ class JSONMapLoader(MapLoader):
             image_position[0] * tile_size,
         )
 
-        image = sheet.image_at(pygame.Rect(image_position, (tile_size, tile_size)))
-        image.set_colorkey((0, 0, 0))
+        image = ImageTools.optimize(
+            sheet.image_at(pygame.Rect(image_position, (tile_size, tile_size))),
+            pygame.Color(0, 0, 0),
+        )[0]
+        self._tile_images[tile_id] = image
         return image
 
 
 class TMXMapLoader(MapLoader):
     """Loader for Tiled maps in TMX (XML) format."""
 
+    def __init__(self, compact: bool = False) -> None:
+        """Creates the loader.
+
+        Args:
+            compact: If True, tiles are loaded as memory compact CompactSprite objects
+                instead of BaseSprite objects
+        """
+        self.compact = compact
+        self._tile_images: dict[int, pygame.Surface] = {}
+
     @override
     def supports_format(self, file_path: str) -> bool:
         return file_path.lower().endswith(".tmx")
 
     @override
-    def load(self, map_path: str, assets_path: str) -> list[BaseSprite]:
+    def load(self, map_path: str, assets_path: str) -> list[Entity]:
         """Loads a Tiled map from TMX file.
 
         Args:
@@ -303,10 +344,11 @@ class TMXMapLoader(MapLoader):
             assets_path: Path to the assets directory
 
         Returns:
-            List of BaseSprite representing the map elements
+            List of sprites representing the map elements
         """
         tree = ET.parse(map_path)
         root = tree.getroot()
+        self._tile_images = {}
 
         tile_width = int(root.get("tilewidth", 16) or 16)
         tile_height = int(root.get("tileheight", 16) or 16)
@@ -416,12 +458,11 @@ class TMXMapLoader(MapLoader):
 
                 if animation is not None:
                     anim_frames = []
-                    duration = 0
+                    durations = []
 
                     for frame in animation.findall("frame"):
                         frame_id = int(frame.get("tileid", 0) or 0)
-                        frame_duration = int(frame.get("duration", 100) or 100)
-                        duration = frame_duration
+                        durations.append(int(frame.get("duration", 100) or 100))
 
                         image_position = divmod(frame_id, sheet.sheet.get_size()[0] // tile_width)
                         image_position = (
@@ -429,16 +470,16 @@ class TMXMapLoader(MapLoader):
                             image_position[0] * tile_height,
                         )
 
-                        frame_image = sheet.image_at(
-                            pygame.Rect(image_position, (tile_width, tile_height))
-                        )
-                        frame_image.set_colorkey((0, 0, 0))
+                        frame_image = ImageTools.optimize(
+                            sheet.image_at(pygame.Rect(image_position, (tile_width, tile_height))),
+                            pygame.Color(0, 0, 0),
+                        )[0]
                         anim_frames.append(frame_image)
 
                     if anim_frames:
                         # Usa il GID come chiave per coerenza con i dati del livello
                         animations[firstgid + tile_id] = [
-                            AnimationSequence(anim_frames, True, duration)
+                            AnimationSequence(anim_frames, True, durations)
                         ]
 
         return animations
@@ -453,7 +494,7 @@ class TMXMapLoader(MapLoader):
         sheet: SpriteSheet,
         hitboxes: dict[int, HitBox],
         animations: dict[int, list[AnimationSequence]],
-    ) -> list[BaseSprite]:
+    ) -> list[Entity]:
         """Creates sprites for a specific layer from TMX.
 
         Args:
@@ -467,9 +508,9 @@ class TMXMapLoader(MapLoader):
             animations: Dictionary of animations
 
         Returns:
-            List of BaseSprite for the layer
+            List of sprites for the layer
         """
-        sprites: list[BaseSprite] = []
+        sprites: list[Entity] = []
 
         data = layer.find("data")
         if data is None:
@@ -516,18 +557,23 @@ class TMXMapLoader(MapLoader):
 
                 image = self._get_tile_image_from_tmx(tile_id, sheet, tile_width, tile_height)
 
-                sprite = BaseSprite(position=tile_position, layer=layer_index, image=image)
+                sprite_type = CompactSprite if self.compact else BaseSprite
+                sprite = sprite_type(position=tile_position, layer=layer_index, image=image)
 
+                kind = TileKind.STATIC
                 if tile_id in hitboxes:
+                    kind |= TileKind.SOLID
                     original_hitbox = hitboxes[tile_id]
                     new_hitbox = HitBox(original_hitbox.rect.copy())
                     body_component = SolidBodyComponent(box1=new_hitbox)
                     sprite.add_component(body_component)
 
                 if tile_id in animations:
+                    kind |= TileKind.ANIMATED
                     anim_component = AnimationComponent(animation1=animations[tile_id][0])
                     sprite.add_component(anim_component)
 
+                sprite.kind = kind
                 sprites.append(sprite)
 
         return sprites
@@ -544,8 +590,12 @@ class TMXMapLoader(MapLoader):
             tile_height: Height of tiles
 
         Returns:
-            Pygame surface of the tile
+            Pygame surface of the tile, shared by every tile with the same ID
         """
+        image = self._tile_images.get(tile_id)
+        if image is not None:
+            return image
+
         firstgid = 1
         image_id = tile_id - firstgid
 
@@ -555,6 +605,9 @@ class TMXMapLoader(MapLoader):
             image_position[0] * tile_height,
         )
 
-        image = sheet.image_at(pygame.Rect(image_position, (tile_width, tile_height)))
-        image.set_colorkey((0, 0, 0))
+        image = ImageTools.optimize(
+            sheet.image_at(pygame.Rect(image_position, (tile_width, tile_height))),
+            pygame.Color(0, 0, 0),
+        )[0]
+        self._tile_images[tile_id] = image
         return image
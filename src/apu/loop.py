@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from time import perf_counter, sleep
+
+
+class GameLoop:
+    """Fixed timestep game loop
+
+    Runs the simulation at a fixed tick rate, decoupled from the rendering frame rate: the
+    wall time elapsed between frames is accumulated and consumed in fixed steps, so movement
+    does not depend on how fast frames are drawn. The render hook receives the fraction of a
+    step left in the accumulator, to interpolate between the last two simulated states.
+    When a frame is done ahead of schedule the loop sleeps until the next one is due, waking
+    up slightly early and busy waiting the last fraction of a millisecond for precision.
+
+    In headless mode the wall clock is ignored: every frame runs exactly one step, nothing is
+    rendered and the loop never sleeps, so the simulation runs as fast as possible.
+    """
+
+    def __init__(
+        self,
+        update: Callable[[float], None],
+        render: Callable[[float], None] | None = None,
+        events: Callable[[], None] | None = None,
+        tick_rate: int = 60,
+        frame_rate: int | None = None,
+        max_steps: int = 5,
+        headless: bool = False,
+        spin_time: float = 0.002,
+        clock: Callable[[], float] = perf_counter,
+        wait: Callable[[float], None] = sleep,
+    ) -> None:
+        """Constructs a game loop.
+
+        Args:
+            update (Callable[[float], None]): called once per simulation step with the fixed
+                step duration, in ms.
+            render (Callable[[float], None], optional): called once per frame with the
+                interpolation factor between the previous and the current state, in [0, 1).
+                Defaults to None.
+            events (Callable[[], None], optional): called once per frame before the
+                simulation steps. Defaults to None.
+            tick_rate (int, optional): simulation steps per second. Defaults to 60.
+            frame_rate (int, optional): maximum frames per second, 0 for no limit.
+                Defaults to None (the tick rate).
+            max_steps (int, optional): maximum steps per frame, the simulation slows down
+                instead of spiraling when updates take longer than real time. Defaults to 5.
+            headless (bool, optional): run one step per frame as fast as possible, without
+                rendering. Defaults to False.
+            spin_time (float, optional): seconds busy waited at the end of each sleep.
+                Defaults to 0.002.
+            clock (Callable[[], float], optional): monotonic clock in seconds.
+                Defaults to time.perf_counter.
+            wait (Callable[[float], None], optional): sleep function. Defaults to time.sleep.
+
+        Raises:
+            ValueError: if tick_rate or max_steps are lower than 1.
+        """
+        if tick_rate < 1:
+            raise ValueError(f"Tick rate must be a positive integer, got {tick_rate}")
+        if max_steps < 1:
+            raise ValueError(f"Max steps must be a positive integer, got {max_steps}")
+
+        self.update_hook = update
+        self.render_hook = render
+        self.events_hook = events
+        self.tick_rate = tick_rate
+        self.frame_rate = tick_rate if frame_rate is None else frame_rate
+        self.max_steps = max_steps
+        self.headless = headless
+        self.spin_time = spin_time
+        self._clock = clock
+        self._wait = wait
+
+        self.running = False
+        self.frames = 0
+        self.ticks = 0
+        self.alpha = 0.0
+        self._accumulator = 0.0
+        self._last_time: float | None = None
+        self._next_frame: float | None = None
+
+    @property
+    def step(self) -> float:
+        """Returns the duration of a simulation step, in ms."""
+        return 1000 / self.tick_rate
+
+    @property
+    def time(self) -> float:
+        """Returns the simulated time, in ms."""
+        return self.ticks * self.step
+
+    @staticmethod
+    def interpolate(
+        previous: tuple[float, float], current: tuple[float, float], alpha: float
+    ) -> tuple[float, float]:
+        """Returns the point at the given fraction between two positions."""
+        return (
+            previous[0] + (current[0] - previous[0]) * alpha,
+            previous[1] + (current[1] - previous[1]) * alpha,
+        )
+
+    def stop(self) -> None:
+        """Makes run() return at the end of the current frame."""
+        self.running = False
+
+    def run(self, max_frames: int | None = None) -> None:
+        """Runs frames until stop() is called.
+
+        Args:
+            max_frames (int, optional): number of frames after which the loop stops.
+                Defaults to None (no limit).
+        """
+        self.running = True
+        self._last_time = None
+        self._next_frame = None
+        frames = 0
+        while self.running and (max_frames is None or frames < max_frames):
+            self.tick()
+            frames += 1
+        self.running = False
+
+    def tick(self) -> None:
+        """Runs a single frame: events, simulation steps, rendering and sleep."""
+        if self.events_hook is not None:
+            self.events_hook()
+
+        step = self.step
+        if self.headless:
+            self.update_hook(step)
+            self.ticks += 1
+            self.frames += 1
+            return
+
+        now = self._clock()
+        if self._last_time is not None:
+            self._accumulator += (now - self._last_time) * 1000
+        self._last_time = now
+
+        steps = 0
+        while self._accumulator >= step and steps < self.max_steps:
+            self.update_hook(step)
+            self._accumulator -= step
+            self.ticks += 1
+            steps += 1
+        if steps == self.max_steps and self._accumulator >= step:
+            # Drop the time that could not be simulated instead of catching up later.
+            self._accumulator %= step
+
+        self.alpha = self._accumulator / step
+        if self.render_hook is not None:
+            self.render_hook(self.alpha)
+        self.frames += 1
+
+        if self.frame_rate > 0:
+            self._sleep_until_next_frame()
+
+    def _sleep_until_next_frame(self) -> None:
+        interval = 1 / self.frame_rate
+        now = self._clock()
+        deadline = (self._next_frame if self._next_frame is not None else now) + interval
+        if deadline < now:
+            # Behind schedule: do not try to catch up with shorter frames.
+            deadline = now
+        self._next_frame = deadline
+
+        remaining = deadline - now
+        if remaining > self.spin_time:
+            self._wait(remaining - self.spin_time)
+        while self._clock() < deadline:
+            pass
@@ -1,38 +1,86 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import UserDict
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from pygame.surface import Surface
 from typing_extensions import override
 
-from apu.collision import HitBox
+from apu.collision import HitBox, hitboxes_overlap
 from apu.core.enums import Directions
 from apu.core.spritesheet import AnimationSequence
 
 if TYPE_CHECKING:
-    from apu.objects.entities import BaseSprite
+    from apu.collision import CollisionWorld
+    from apu.objects.entities import Entity
+    from apu.systems.animation import AnimationSystem
+    from apu.systems.movement import MovementSystem
+    from apu.systems.scheduler import UpdateScheduler
 
 
-# Correzione 1: Specificare i parametri di tipo per UserDict
-class HitBoxDict(UserDict[str, HitBox]):
+class HitBoxDict(dict[str, HitBox]):
+    """Hitboxes of a SolidBodyComponent by name, binding every stored HitBox to the body."""
+
+    __slots__ = ("_body",)
+
     def __init__(self, body: SolidBodyComponent, *args: Any, **kwargs: Any) -> None:
         self._body: SolidBodyComponent = body
         super().__init__(*args, **kwargs)
 
         for value in self.values():
             value._body = self._body
+            value.invalidate()
 
     @override
     def __setitem__(self, key: str, value: HitBox) -> None:
         value._body = self._body
+        value.invalidate()
         super().__setitem__(key, value)
 
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    @override
+    def setdefault(self, key: str, default: HitBox) -> HitBox:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    @override
+    def copy(self) -> HitBoxDict:
+        return HitBoxDict(self._body, self)
+
 
 class BaseComponent(ABC):
+    __slots__ = ("_scheduler", "entity")
+
     def __init__(self) -> None:
-        self.entity: BaseSprite | None = None
+        self.entity: Entity | None = None
+        self._scheduler: UpdateScheduler | None = None
+
+    @property
+    def active(self) -> bool:
+        """Returns False while update() would do nothing, letting an UpdateScheduler skip it
+        until the component is woken up."""
+        return True
+
+    def wake(self) -> None:
+        """Puts the component back in the update list of its UpdateScheduler, if any."""
+        if self._scheduler is not None:
+            self._scheduler.wake(self)
+
+    def reset(self) -> None:  # noqa: B027
+        """Restores the initial state of the component, called when its entity is recycled
+        by an EntityPool."""
+
+    def detach(self) -> None:
+        """Unregisters the component from the scheduler and systems processing it, called
+        when it is removed from its entity or the entity is released to an EntityPool."""
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
 
     @abstractmethod
     def on_added(self) -> None:
@@ -52,10 +100,34 @@ class BaseComponent(ABC):
 
 
 class MovementComponent(BaseComponent):
-    def __init__(self, speed: int = 1, acceleration: int = 0) -> None:
+    __slots__ = (
+        "_acceleration",
+        "_delta_speed",
+        "_speed",
+        "_state",
+        "_system",
+        "collider",
+        "facing_direction",
+        "is_moving",
+    )
+
+    def __init__(
+        self, speed: int = 1, acceleration: int = 0, collider: CollisionWorld | None = None
+    ) -> None:
+        """Constructs a movement component.
+
+        Args:
+            speed (int, optional): pixels moved per update. Defaults to 1.
+            acceleration (int, optional): pixels added to the speed. Defaults to 0.
+            collider (CollisionWorld, optional): world the movements of the entity
+                SolidBodyComponent are resolved against, so that fast bodies stop at (and
+                slide along) walls instead of tunneling through them. Defaults to None.
+        """
         super().__init__()
-        self.speed = speed
-        self.acceleration = acceleration
+        self._system: MovementSystem | None = None
+        self._speed = speed
+        self._acceleration = acceleration
+        self.collider = collider
         self.is_moving = False
         self.facing_direction = Directions.DOWN
 
@@ -67,6 +139,28 @@ class MovementComponent(BaseComponent):
             Directions.RIGHT: [False, False],
         }
 
+    @property
+    def speed(self) -> int:
+        """Returns the pixels moved per update."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: int) -> None:
+        self._speed = value
+        if self._system is not None:
+            self._system.refresh(self)
+
+    @property
+    def acceleration(self) -> int:
+        """Returns the pixels added to the speed."""
+        return self._acceleration
+
+    @acceleration.setter
+    def acceleration(self, value: int) -> None:
+        self._acceleration = value
+        if self._system is not None:
+            self._system.refresh(self)
+
     @property
     def movements(self) -> tuple[Directions, ...]:
         directions = [key for key in self._state if self._state[key][0]]
@@ -84,6 +178,9 @@ class MovementComponent(BaseComponent):
         if not self._state[direction][0]:
             self.facing_direction = direction
             self._state[direction] = [True, loop]
+            if self._system is not None:
+                self._system.refresh(self)
+        self.wake()
 
     def stop(self, direction: Directions) -> None:
         if direction not in self._state:
@@ -96,17 +193,61 @@ class MovementComponent(BaseComponent):
             self._state[direction] = [False, False]
             if not self.movements:
                 self.is_moving = False
+            if self._system is not None:
+                self._system.refresh(self)
+
+    def resolve(self, dx: float, dy: float) -> tuple[float, float]:
+        """Returns the displacement the entity can make against the bodies of the collider.
+
+        Args:
+            dx (float): horizontal displacement.
+            dy (float): vertical displacement.
+        """
+        if self.collider is None or self.entity is None:
+            return dx, dy
+        body = self.entity.get_component(SolidBodyComponent)
+        if not isinstance(body, SolidBodyComponent) or body not in self.collider:
+            return dx, dy
+        return self.collider.sweep(body, dx, dy)
+
+    @override
+    def reset(self) -> None:
+        """Stops every movement and faces down again."""
+        for direction in self._state:
+            self._state[direction] = [False, False]
+        self.is_moving = False
+        self.facing_direction = Directions.DOWN
+        system = self._system
+        if system is not None:
+            # Registering again restarts the subpixel position from the entity one.
+            system.unregister(self)
+            system.register(self)
 
     @override
     def on_added(self) -> None:
         pass
 
+    @override
+    def detach(self) -> None:
+        super().detach()
+        if self._system is not None:
+            self._system.unregister(self)
+
     @override
     def on_removed(self) -> None:
         pass
 
+    @property
+    @override
+    def active(self) -> bool:
+        return self.is_moving and self._system is None
+
     @override
     def update(self) -> None:
+        # Components registered to a MovementSystem are integrated in bulk by the system.
+        if self._system is not None:
+            return
+
         # Correzione: Aggiungere un controllo per l'attributo entity
         if self.is_moving and self.entity is not None:
             x_movement = (self._state[Directions.LEFT][0] - self._state[Directions.RIGHT][0]) * (
@@ -116,8 +257,9 @@ class MovementComponent(BaseComponent):
                 self.speed + self.acceleration
             )
 
-            self.entity.x -= x_movement
-            self.entity.y -= y_movement
+            dx, dy = self.resolve(-x_movement, -y_movement)
+            self.entity.x += round(dx)
+            self.entity.y += round(dy)
 
             for direction in self.movements:
                 if not self._state[direction][1]:
@@ -129,10 +271,13 @@ class MovementComponent(BaseComponent):
 
 
 class AnimationComponent(BaseComponent):
+    __slots__ = ("__fallBackImage", "_system", "animations", "current_sequence")
+
     def __init__(self, **sequences: AnimationSequence) -> None:
         super().__init__()
         self.animations: dict[str, AnimationSequence] = {}
         self.current_sequence: str | None = None
+        self._system: AnimationSystem | None = None
 
         self.add_animation(**sequences)
         self.__fallBackImage: Surface | None = None
@@ -160,6 +305,9 @@ class AnimationComponent(BaseComponent):
 
         if self.current_sequence is not None:
             self.animations[self.current_sequence].__iter__()
+            if self._system is not None:
+                self._system.restart(self)
+        self.wake()
 
     def get_animation_speed(self, animation_key: str | None = None) -> int:
         if animation_key is None:
@@ -171,13 +319,29 @@ class AnimationComponent(BaseComponent):
         return self.animations[animation_key].frame_duration
 
     def set_animation_speed(self, speed: int, animation_key: str | None = None) -> None:
+        """Sets the ms of duration of the frames of an animation sequence.
+
+        Frames with their own durations are scaled so that their mean becomes the given speed,
+        keeping the rhythm of the animation.
+
+        Args:
+            speed (int): ms of duration of each frame, the mean one if frames have their own.
+            animation_key (str, optional): sequence to change. Defaults to None (the current
+                one).
+        """
         if animation_key is None:
             animation_key = self.current_sequence
 
         if animation_key is None:
             return
 
-        self.animations[animation_key].frame_duration = speed
+        animation = self.animations[animation_key]
+        durations = animation.frame_durations
+        mean = animation.frame_duration
+        if mean and len(set(durations)) > 1:
+            animation.frame_duration = [round(duration * speed / mean) for duration in durations]
+        else:
+            animation.frame_duration = speed
 
     def pause(
         self, active: bool, animation_seq: str | None = None, timer: int | None = None
@@ -192,6 +356,14 @@ class AnimationComponent(BaseComponent):
             return
 
         self.animations[animation_seq].running = active
+        if active:
+            self.wake()
+
+    @override
+    def reset(self) -> None:
+        """Restarts the first animation sequence."""
+        if self.animations:
+            self.switch_to(next(iter(self.animations)))
 
     @override
     def on_added(self) -> None:
@@ -199,15 +371,36 @@ class AnimationComponent(BaseComponent):
         if self.entity is not None:
             self.__fallBackImage = self.entity.image
 
+    @override
+    def detach(self) -> None:
+        super().detach()
+        if self._system is not None:
+            self._system.unregister(self)
+
     @override
     def on_removed(self) -> None:
         pass
 
+    @property
+    @override
+    def active(self) -> bool:
+        if self._system is not None or self.current_sequence is None:
+            return False
+        sequence = self.animations.get(self.current_sequence)
+        if sequence is None:
+            return False
+        return sequence.running and (
+            sequence.loop or sequence.current_frame < len(sequence.frames)
+        )
+
     @override
     def update(self) -> None:
         """
-        Updates the image attribute to the next frame of the current playing animation sequence
+        Updates the image attribute to the next frame of the current playing animation sequence,
+        unless the component is ticked in bulk by an AnimationSystem
         """
+        if self._system is not None:
+            return
 
         if any(self.animations) and self.current_sequence is not None:
             try:
@@ -218,40 +411,186 @@ class AnimationComponent(BaseComponent):
                 if self.entity is not None:
                     self.entity.image = self.__fallBackImage
 
+    def advance(self, dt: float) -> None:
+        """
+        Updates the image attribute advancing the current playing animation sequence by dt ms,
+        so that many entities can share a single clock read per frame
+        """
+        if self.current_sequence is not None and self.entity is not None:
+            self.entity.image = self.animations[self.current_sequence].advance(dt)
+
+    @override
+    def draw(self, surface: Surface) -> None:
+        pass
+
+
+class AnimationStateMachine(BaseComponent):
+    """
+    Drives the AnimationComponent of its entity from a declarative table of states and
+    transitions, compiled once into integer indexed lookups.
+    """
+
+    __slots__ = (
+        "_animation",
+        "_indices",
+        "_initial",
+        "_names",
+        "_sequences",
+        "_state",
+        "_transitions",
+    )
+
+    ANY_STATE = "*"
+
+    def __init__(
+        self,
+        states: dict[str, str],
+        transitions: list[tuple[str, str, Callable[[Entity], bool]]],
+        initial: str | None = None,
+    ) -> None:
+        """Compiles the state table.
+
+        Args:
+            states (dict[str, str]): animation sequence key played in each state.
+            transitions (list[tuple[str, str, Callable[[Entity], bool]]]): (source state,
+                target state, condition) triples, checked in order. ANY_STATE as source applies
+                the transition from every state, after the state own transitions.
+            initial (str, optional): starting state. Defaults to the first one.
+
+        Raises:
+            KeyError: if a transition references an unknown state.
+        """
+        super().__init__()
+        self._names: list[str] = list(states)
+        self._indices: dict[str, int] = {name: index for index, name in enumerate(self._names)}
+        self._sequences: list[str] = [states[name] for name in self._names]
+
+        specific: list[list[tuple[Callable[[Entity], bool], int]]] = [[] for _ in states]
+        shared: list[tuple[Callable[[Entity], bool], int]] = []
+        for source, target, condition in transitions:
+            if target not in self._indices:
+                raise KeyError(f"Transition to unknown animation state {target}")
+            if source == self.ANY_STATE:
+                shared.append((condition, self._indices[target]))
+            elif source in self._indices:
+                specific[self._indices[source]].append((condition, self._indices[target]))
+            else:
+                raise KeyError(f"Transition from unknown animation state {source}")
+
+        self._transitions: list[tuple[tuple[Callable[[Entity], bool], int], ...]] = [
+            tuple(own + [(condition, target) for condition, target in shared if target != index])
+            for index, own in enumerate(specific)
+        ]
+        self._initial: int = self._indices[initial] if initial is not None else 0
+        self._state: int = self._initial
+        self._animation: AnimationComponent | None = None
+
+    @property
+    def animation_state(self) -> str:
+        """Returns the name of the current state."""
+        return self._names[self._state]
+
+    def set_state(self, state: str) -> None:
+        """Forces the given state, switching animation only if it differs from the current one.
+
+        Raises:
+            KeyError: if the given state does not exist
+        """
+        if state not in self._indices:
+            raise KeyError(f"This object has no animation state named {state}")
+        self._enter(self._indices[state])
+
+    def _enter(self, state: int) -> None:
+        if state == self._state and self._animation is not None:
+            return
+        self._state = state
+        if self._animation is None and self.entity is not None:
+            component = self.entity.get_component(AnimationComponent)
+            self._animation = component if isinstance(component, AnimationComponent) else None
+        if self._animation is not None:
+            self._animation.switch_to(self._sequences[state])
+
+    @override
+    def reset(self) -> None:
+        """Goes back to the initial state."""
+        self._enter(self._initial)
+
+    @override
+    def on_added(self) -> None:
+        self._animation = None
+        self._enter(self._state)
+
+    @override
+    def on_removed(self) -> None:
+        self._animation = None
+
+    @override
+    def update(self) -> None:
+        """
+        Follows the first transition whose condition holds, switching the animation sequence
+        only when the state actually changes
+        """
+        entity = self.entity
+        if entity is None:
+            return
+        for condition, target in self._transitions[self._state]:
+            if condition(entity):
+                if target != self._state:
+                    self._enter(target)
+                return
+        if self._animation is None:
+            self._enter(self._state)
+
     @override
     def draw(self, surface: Surface) -> None:
         pass
 
 
 class SolidBodyComponent(BaseComponent):
+    __slots__ = ("_world", "hitboxes")
+
     def __init__(self, **boxes: HitBox) -> None:
         super().__init__()
         self.hitboxes: HitBoxDict = HitBoxDict(self, boxes)
+        self._world: CollisionWorld | None = None
 
     @property
     def solid(self) -> bool:
         return bool(self.hitboxes)
 
+    @property
+    @override
+    def active(self) -> bool:
+        # Plain bodies have nothing to update, subclasses overriding update() (triggers,
+        # moving platforms...) are scheduled like any other component.
+        return type(self).update is not SolidBodyComponent.update
+
     def collides_with(self, other: SolidBodyComponent) -> list[tuple[HitBox, HitBox]]:
         """
         Checks all collisions between this component's hitboxes and another's. \n
         Returns a list of tuples of all colliding hitboxes.
         """
         collisions: list[tuple[HitBox, HitBox]] = []
+        if self.entity is None or other.entity is None:
+            return collisions
 
         for hitbox_a in self.hitboxes.values():
-            if self.entity is not None:
-                abs_a = hitbox_a.absolute_rect(self.entity.position)
-                for hitbox_b in other.hitboxes.values():
-                    if other.entity is not None:
-                        abs_b = hitbox_b.absolute_rect(other.entity.position)
-                        if abs_a.colliderect(abs_b):
-                            collisions.append((hitbox_a, hitbox_b))
+            for hitbox_b in other.hitboxes.values():
+                if hitboxes_overlap(hitbox_a, hitbox_b):
+                    collisions.append((hitbox_a, hitbox_b))
         return collisions
 
+    @override
+    def detach(self) -> None:
+        super().detach()
+        if self._world is not None:
+            self._world.remove(self)
+
     @override
     def on_added(self) -> None:
-        pass
+        # World rects cached for a previous entity are stale.
+        for hitbox in self.hitboxes.values():
+            hitbox.invalidate()
 
     @override
     def on_removed(self) -> None:
@@ -1,56 +1,127 @@
-from typing import Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+from weakref import WeakSet
 
 import pygame
 from typing_extensions import override
 
+from apu.core.enums import TileKind
 from apu.objects.components import BaseComponent
 
+C = TypeVar("C", bound=BaseComponent)
 
-class BaseSprite(pygame.sprite.Sprite):
+# Dispatch tables shared by every entity holding the same (slotted) component types.
+_DISPATCH_TABLES: dict[tuple[type[BaseComponent], ...], dict[str, str]] = {}
+
+
+class Entity:
     """
-    Represents a generic static sprite and provides methods
-    to draw itself on the (pygame) display and get the current position/size.
+    Component container behaviour shared by BaseSprite and CompactSprite: components are
+    stored by class name and their attributes are delegated to from the entity.
+    Subclasses provide and initialize the attributes declared below.
     """
 
-    def __init__(
-        self, position: tuple[int, int], layer: int = 0, image: pygame.Surface | None = None
-    ) -> None:
-        """Constructs a sprite object with basic functionality.
-
-        Args:
-            position (tuple): x and y coordinates of the sprite.
-            layer (int, optional): the layer to draw the image to. Defaults to 0.
-            image (pygame.Surface, optional): default image to draw. Defaults to empty surface.
-        """
-        self._layer = layer
-        super().__init__()
-        self.image = image if image is not None else pygame.Surface((0, 0))
-        self.x: int = position[0]
-        self.y: int = position[1]
+    # No instance layout of its own, so BaseSprite keeps the pygame Sprite __dict__ and
+    # CompactSprite can use slots. Hidden from type checkers, which would otherwise reject
+    # assigning the attributes declared by the subclasses.
+    if not TYPE_CHECKING:
+        __slots__ = ()
 
-        self.components: dict[str, BaseComponent] = {}
+    image: pygame.Surface | None
+    layer: int
+    _x: int
+    _y: int
+    _position_version: int
+    components: dict[str, BaseComponent]
+    kind: TileKind | None
+    _dispatch: dict[str, str]
+    _index: "ComponentIndex | None"
 
     def add_component(self, component: BaseComponent) -> None:
         name = type(component).__name__
+        replaced = self.components.get(name)
         self.components[name] = component
+        index = self._index
+        if index is not None:
+            if replaced is not None:
+                index.remove(self, replaced)
+            index.add(self, component)
         component.entity = self
+        self._rebuild_dispatch()
         component.on_added()
+        # Index the attributes the component created while being added.
+        self._rebuild_dispatch()
 
     def remove_component(self, component_type: type[BaseComponent]) -> None:
         comp = self.components.pop(component_type.__name__, None)
         if comp:
+            if self._index is not None:
+                self._index.remove(self, comp)
+            comp.detach()
+            self._rebuild_dispatch()
             comp.on_removed()
 
     def get_component(self, component_type: type[BaseComponent]) -> BaseComponent | None:
         return self.components.get(component_type.__name__)
 
+    def _rebuild_dispatch(self) -> None:
+        """Maps every attribute name of the components to the key of the first one owning it.
+
+        Attributes are indexed when components are added or removed; attributes set on a
+        component afterwards are found by __getattr__ on a miss and added to the table then.
+        Components without an instance __dict__ expose the attributes of their class only, so
+        entities holding the same types of slotted components share a single table.
+        """
+        components = self.components.values()
+        signature = tuple(type(component) for component in components)
+        shareable = not any(hasattr(component, "__dict__") for component in components)
+        dispatch = _DISPATCH_TABLES.get(signature) if shareable else None
+        if dispatch is None:
+            dispatch = {}
+            for key, component in self.components.items():
+                for name in dir(component):
+                    dispatch.setdefault(name, key)
+            if shareable:
+                _DISPATCH_TABLES[signature] = dispatch
+        self._dispatch = dispatch
+
     def __getattr__(self, name: str) -> Any:
         # Delegazione: se l'attributo non esiste nell'entità, cerca nei componenti
-        for component in self.components.values():
-            if hasattr(component, name):
-                return getattr(component, name)
+        if name != "_dispatch":
+            key = self._dispatch.get(name)
+            if key is not None:
+                return getattr(self.components[key], name)
+            for key, component in self.components.items():
+                if hasattr(component, name):
+                    # The table may be shared with other entities, so it is copied on write.
+                    self._dispatch = {**self._dispatch, name: key}
+                    return getattr(component, name)
         raise AttributeError(f"{self.__class__.__name__} has no attribute {name}")
 
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._x = value
+        self._position_version += 1
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._y = value
+        self._position_version += 1
+
+    @property
+    def position_version(self) -> int:
+        """Returns a counter incremented on every position change, so that data derived from
+        the position (e.g. hitbox world rects) can be cached until the entity moves."""
+        return self._position_version
+
     @property
     def position(self) -> tuple[int, int]:
         """Returns a vector of int values (x position, y position)."""
@@ -84,15 +155,15 @@ class BaseSprite(pygame.sprite.Sprite):
         for component in self.components.values():
             component.draw(window)
 
-    @override
     def update(self) -> None:
         for component in self.components.values():
             component.update()
 
     @override
     def __str__(self) -> str:
+        name = type(self).__name__
         result = [
-            f"BaseSprite(position={self.position}, layer={self._layer}, size={self.size})",
+            f"{name}(position={self.position}, layer={self.layer}, size={self.size})",
             "Components:",
         ]
         if self.components:
@@ -103,5 +174,195 @@ class BaseSprite(pygame.sprite.Sprite):
         return "\n".join(result)
 
 
+class BaseSprite(Entity, pygame.sprite.Sprite):
+    """
+    Represents a generic static sprite and provides methods
+    to draw itself on the (pygame) display and get the current position/size.
+    """
+
+    def __init__(
+        self, position: tuple[int, int], layer: int = 0, image: pygame.Surface | None = None
+    ) -> None:
+        """Constructs a sprite object with basic functionality.
+
+        Args:
+            position (tuple): x and y coordinates of the sprite.
+            layer (int, optional): the layer to draw the image to. Defaults to 0.
+            image (pygame.Surface, optional): default image to draw. Defaults to a new 0x0 surface.
+        """
+        self._layer = layer
+        super().__init__()
+        self.image = image if image is not None else pygame.Surface((0, 0))
+        self._position_version = 0
+        self.x = position[0]
+        self.y = position[1]
+
+        self.components: dict[str, BaseComponent] = {}
+        self.kind: TileKind | None = None
+        self._dispatch: dict[str, str] = {}
+        self._index: ComponentIndex | None = None
+
+    @override
+    def update(self) -> None:
+        Entity.update(self)
+
+
+class CompactSprite(Entity):
+    """
+    Memory compact variant of BaseSprite for the bulk of map tiles: its attributes are stored
+    in slots instead of a per-instance __dict__. It is not a pygame Sprite, so it cannot be
+    added to sprite groups (use BaseSprite for entities that need them) and it does not
+    accept attributes other than its own.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_dispatch",
+        "_index",
+        "_position_version",
+        "_x",
+        "_y",
+        "components",
+        "image",
+        "kind",
+        "layer",
+    )
+
+    def __init__(
+        self, position: tuple[int, int], layer: int = 0, image: pygame.Surface | None = None
+    ) -> None:
+        """Constructs a compact sprite.
+
+        Args:
+            position (tuple): x and y coordinates of the sprite.
+            layer (int, optional): the layer to draw the image to. Defaults to 0.
+            image (pygame.Surface, optional): default image to draw. Defaults to a new 0x0 surface.
+        """
+        self.layer = layer
+        self.image = image if image is not None else pygame.Surface((0, 0))
+        self._position_version = 0
+        self._x = position[0]
+        self._y = position[1]
+        self.components = {}
+        self.kind = None
+        self._dispatch = {}
+        self._index = None
+
+
+class ComponentIndex:
+    """Component type index
+
+    Tracks, for every component type, the entities holding a component of that type (or of a
+    subclass of it), so that systems can iterate over just the entities they care about. Each
+    world (scene, level...) keeps its own index of the entities it tracks, which is then kept
+    up to date by add_component() and remove_component(). Entities are referenced weakly and
+    components are looked up on them, so discarded entities leave the index on their own.
+    """
+
+    def __init__(self) -> None:
+        self._tables: dict[type[BaseComponent], WeakSet[Entity]] = {}
+        self._lineages: dict[type[BaseComponent], tuple[type[BaseComponent], ...]] = {}
+
+    def __contains__(self, entity: object) -> bool:
+        return isinstance(entity, Entity) and entity._index is self
+
+    def _lineage(self, component_type: type[BaseComponent]) -> tuple[type[BaseComponent], ...]:
+        lineage = self._lineages.get(component_type)
+        if lineage is None:
+            lineage = tuple(
+                base
+                for base in component_type.__mro__
+                if isinstance(base, type)
+                and issubclass(base, BaseComponent)
+                and base is not BaseComponent
+            )
+            self._lineages[component_type] = lineage
+        return lineage
+
+    @staticmethod
+    def _component(entity: Entity, component_type: type[C]) -> C | None:
+        component = entity.components.get(component_type.__name__)
+        if isinstance(component, component_type):
+            return component
+        for component in entity.components.values():
+            if isinstance(component, component_type):
+                return component
+        return None
+
+    def track(self, entity: Entity) -> None:
+        """Starts indexing the components of an entity, current and future ones.
+
+        Raises:
+            ValueError: if the entity is tracked by another index.
+        """
+        if entity._index is self:
+            return
+        if entity._index is not None:
+            raise ValueError("This entity is tracked by another component index")
+        entity._index = self
+        for component in entity.components.values():
+            self.add(entity, component)
+
+    def untrack(self, entity: Entity) -> None:
+        """Drops an entity from the index."""
+        if entity._index is not self:
+            return
+        entity._index = None
+        for component in entity.components.values():
+            for component_type in self._lineage(type(component)):
+                self._tables[component_type].discard(entity)
+
+    def add(self, entity: Entity, component: BaseComponent) -> None:
+        """Indexes an entity under the type and base types of one of its components."""
+        for component_type in self._lineage(type(component)):
+            table = self._tables.get(component_type)
+            if table is None:
+                table = self._tables[component_type] = WeakSet()
+            table.add(entity)
+
+    def remove(self, entity: Entity, component: BaseComponent) -> None:
+        """Drops an entity from the types of a removed component no other one of it matches."""
+        for component_type in self._lineage(type(component)):
+            table = self._tables.get(component_type)
+            if table is not None and self._component(entity, component_type) is None:
+                table.discard(entity)
+
+    def count(self, component_type: type[BaseComponent]) -> int:
+        """Returns the number of entities holding a component of the given type."""
+        table = self._tables.get(component_type)
+        return len(table) if table is not None else 0
+
+    def entities(self, component_type: type[BaseComponent]) -> list[Entity]:
+        """Returns the entities holding a component of the given type.
+
+        Args:
+            component_type (type[BaseComponent]): component class, subclasses match too.
+
+        Returns:
+            list[Entity]: a snapshot, so components can be added or removed while iterating.
+        """
+        table = self._tables.get(component_type)
+        return list(table) if table is not None else []
+
+    def components(self, component_type: type[C]) -> list[C]:
+        """Returns the components of the given type held by any entity.
+
+        Args:
+            component_type (type[BaseComponent]): component class, subclasses match too.
+
+        Returns:
+            list[BaseComponent]: a snapshot, so components can be added or removed while
+                iterating.
+        """
+        return [component for _, component in self.items(component_type)]
+
+    def items(self, component_type: type[C]) -> Iterator[tuple[Entity, C]]:
+        """Yields (entity, component) pairs for the components of the given type."""
+        for entity in self.entities(component_type):
+            component = self._component(entity, component_type)
+            if component is not None:
+                yield entity, component
+
+
 if __name__ == "__main__":
     print("All imports working!")
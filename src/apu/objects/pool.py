@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+import pygame
+
+from apu.objects.entities import Entity
+
+E = TypeVar("E", bound=Entity)
+
+
+class EntityPool(Generic[E]):
+    """Entity pool
+
+    Recycles short lived entities (projectiles, particles...) of a single archetype: released
+    entities are reset and kept, then handed out again by acquire(), so spawning does not
+    allocate sprites, components and their dicts on every shot.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], E],
+        reset: Callable[[E], None] | None = None,
+        capacity: int | None = None,
+        prefill: int = 0,
+    ) -> None:
+        """Constructs a pool.
+
+        Args:
+            factory (Callable[[], Entity]): builds a new entity, with all of its components.
+            reset (Callable[[Entity], None], optional): restores the archetype state of a
+                released entity, after its components have been reset. Defaults to None.
+            capacity (int, optional): maximum free entities kept, the others are discarded.
+                Defaults to None (no limit).
+            prefill (int, optional): entities built upfront. Defaults to 0.
+        """
+        self.factory = factory
+        self.reset = reset
+        self.capacity = capacity
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.peak = 0
+
+        self._free: list[E] = []
+        self._in_use: set[E] = set()
+        for _ in range(prefill):
+            self._free.append(self._create())
+
+    def __len__(self) -> int:
+        return len(self._free) + len(self._in_use)
+
+    @property
+    def free(self) -> int:
+        """Returns the number of entities ready to be acquired."""
+        return len(self._free)
+
+    @property
+    def in_use(self) -> int:
+        """Returns the number of acquired entities not released yet."""
+        return len(self._in_use)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns the pool counters: created, reused, discarded, free, in_use and peak."""
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "free": self.free,
+            "in_use": self.in_use,
+            "peak": self.peak,
+        }
+
+    def _create(self) -> E:
+        self.created += 1
+        return self.factory()
+
+    def acquire(self, position: tuple[int, int] | None = None) -> E:
+        """Returns a free entity, building a new one only when the pool is empty.
+
+        Args:
+            position (tuple[int, int], optional): position given to the entity.
+                Defaults to None (keep the current one).
+        """
+        if self._free:
+            entity = self._free.pop()
+            self.reused += 1
+        else:
+            entity = self._create()
+
+        if position is not None:
+            entity.x, entity.y = position
+        self._in_use.add(entity)
+        self.peak = max(self.peak, len(self._in_use))
+        return entity
+
+    def release(self, entity: E) -> None:
+        """Resets an acquired entity and gives it back to the pool.
+
+        The entity is removed from every sprite group and from its component index, its
+        components are detached from their schedulers, systems and collision worlds and then
+        reset, so free entities are neither updated nor collided. Register them again after
+        acquire().
+
+        Raises:
+            ValueError: if the entity was not acquired from this pool or already released.
+        """
+        if entity not in self._in_use:
+            raise ValueError("This entity is not in use from this pool")
+        self._in_use.discard(entity)
+
+        if isinstance(entity, pygame.sprite.Sprite):
+            pygame.sprite.Sprite.kill(entity)
+        if entity._index is not None:
+            entity._index.untrack(entity)
+        for component in entity.components.values():
+            component.detach()
+            component.reset()
+        if self.reset is not None:
+            self.reset(entity)
+
+        if self.capacity is not None and len(self._free) >= self.capacity:
+            self.discarded += 1
+            return
+        self._free.append(entity)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+import pygame
+
+
+class Presenter:
+    """Render presenter
+
+    Owns the virtual display the game is drawn to and scales it to the window. The scaled image
+    is written straight into a preallocated region of the window surface, so no full-screen
+    surface is allocated per frame. Per-stage timings of the last presented frame are exposed
+    in the timings dict (ms).
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        window: pygame.Surface | None = None,
+        integer_scaling: bool = True,
+        letterbox: bool = True,
+        background: pygame.Color | tuple[int, int, int] = (0, 0, 0),
+    ) -> None:
+        """Constructs a presenter and its virtual display.
+
+        Args:
+            size (tuple[int, int]): virtual display resolution.
+            window (pygame.Surface, optional): surface to present to. Defaults to None (the
+                current display surface, looked up on every frame).
+            integer_scaling (bool, optional): when True, the virtual display is scaled by the
+                largest integer factor fitting the window. Defaults to True.
+            letterbox (bool, optional): when True, the aspect ratio is preserved and the image
+                is centered, filling the borders with the background color. When False, the
+                image is stretched over the whole window. Defaults to True.
+            background (pygame.Color, optional): color of the letterbox borders.
+                Defaults to black.
+        """
+        self.integer_scaling = integer_scaling
+        self.letterbox = letterbox
+        self.background = background
+        self.timings: dict[str, float] = {"scale": 0.0, "flip": 0.0}
+
+        self._window = window
+        self.virtual_display = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.virtual_display = self.virtual_display.convert()
+
+        self._target_window: pygame.Surface | None = None
+        self._target_size: tuple[int, int] = (0, 0)
+        self._target: pygame.Surface | None = None
+        self._borders: list[pygame.Rect] = []
+        self.viewport = pygame.Rect(0, 0, 0, 0)
+
+    @property
+    def window(self) -> pygame.Surface:
+        """Returns the surface presented to."""
+        window = self._window if self._window is not None else pygame.display.get_surface()
+        if window is None:
+            raise RuntimeError("No window to present to: the display mode has not been set")
+        return window
+
+    def _layout(self, window: pygame.Surface) -> pygame.Surface:
+        """Computes the viewport for the current window size and preallocates its target."""
+        window_w, window_h = window.get_size()
+        virtual_w, virtual_h = self.virtual_display.get_size()
+
+        if self.integer_scaling and window_w >= virtual_w and window_h >= virtual_h:
+            factor = min(window_w // virtual_w, window_h // virtual_h)
+            if self.letterbox:
+                size = (virtual_w * factor, virtual_h * factor)
+            else:
+                size = (window_w, window_h)
+        elif self.letterbox:
+            ratio = min(window_w / virtual_w, window_h / virtual_h)
+            size = (max(1, int(virtual_w * ratio)), max(1, int(virtual_h * ratio)))
+        else:
+            size = (window_w, window_h)
+
+        self.viewport = pygame.Rect((0, 0), size)
+        self.viewport.center = window.get_rect().center
+        self._target = window.subsurface(self.viewport)
+        self._target_window = window
+        self._target_size = (window_w, window_h)
+
+        full = window.get_rect()
+        self._borders = [
+            rect
+            for rect in (
+                pygame.Rect(0, 0, full.w, self.viewport.top),
+                pygame.Rect(0, self.viewport.bottom, full.w, full.h - self.viewport.bottom),
+                pygame.Rect(0, self.viewport.top, self.viewport.left, self.viewport.h),
+                pygame.Rect(
+                    self.viewport.right,
+                    self.viewport.top,
+                    full.w - self.viewport.right,
+                    self.viewport.h,
+                ),
+            )
+            if rect.w > 0 and rect.h > 0
+        ]
+        return self._target
+
+    def scale(self) -> None:
+        """Scales the virtual display into the window, filling the letterbox borders."""
+        start = perf_counter()
+        window = self.window
+        target = self._target
+        if (
+            target is None
+            or window is not self._target_window
+            or window.get_size() != self._target_size
+        ):
+            target = self._layout(window)
+
+        for border in self._borders:
+            window.fill(self.background, border)
+
+        if self.viewport.size == self.virtual_display.get_size():
+            target.blit(self.virtual_display, (0, 0))
+        else:
+            pygame.transform.scale(self.virtual_display, self.viewport.size, target)
+        self.timings["scale"] = (perf_counter() - start) * 1000
+
+    def present(self) -> None:
+        """Scales the virtual display into the window and flips the display."""
+        self.scale()
+        start = perf_counter()
+        pygame.display.flip()
+        self.timings["flip"] = (perf_counter() - start) * 1000
+
+    def to_virtual(self, position: tuple[int, int]) -> tuple[int, int]:
+        """Converts a window position (e.g. the mouse one) to virtual display coordinates.
+
+        Args:
+            position (tuple[int, int]): (x, y) window coordinates.
+
+        Returns:
+            tuple[int, int]: (x, y) virtual display coordinates.
+        """
+        if self._target is None:
+            self._layout(self.window)
+        virtual_w, virtual_h = self.virtual_display.get_size()
+        return (
+            (position[0] - self.viewport.x) * virtual_w // max(1, self.viewport.w),
+            (position[1] - self.viewport.y) * virtual_h // max(1, self.viewport.h),
+        )
@@ -4,8 +4,10 @@ from typing import Any
 import pygame
 from typing_extensions import override
 
-from apu.core.enums import NEIGHBOUR_MATRIX
-from apu.objects.entities import BaseSprite
+from apu.core.enums import NEIGHBOUR_MATRIX, TileKind
+from apu.core.tools import ImageTools
+from apu.objects.components import AnimationComponent, SolidBodyComponent
+from apu.objects.entities import Entity
 
 
 class Scene:
@@ -29,30 +31,117 @@ class Scene:
 
 
 class TiledScene(Scene):
-    def __init__(self, tile_size: int, *items: BaseSprite) -> None:
-        self.tiles: dict[int, dict[tuple[int, int], BaseSprite]] = {}
+    """
+    Grid of tiles split by layer. Static tiles (see TileKind) are baked into a few chunk
+    surfaces per layer, so they cost a handful of blits per frame and no updates; only
+    animated and solid tiles are drawn one by one, and only animated ones are updated.
+    """
+
+    def __init__(self, tile_size: int, *items: Entity, chunk_size: int = 512) -> None:
+        """Constructs a scene.
+
+        Args:
+            tile_size (int): size of the tiles, in pixels.
+            *items (Entity): tiles to insert.
+            chunk_size (int, optional): size of the surfaces static tiles are baked into, in
+                pixels. Defaults to 512.
+        """
+        self.tiles: dict[int, dict[tuple[int, int], Entity]] = {}
         self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self._baked: dict[int, list[tuple[pygame.Surface, tuple[int, int]]]] = {}
+        self._dynamic: dict[int, list[Entity]] = {}
+        self._animated: dict[int, list[Entity]] = {}
+        self._dirty: set[int] = set()
         self.insert(*items)
 
     @override
-    def insert(self, *items: BaseSprite) -> None:
+    def insert(self, *items: Entity) -> None:
         for tile in items:
             if tile.layer not in self.tiles:
                 self.tiles[tile.layer] = {}
             self.tiles[tile.layer][tile.position] = tile
+            self._dirty.add(tile.layer)
+
+    def invalidate(self, layer: int | None = None) -> None:
+        """Rebakes the static tiles of a layer (or of every layer) before the next render,
+        e.g. after changing their images or kind.
+        """
+        self._dirty.update(self.tiles if layer is None else (layer,))
+
+    @staticmethod
+    def kind(tile: Entity) -> TileKind:
+        """Returns the kind set by the map loader, or the one matching the tile components."""
+        if tile.kind is not None:
+            return tile.kind
+        kind = TileKind.STATIC
+        if tile.get_component(SolidBodyComponent) is not None:
+            kind |= TileKind.SOLID
+        if tile.get_component(AnimationComponent) is not None:
+            kind |= TileKind.ANIMATED
+        return kind
+
+    def _bake(self, layer: int) -> None:
+        size = self.chunk_size
+        chunks: dict[tuple[int, int], pygame.Surface] = {}
+        dynamic: list[Entity] = []
+        animated: list[Entity] = []
+
+        for tile in self.tiles[layer].values():
+            kind = self.kind(tile)
+            if kind != TileKind.STATIC:
+                dynamic.append(tile)
+                if kind & TileKind.ANIMATED:
+                    animated.append(tile)
+                continue
+            if tile.image is None:
+                continue
+            x, y = tile.position
+            width, height = tile.image.get_size()
+            if not (width and height):
+                continue
+            # Tiles are usually aligned to the chunks, but may straddle some of them.
+            for chunk_x in range(x // size, (x + width - 1) // size + 1):
+                for chunk_y in range(y // size, (y + height - 1) // size + 1):
+                    chunk = chunks.get((chunk_x, chunk_y))
+                    if chunk is None:
+                        chunk = pygame.Surface((size, size), pygame.SRCALPHA)
+                        chunks[(chunk_x, chunk_y)] = chunk
+                    chunk.blit(tile.image, (x - chunk_x * size, y - chunk_y * size))
+
+        self._baked[layer] = [
+            (ImageTools.optimize(chunk)[0], (chunk_x * size, chunk_y * size))
+            for (chunk_x, chunk_y), chunk in chunks.items()
+        ]
+        self._dynamic[layer] = dynamic
+        self._animated[layer] = animated
+
+    def _refresh(self) -> None:
+        for layer in self._dirty:
+            if layer in self.tiles:
+                self._bake(layer)
+        self._dirty.clear()
 
     @override
     def render(self, window: pygame.surface.Surface, offset: tuple[int, int] = (0, 0)) -> None:
+        if self._dirty:
+            self._refresh()
         for layer in self.tiles:
-            for position in self.tiles[layer]:
-                self.tiles[layer][position].draw(window)
+            window.blits(self._baked[layer], doreturn=False)
+            for tile in self._dynamic[layer]:
+                tile.draw(window)
 
     @override
     def update(self, offset: tuple[int, int] = (0, 0)) -> None:
-        pass
+        """Updates the animated tiles only."""
+        if self._dirty:
+            self._refresh()
+        for layer in self.tiles:
+            for tile in self._animated[layer]:
+                tile.update()
 
     @override
-    def neighbours(self, item: BaseSprite) -> list[BaseSprite]:
+    def neighbours(self, item: Entity) -> list[Entity]:
         position = item.position
         layer = item.layer
         neighbour_tiles = []
@@ -67,7 +156,7 @@ class TiledScene(Scene):
         return neighbour_tiles
 
     @override
-    def __iter__(self) -> Iterator[BaseSprite]:
+    def __iter__(self) -> Iterator[Entity]:
         seen = set()
         for layer in sorted(self.tiles.keys()):
             for sprite in self.tiles[layer].values():
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+
+from apu.core.spritesheet import AnimationSequence
+from apu.events import AnimationFinished, Channel
+from apu.objects.components import AnimationComponent
+
+
+class AnimationSystem:
+    """Animation system
+
+    Ticks every registered AnimationComponent in bulk. The playback state of each component
+    (current sequence, elapsed time, frame timeline and shown frame) is kept in parallel lists
+    indexed by slot, so a single pass advances all of them and entity images are written only
+    for the entities whose frame actually changed.
+
+    The state lives in the system rather than in the sequences, so many entities can play the
+    same AnimationSequence object (as map tiles do) at independent phases.
+    """
+
+    def __init__(self, events: Channel[AnimationFinished] | None = None) -> None:
+        """Constructs an empty animation system.
+
+        Args:
+            events (Channel[AnimationFinished], optional): channel an AnimationFinished event
+                is posted to when a non looping sequence reaches its last frame.
+                Defaults to None.
+        """
+        self.events = events
+        self._components: list[AnimationComponent] = []
+        self._slots: dict[int, int] = {}
+        self._sequences: list[AnimationSequence | None] = []
+        self._timelines: list[list[int]] = []
+        self._elapsed: list[float] = []
+        self._frames: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def __contains__(self, component: object) -> bool:
+        return id(component) in self._slots
+
+    def register(self, component: AnimationComponent) -> None:
+        """Starts ticking the given component in bulk, its own update() becomes a no-op.
+
+        Args:
+            component (AnimationComponent): component to register.
+
+        Raises:
+            ValueError: if the component is already registered to another system.
+        """
+        if component._system is self:
+            return
+        if component._system is not None:
+            raise ValueError("This animation component is registered to another system")
+
+        self._slots[id(component)] = len(self._components)
+        self._components.append(component)
+        self._sequences.append(None)
+        self._timelines.append([])
+        self._elapsed.append(0.0)
+        self._frames.append(-1)
+        component._system = self
+        self.restart(component)
+
+    def unregister(self, component: AnimationComponent) -> None:
+        """Stops ticking the given component, which goes back to updating itself.
+
+        Args:
+            component (AnimationComponent): component to unregister.
+        """
+        slot = self._slots.pop(id(component), None)
+        if slot is None:
+            return
+        component._system = None
+
+        last = len(self._components) - 1
+        if slot != last:
+            moved = self._components[last]
+            self._components[slot] = moved
+            self._sequences[slot] = self._sequences[last]
+            self._timelines[slot] = self._timelines[last]
+            self._elapsed[slot] = self._elapsed[last]
+            self._frames[slot] = self._frames[last]
+            self._slots[id(moved)] = slot
+
+        self._components.pop()
+        self._sequences.pop()
+        self._timelines.pop()
+        self._elapsed.pop()
+        self._frames.pop()
+
+    def restart(self, component: AnimationComponent) -> None:
+        """Restarts the playback of the current sequence of a registered component.
+
+        Called by AnimationComponent.switch_to().
+
+        Args:
+            component (AnimationComponent): registered component.
+        """
+        slot = self._slots[id(component)]
+        key = component.current_sequence
+        sequence = component.animations[key] if key is not None else None
+        self._sequences[slot] = sequence
+        self._timelines[slot] = sequence.timeline if sequence is not None else []
+        self._elapsed[slot] = 0.0
+        self._frames[slot] = -1
+
+    def update(self, dt: float) -> None:
+        """Advances every registered component by dt ms.
+
+        Args:
+            dt (float): ms elapsed since the previous update.
+        """
+        components = self._components
+        timelines = self._timelines
+        elapsed = self._elapsed
+        frames = self._frames
+
+        for slot, sequence in enumerate(self._sequences):
+            if sequence is None or not sequence.running:
+                continue
+
+            timeline = timelines[slot]
+            count = len(timeline)
+            if count == 0:
+                continue
+            total = timeline[-1]
+            previous = frames[slot]
+            finished = False
+
+            if total <= 0:
+                index = previous + 1
+                if index >= count:
+                    index = 0 if sequence.loop or previous < 0 else count - 1
+                finished = not sequence.loop and index == count - 1 and previous != index
+            else:
+                time = elapsed[slot] + dt
+                if time >= total:
+                    if sequence.loop:
+                        time %= total
+                    else:
+                        finished = elapsed[slot] < total
+                        time = total
+                elapsed[slot] = time
+                index = bisect_right(timeline, time) if time < total else count - 1
+
+            if finished and self.events is not None:
+                key = components[slot].current_sequence
+                if key is not None:
+                    self.events.post(AnimationFinished(components[slot], key))
+
+            if index != previous:
+                frames[slot] = index
+                entity = components[slot].entity
+                if entity is not None:
+                    entity.image = sequence.frames[index]
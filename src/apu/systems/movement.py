@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from apu.core.enums import Directions
+from apu.objects.components import MovementComponent
+
+
+class MovementSystem:
+    """Movement system
+
+    Integrates every registered MovementComponent in bulk. Float positions and velocities are
+    kept in parallel lists indexed by slot: velocities are recomputed only when a component
+    starts or stops moving or changes speed, and a single pass per frame integrates them with
+    the given dt, writing the integer entity position only for entities whose rounded position
+    changed.
+    Components with a collider have their displacement resolved against it first.
+    """
+
+    def __init__(self) -> None:
+        self._components: list[MovementComponent] = []
+        self._slots: dict[int, int] = {}
+        self._px: list[float] = []
+        self._py: list[float] = []
+        self._vx: list[float] = []
+        self._vy: list[float] = []
+        self._ix: list[int] = []
+        self._iy: list[int] = []
+        self._oneshot: list[bool] = []
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def __contains__(self, component: object) -> bool:
+        return id(component) in self._slots
+
+    def register(self, component: MovementComponent) -> None:
+        """Starts integrating the given component in bulk, its own update() becomes a no-op.
+
+        Args:
+            component (MovementComponent): component to register, already added to an entity.
+
+        Raises:
+            ValueError: if the component has no entity or belongs to another system.
+        """
+        if component._system is self:
+            return
+        if component._system is not None:
+            raise ValueError("This movement component is registered to another system")
+        if component.entity is None:
+            raise ValueError("Only components added to an entity can be registered")
+
+        self._slots[id(component)] = len(self._components)
+        self._components.append(component)
+        self._px.append(float(component.entity.x))
+        self._py.append(float(component.entity.y))
+        self._ix.append(component.entity.x)
+        self._iy.append(component.entity.y)
+        self._vx.append(0.0)
+        self._vy.append(0.0)
+        self._oneshot.append(False)
+        component._system = self
+        self.refresh(component)
+
+    def unregister(self, component: MovementComponent) -> None:
+        """Stops integrating the given component, which goes back to updating itself.
+
+        Args:
+            component (MovementComponent): component to unregister.
+        """
+        slot = self._slots.pop(id(component), None)
+        if slot is None:
+            return
+        component._system = None
+
+        last = len(self._components) - 1
+        if slot != last:
+            moved = self._components[last]
+            self._components[slot] = moved
+            self._px[slot] = self._px[last]
+            self._py[slot] = self._py[last]
+            self._vx[slot] = self._vx[last]
+            self._vy[slot] = self._vy[last]
+            self._ix[slot] = self._ix[last]
+            self._iy[slot] = self._iy[last]
+            self._oneshot[slot] = self._oneshot[last]
+            self._slots[id(moved)] = slot
+
+        self._components.pop()
+        self._px.pop()
+        self._py.pop()
+        self._vx.pop()
+        self._vy.pop()
+        self._ix.pop()
+        self._iy.pop()
+        self._oneshot.pop()
+
+    def refresh(self, component: MovementComponent) -> None:
+        """Recomputes the velocity of a registered component from its moving directions.
+
+        Called by MovementComponent.move(), stop() and when its speed or acceleration change.
+
+        Args:
+            component (MovementComponent): registered component.
+        """
+        slot = self._slots[id(component)]
+        state = component._state
+        speed = component.speed + component.acceleration
+        self._vx[slot] = (state[Directions.RIGHT][0] - state[Directions.LEFT][0]) * speed
+        self._vy[slot] = (state[Directions.DOWN][0] - state[Directions.UP][0]) * speed
+        self._oneshot[slot] = any(moving and not loop for moving, loop in state.values())
+
+    def update(self, dt: float = 1.0) -> None:
+        """Moves every registered entity by its velocity * dt.
+
+        Args:
+            dt (float, optional): time step, as returned by core.tools.delta_time.
+                Defaults to 1.0 (one frame at the target frame rate).
+        """
+        components = self._components
+        px, py, ix, iy = self._px, self._py, self._ix, self._iy
+        oneshots = []
+
+        for slot, (vx, vy) in enumerate(zip(self._vx, self._vy, strict=True)):
+            if not (vx or vy):
+                continue
+            entity = components[slot].entity
+            if entity is None:
+                continue
+
+            # Positions set from outside the system win over the float ones.
+            if entity.x != ix[slot]:
+                px[slot] = ix[slot] = entity.x
+            if entity.y != iy[slot]:
+                py[slot] = iy[slot] = entity.y
+
+            dx, dy = components[slot].resolve(vx * dt, vy * dt)
+            x = px[slot] = px[slot] + dx
+            y = py[slot] = py[slot] + dy
+            new_x = int(x // 1)
+            new_y = int(y // 1)
+            if new_x != ix[slot]:
+                ix[slot] = entity.x = new_x
+            if new_y != iy[slot]:
+                iy[slot] = entity.y = new_y
+
+            if self._oneshot[slot]:
+                oneshots.append(components[slot])
+
+        for component in oneshots:
+            for direction, (moving, loop) in list(component._state.items()):
+                if moving and not loop:
+                    component.stop(direction)
+
+    def position(self, component: MovementComponent) -> tuple[float, float]:
+        """Returns the subpixel position of a registered component entity."""
+        slot = self._slots[id(component)]
+        return self._px[slot], self._py[slot]
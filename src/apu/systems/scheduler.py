@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from apu.objects.components import BaseComponent
+from apu.objects.entities import Entity
+
+
+class UpdateScheduler:
+    """Update scheduler
+
+    Calls update() on the registered components that are actually doing something. After
+    each update a component whose active property turned False is moved to a sleeping set and
+    skipped by the following frames, until it is woken up by its own wake() (called by
+    MovementComponent.move(), AnimationComponent.switch_to() and pause()) or by the
+    scheduler wake() method. The per-frame cost scales with the active components only.
+    """
+
+    def __init__(self) -> None:
+        self._active: dict[int, BaseComponent] = {}
+        self._sleeping: dict[int, BaseComponent] = {}
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._sleeping)
+
+    def __contains__(self, component: object) -> bool:
+        return id(component) in self._active or id(component) in self._sleeping
+
+    @property
+    def active_count(self) -> int:
+        """Returns the number of components updated by the next frame."""
+        return len(self._active)
+
+    @property
+    def sleeping_count(self) -> int:
+        """Returns the number of components skipped until woken up."""
+        return len(self._sleeping)
+
+    def register(self, component: BaseComponent) -> None:
+        """Starts scheduling the updates of the given component.
+
+        Raises:
+            ValueError: if the component is registered to another scheduler.
+        """
+        if component._scheduler is self:
+            return
+        if component._scheduler is not None:
+            raise ValueError("This component is registered to another scheduler")
+        component._scheduler = self
+        if component.active:
+            self._active[id(component)] = component
+        else:
+            self._sleeping[id(component)] = component
+
+    def register_entity(self, entity: Entity) -> None:
+        """Registers every component currently held by the given entity."""
+        for component in entity.components.values():
+            self.register(component)
+
+    def unregister(self, component: BaseComponent) -> None:
+        """Stops scheduling the updates of the given component."""
+        if component._scheduler is not self:
+            return
+        component._scheduler = None
+        self._active.pop(id(component), None)
+        self._sleeping.pop(id(component), None)
+
+    def unregister_entity(self, entity: Entity) -> None:
+        """Unregisters every component currently held by the given entity."""
+        for component in entity.components.values():
+            self.unregister(component)
+
+    def wake(self, component: BaseComponent) -> None:
+        """Moves a sleeping component back to the update list, e.g. after an external event."""
+        key = id(component)
+        if key in self._sleeping:
+            self._active[key] = self._sleeping.pop(key)
+
+    def wake_entity(self, entity: Entity) -> None:
+        """Wakes every registered component of the given entity."""
+        for component in entity.components.values():
+            self.wake(component)
+
+    def update(self, dt: float = 1.0) -> None:
+        """Updates every active component, putting to sleep the ones that became inactive.
+
+        Args:
+            dt (float, optional): unused, components update by a frame per call. Accepted so
+                the scheduler can run in a SystemPipeline. Defaults to 1.0.
+        """
+        for key, component in list(self._active.items()):
+            component.update()
+            if not component.active and key in self._active:
+                self._sleeping[key] = self._active.pop(key)
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 import os
 from pathlib import Path
 import sys
@@ -9,11 +10,27 @@ from apu.core.enums import Directions
 from apu.core.spritesheet import AnimationSequence, SpriteSheet
 import apu.font
 from apu.loading import TiledMapLoader
-from apu.objects.components import AnimationComponent, MovementComponent, SolidBodyComponent
+from apu.loop import GameLoop
+from apu.objects.components import (
+    AnimationComponent,
+    AnimationStateMachine,
+    MovementComponent,
+    SolidBodyComponent,
+)
 import apu.objects.entities
+from apu.objects.entities import ComponentIndex, Entity
+from apu.render import Presenter
 from apu.scene import TiledScene
 
 
+def idle_towards(direction: Directions) -> Callable[[Entity], bool]:
+    return lambda player: not player.is_moving and player.facing_direction == direction
+
+
+def walking_towards(direction: Directions) -> Callable[[Entity], bool]:
+    return lambda player: player.is_moving and player.facing_direction == direction
+
+
 class Game:
     def __init__(self) -> None:
         pygame.init()
@@ -51,15 +68,20 @@ class Game:
             ).mirror(),
         }
 
-        self.virtual_display = pygame.Surface((640, 360))
+        self.presenter = Presenter((640, 360))
+        self.virtual_display = self.presenter.virtual_display
         self.clock = pygame.time.Clock()
         self.font = apu.font.Font(self._assets_path + "small_font.png", pygame.Color(0, 0, 0))
-        self.running = False
+        self.loop = GameLoop(self.update_state, self.render_frame, self.handle_events)
 
         map_sprites = TiledMapLoader().load(self._assets_path + "map.json", self._assets_path)
         self.tiled_map = TiledScene(16, *map_sprites)
+        self.index = ComponentIndex()
+        for sprite in map_sprites:
+            self.index.track(sprite)
 
         self.player = apu.objects.entities.BaseSprite(position=(304, 164))
+        self.index.track(self.player)
 
         self.player.add_component(MovementComponent(speed=2))
 
@@ -72,6 +94,23 @@ class Game:
             )
         )
 
+        self.player.add_component(
+            AnimationStateMachine(
+                states={
+                    "idle_right": "idle_right",
+                    "idle_left": "idle_left",
+                    "walk_right": "walk_right",
+                    "walk_left": "walk_left",
+                },
+                transitions=[
+                    ("*", "idle_left", idle_towards(Directions.LEFT)),
+                    ("*", "idle_right", idle_towards(Directions.RIGHT)),
+                    ("*", "walk_left", walking_towards(Directions.LEFT)),
+                    ("*", "walk_right", walking_towards(Directions.RIGHT)),
+                ],
+            )
+        )
+
         self.player.add_component(
             SolidBodyComponent(
                 box1=HitBox(pygame.rect.Rect((0, 0), (8, 16))),
@@ -84,7 +123,7 @@ class Game:
     def handle_events(self) -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self.running = False
+                self.loop.stop()
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
                     self.player.move(Directions.UP, True)
@@ -97,12 +136,11 @@ class Game:
                 if event.key == pygame.K_f:
                     pygame.display.toggle_fullscreen()
                 if event.key == pygame.K_h:
-                    for sprite in self.tiled_map:
-                        if hasattr(sprite, "hitboxes"):
-                            for hitbox in sprite.hitboxes.values():
-                                hitbox.visible = not hitbox.visible
+                    for body in self.index.components(SolidBodyComponent):
+                        for hitbox in body.hitboxes.values():
+                            hitbox.visible = not hitbox.visible
                 if event.key == pygame.K_q:
-                    self.running = False
+                    self.loop.stop()
             if event.type == pygame.KEYUP:
                 if event.key == pygame.K_UP:
                     self.player.stop(Directions.UP)
@@ -122,45 +160,18 @@ class Game:
         self.font.render(self.virtual_display, "Press 'f' to toggle fullscreen", (522, 5))
         self.font.render(self.virtual_display, "Press 'h' to toggle hitboxes", (522, 15))
         self.font.render(self.virtual_display, "Press 'q' to quit", (522, 25))
-        self.screen.blit(
-            pygame.transform.scale(self.virtual_display, self.screen.get_size()), (0, 0)
-        )
 
-    def update_state(self) -> None:
-        if not self.player.is_moving:
-            if (
-                self.player.facing_direction == Directions.LEFT
-                and self.player.current_sequence != "idle_left"
-            ):
-                self.player.switch_to("idle_left")
-            if (
-                self.player.facing_direction == Directions.RIGHT
-                and self.player.current_sequence != "idle_right"
-            ):
-                self.player.switch_to("idle_right")
-        else:
-            if (
-                self.player.facing_direction == Directions.LEFT
-                and self.player.current_sequence != "walk_left"
-            ):
-                self.player.switch_to("walk_left")
-            if (
-                self.player.facing_direction == Directions.RIGHT
-                and self.player.current_sequence != "walk_right"
-            ):
-                self.player.switch_to("walk_right")
+    def update_state(self, dt: float) -> None:
+        self.tiled_map.update()
         self.player.update()
 
-    def run(self) -> None:
-        self.running = not self.running
-
-        while self.running:
-            self.clock.tick(2000)
-            self.handle_events()
-            self.handle_rendering()
-            self.update_state()
-            pygame.display.update()
+    def render_frame(self, alpha: float) -> None:
+        self.clock.tick()
+        self.handle_rendering()
+        self.presenter.present()
 
+    def run(self) -> None:
+        self.loop.run()
         sys.exit()
 
 
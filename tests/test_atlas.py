@@ -0,0 +1,81 @@
+from collections.abc import Generator
+from pathlib import Path
+
+import pygame
+import pytest
+
+from apu.core.atlas import AtlasBuilder, TextureAtlas
+from apu.core.spritesheet import AnimationSequence
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _frames(count: int, size: tuple[int, int]) -> list[pygame.Surface]:
+    frames = []
+    for index in range(count):
+        frame = pygame.Surface(size)
+        frame.fill((index * 10, 255, 0))
+        frames.append(frame)
+    return frames
+
+
+def test_atlas_builder_packs_regions_without_overlap() -> None:
+    builder = AtlasBuilder(page_size=(64, 64))
+    names = builder.add_sequence("walk", AnimationSequence(_frames(6, (16, 19))))
+    names += builder.add_frames("tiles", _frames(10, (16, 16)))
+
+    atlas = builder.build()
+
+    assert len(atlas) == 16
+    rects = [(atlas[name].page, atlas[name].rect) for name in names]
+    for index, (page, rect) in enumerate(rects):
+        assert atlas.pages[page].get_rect().contains(rect)
+        for other_page, other in rects[index + 1 :]:
+            assert page != other_page or not rect.colliderect(other)
+    assert atlas.surface("walk/3").get_at((0, 0)) == pygame.Color(30, 255, 0)
+
+
+def test_atlas_builder_shares_regions_of_identical_surfaces() -> None:
+    frame = _frames(1, (8, 8))[0]
+    builder = AtlasBuilder()
+    builder.add("a", frame)
+    builder.add("b", frame)
+
+    atlas = builder.build()
+
+    assert atlas["a"].rect == atlas["b"].rect
+    with pytest.raises(KeyError):
+        builder.add("a", frame)
+
+
+def test_atlas_builder_rejects_oversized_images() -> None:
+    builder = AtlasBuilder(page_size=(16, 16))
+    builder.add("big", pygame.Surface((32, 8)))
+    with pytest.raises(ValueError, match="does not fit"):
+        builder.build()
+
+
+def test_atlas_blits_and_round_trip(tmp_path: Path) -> None:
+    builder = AtlasBuilder(page_size=(32, 32))
+    builder.add_frames("frame", _frames(5, (16, 16)))
+    atlas = builder.build()
+    assert len(atlas.pages) > 1
+
+    target = pygame.Surface((64, 16))
+    atlas.blits(target, [("frame/1", (0, 0)), ("frame/4", (16, 0))])
+    atlas.fblits(target, [("frame/2", (32, 0))])
+    assert target.get_at((0, 0)) == pygame.Color(10, 255, 0)
+    assert target.get_at((16, 0)) == pygame.Color(40, 255, 0)
+    assert target.get_at((32, 0)) == pygame.Color(20, 255, 0)
+
+    atlas.save(str(tmp_path / "atlas.json"))
+    loaded = TextureAtlas.load(str(tmp_path / "atlas.json"))
+
+    assert len(loaded.pages) == len(atlas.pages)
+    assert loaded["frame/4"].rect == atlas["frame/4"].rect
+    assert loaded.surface("frame/4").get_at((0, 0)) == pygame.Color(40, 255, 0)
@@ -0,0 +1,236 @@
+from collections.abc import Generator
+
+import pygame
+import pytest
+
+from apu.collision import CollisionWorld, HitBox, batch_collide, hitboxes_overlap, sweep_rect
+from apu.core.enums import Directions
+from apu.core.masks import MASK_CACHE
+from apu.events import Collision, EventBus
+from apu.objects.components import MovementComponent, SolidBodyComponent
+from apu.objects.entities import BaseSprite, CompactSprite
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _body(
+    position: tuple[int, int], size: tuple[int, int] = (16, 16)
+) -> tuple[CompactSprite, SolidBodyComponent]:
+    sprite = CompactSprite(position)
+    body = SolidBodyComponent(box=HitBox(pygame.Rect((0, 0), size)))
+    sprite.add_component(body)
+    return sprite, body
+
+
+def test_collision_world_pairs_only_bodies_sharing_cells() -> None:
+    world = CollisionWorld(cell_size=32)
+    walls = [_body((x * 16, 0))[1] for x in range(20)]
+    for wall in walls:
+        world.add(wall, static=True)
+    player, body = _body((40, 8))
+    world.add(body)
+
+    pairs = world.pairs()
+    assert all(pair[0] is body for pair in pairs)
+    assert {id(other) for _, other in pairs} == {id(wall) for wall in walls[2:4]}
+
+    collisions = world.collisions()
+    assert {id(collision.body_b) for collision in collisions} == {id(wall) for wall in walls[2:4]}
+
+    player.x = 200
+    assert world.update() == [body]
+    assert world.update() == []
+    assert {id(other) for _, other in world.pairs()} == {id(wall) for wall in walls[12:14]}
+    assert world.query(pygame.Rect(0, 0, 20, 4)) == walls[:2]
+
+    world.remove(body)
+    assert body not in world
+    assert world.pairs() == []
+
+
+def test_collision_world_pairs_dynamic_bodies_once_and_posts_events() -> None:
+    world = CollisionWorld()
+    _, first = _body((0, 0))
+    _, second = _body((8, 8))
+    world.add(first)
+    world.add(second)
+    assert len(world.pairs()) == 1
+
+    bus = EventBus()
+    channel = bus.channel("collision", Collision)
+    received: list[Collision] = []
+    channel.subscribe(received.append)
+    assert len(world.collisions(channel)) == 1
+    bus.flush()
+    assert len(received) == 1
+
+    with pytest.raises(ValueError, match="entity"):
+        world.add(SolidBodyComponent())
+    sprite = BaseSprite((0, 0))
+    empty = SolidBodyComponent()
+    sprite.add_component(empty)
+    world.add(empty)
+    assert len(world.pairs()) == 1
+
+
+def test_sweep_rect_time_of_impact_and_normal() -> None:
+    obstacle = pygame.Rect(10, 0, 2, 10)
+    assert sweep_rect(pygame.FRect(0, 0, 4, 4), 12, 0, obstacle) == (0.5, -1, 0)
+    assert sweep_rect(pygame.FRect(18, 0, 4, 4), -12, 0, obstacle) == (0.5, 1, 0)
+    assert sweep_rect(pygame.FRect(0, 0, 4, 4), 4, 0, obstacle) is None
+    assert sweep_rect(pygame.FRect(0, 20, 4, 4), 12, 0, obstacle) is None
+    # Already overlapping rects are not blocked.
+    assert sweep_rect(pygame.FRect(9, 0, 4, 4), 5, 0, obstacle) is None
+
+
+def test_collision_world_sweep_stops_fast_bodies_and_slides() -> None:
+    world = CollisionWorld(cell_size=16)
+    for y in range(0, 64, 16):
+        world.add(_body((40, y), (2, 16))[1], static=True)
+    _, bullet = _body((0, 20), (4, 4))
+    world.add(bullet)
+
+    # A 100 px step would jump over the 2 px wall with a discrete test.
+    assert world.sweep(bullet, 100, 0) == (36, 0)
+    # Diagonal movement slides along the wall.
+    assert world.sweep(bullet, 100, 10) == (36, 10)
+    assert world.sweep(bullet, -10, 0) == (-10, 0)
+
+
+def test_collision_world_sweep_finds_moved_obstacles() -> None:
+    world = CollisionWorld(cell_size=16)
+    door, door_body = _body((200, 0), (4, 16))
+    _, player = _body((0, 0), (4, 4))
+    world.add(door_body)
+    world.add(player)
+    assert world.sweep(player, 100, 0) == (100, 0)
+
+    # The door moves into the path without any explicit update of the world.
+    door.x = 40
+    assert world.sweep(player, 100, 0) == (36, 0)
+
+
+def test_movement_component_resolves_against_its_collider() -> None:
+    world = CollisionWorld(cell_size=16)
+    world.add(_body((20, 0), (4, 32))[1], static=True)
+    player, body = _body((0, 0))
+    world.add(body)
+    movement = MovementComponent(speed=8, collider=world)
+    player.add_component(movement)
+
+    movement.move(Directions.RIGHT, loop=True)
+    movement.update()
+    assert player.position == (4, 0)
+    movement.update()
+    assert player.position == (4, 0)
+
+    movement.move(Directions.DOWN, loop=True)
+    movement.update()
+    assert player.position == (4, 8)
+
+
+def test_hitbox_world_rect_is_cached_until_the_entity_moves() -> None:
+    tile, body = _body((32, 16), (8, 4))
+    hitbox = body.hitboxes["box"]
+
+    world = hitbox.world_rect
+    assert world == pygame.Rect(32, 16, 8, 4)
+    assert hitbox.world_rect is world
+
+    tile.x += 4
+    assert hitbox.world_rect is world
+    assert world == pygame.Rect(36, 16, 8, 4)
+
+    hitbox.rect = pygame.Rect(2, 2, 4, 4)
+    assert hitbox.world_rect == pygame.Rect(38, 18, 4, 4)
+
+    other = CompactSprite((0, 0))
+    tile.remove_component(SolidBodyComponent)
+    other.add_component(body)
+    assert hitbox.world_rect == pygame.Rect(2, 2, 4, 4)
+
+
+def test_batch_collide_matches_pairwise_narrow_phase() -> None:
+    _, body = _body((10, 10))
+    body.hitboxes["feet"] = HitBox(pygame.Rect(0, 14, 16, 2))
+    others = [_body((x, y))[1] for x in range(0, 40, 8) for y in range(0, 40, 8)]
+    others.append(body)
+    others.append(SolidBodyComponent(box=HitBox(pygame.Rect(0, 0, 64, 64))))
+
+    collisions = batch_collide(body, others)
+    expected = {
+        (id(other), id(hitbox_a), id(hitbox_b))
+        for other in others
+        if other is not body
+        for hitbox_a, hitbox_b in body.collides_with(other)
+    }
+    assert len(collisions) == len(expected) > 0
+    assert {
+        (id(collision.body_b), id(collision.hitbox_a), id(collision.hitbox_b))
+        for collision in collisions
+    } == expected
+    assert all(collision.body_a is body for collision in collisions)
+    assert batch_collide(body, []) == []
+
+
+def _precise_body(
+    position: tuple[int, int], corner: tuple[int, int]
+) -> tuple[CompactSprite, SolidBodyComponent]:
+    # A 16x16 image whose only opaque pixels are a 4x4 square at the given corner.
+    image = pygame.Surface((16, 16), pygame.SRCALPHA)
+    image.fill((255, 255, 255, 255), pygame.Rect(corner, (4, 4)))
+    sprite = CompactSprite(position, image=image)
+    body = SolidBodyComponent(box=HitBox(pygame.Rect(0, 0, 16, 16), precise=True))
+    sprite.add_component(body)
+    return sprite, body
+
+
+def test_precise_hitboxes_collide_by_pixels_after_the_rects() -> None:
+    _, body_a = _precise_body((0, 0), (12, 12))
+    sprite_b, body_b = _precise_body((8, 8), (12, 12))
+    box_a, box_b = body_a.hitboxes["box"], body_b.hitboxes["box"]
+
+    # The rects overlap, the opaque pixels do not.
+    assert box_a.world_rect.colliderect(box_b.world_rect)
+    assert not hitboxes_overlap(box_a, box_b)
+    assert body_a.collides_with(body_b) == []
+    assert batch_collide(body_a, [body_b]) == []
+
+    sprite_b.image = pygame.Surface((16, 16), pygame.SRCALPHA)
+    sprite_b.image.fill((255, 255, 255, 255), pygame.Rect(4, 4, 4, 4))
+    assert hitboxes_overlap(box_a, box_b)
+    assert body_a.collides_with(body_b) == [(box_a, box_b)]
+
+    # A plain hitbox collides with the opaque pixels of a precise one.
+    _, wall = _body((0, 0), (6, 6))
+    assert batch_collide(wall, [body_a]) == []
+    _, wall = _body((10, 10), (4, 4))
+    assert len(batch_collide(wall, [body_a])) == 1
+
+
+def test_precise_hitboxes_convert_each_frame_once() -> None:
+    MASK_CACHE.clear()
+    sprite, body = _precise_body((0, 0), (0, 0))
+    _, other = _precise_body((2, 2), (0, 0))
+    misses = MASK_CACHE.misses
+
+    for x in range(8):
+        sprite.x = x
+        body.collides_with(other)
+    assert MASK_CACHE.misses == misses + 2
+
+
+def test_precise_hitboxes_outside_or_without_an_image() -> None:
+    sprite, body = _precise_body((0, 0), (0, 0))
+    body.hitboxes["outside"] = HitBox(pygame.Rect(20, 20, 4, 4), precise=True)
+    _, wall = _body((20, 20), (4, 4))
+    assert wall.collides_with(body) == []
+
+    # Entities without an image fall back to the rect.
+    sprite.image = pygame.Surface((0, 0))
+    assert wall.collides_with(body) == [(wall.hitboxes["box"], body.hitboxes["outside"])]
@@ -0,0 +1,96 @@
+from collections.abc import Generator
+
+import pygame
+import pytest
+
+from apu.collision import HitBox
+from apu.ecs import World, WorldSprite, velocity_system
+from apu.objects.components import SolidBodyComponent
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_world_groups_entities_in_archetype_tables() -> None:
+    world = World()
+    still = world.spawn(position=(1, 2))
+    moving = [world.spawn(position=(index, 0), velocity=(1, 0.5)) for index in range(3)]
+
+    assert world.components(still) == {"position"}
+    assert [len(table) for table in world.query("position")] == [1, 3]
+    assert [len(table) for table in world.query("velocity")] == [3]
+
+    velocity_system(world, dt=2)
+    assert world.get(moving[2], "x") == 4
+    assert world.get(moving[2], "y") == 1
+    assert world.get(still, "x") == 1
+
+    world.despawn(moving[0])
+    assert world.get(moving[2], "x") == 4
+    assert len(world) == 3
+
+    world.remove(moving[1], "velocity")
+    world.add(still, "velocity", (0, 1))
+    assert world.components(moving[1]) == {"position"}
+    assert world.get(still, "vy") == 1
+    assert world.get(moving[1], "x") == 3
+
+    with pytest.raises(KeyError):
+        world.spawn(health=(3,))
+    with pytest.raises(ValueError, match="expects values"):
+        world.spawn(position=(1,))
+
+    world.define("health", ("hp",))
+    assert world.components(world.spawn(health=(3,))) == {"health"}
+
+
+def test_world_rejects_fields_shared_by_components() -> None:
+    world = World()
+    with pytest.raises(ValueError, match="already used by position"):
+        world.define("target", ("x", "y"))
+    with pytest.raises(ValueError, match="same field twice"):
+        world.define("size", ("w", "w"))
+    with pytest.raises(ValueError, match="already used"):
+        World({"position": ("x", "y"), "origin": ("y", "z")})
+
+    world.define("target", ("tx", "ty"))
+    entity = world.spawn(position=(1, 2), target=(3, 4))
+    assert (world.get(entity, "x"), world.get(entity, "tx")) == (1, 3)
+
+
+def test_world_sprite_keeps_position_in_world() -> None:
+    world = World()
+    sprite = WorldSprite(world, (10, 20), velocity=(1.5, 0))
+    sprite.add_component(SolidBodyComponent())
+
+    velocity_system(world)
+    velocity_system(world)
+
+    assert sprite.position == (13, 20)
+    sprite.y = 5
+    assert world.get(sprite.entity_id, "y") == 5
+    assert sprite.computed_rect.topleft == (13, 5)
+
+    sprite.kill()
+    assert sprite.entity_id not in world
+
+
+def test_world_sprite_position_version_changes_only_on_moves() -> None:
+    world = World()
+    sprite = WorldSprite(world, (0, 0), velocity=(2, 0))
+    hitbox = HitBox(pygame.Rect(0, 0, 4, 4))
+    sprite.add_component(SolidBodyComponent(box=hitbox))
+
+    version = sprite.position_version
+    rect = hitbox.world_rect
+    assert sprite.position_version == version
+    assert hitbox.world_rect is rect
+
+    velocity_system(world)
+    assert sprite.position_version == version + 1
+    assert hitbox.world_rect.topleft == (2, 0)
+    assert sprite.position_version == version + 1
@@ -1,13 +1,21 @@
 from collections.abc import Generator
+import gc
 
 import pygame
 import pytest
+from typing_extensions import override
 
 from apu.collision import HitBox
 from apu.core.enums import Directions
 from apu.core.spritesheet import AnimationSequence
-from apu.objects.components import AnimationComponent, MovementComponent, SolidBodyComponent
-from apu.objects.entities import BaseSprite
+from apu.objects.components import (
+    AnimationComponent,
+    AnimationStateMachine,
+    HitBoxDict,
+    MovementComponent,
+    SolidBodyComponent,
+)
+from apu.objects.entities import BaseSprite, CompactSprite, ComponentIndex
 
 
 @pytest.fixture(autouse=True)
@@ -87,6 +95,17 @@ def test_animation_component_management() -> None:
     assert animation_component.current_sequence == "idle"
 
 
+def test_animation_speed_scales_per_frame_durations() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(3)]
+    animation_component = AnimationComponent(
+        blink=AnimationSequence(frames, loop=True, frame_duration=[100, 50, 150])
+    )
+
+    animation_component.set_animation_speed(200)
+    assert animation_component.get_animation_speed() == 200
+    assert animation_component.animations["blink"].frame_durations == [200, 100, 300]
+
+
 def test_movement_component_movement() -> None:
     sprite = BaseSprite(position=(0, 0))
     movement_component = MovementComponent(speed=2)
@@ -103,3 +122,223 @@ def test_movement_component_movement() -> None:
 
     movement_component.stop(Directions.DOWN)
     assert Directions.DOWN not in movement_component.movements
+
+
+def test_animation_state_machine_switches_only_on_state_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sprite = BaseSprite(position=(0, 0))
+    frames = [pygame.Surface((1, 1))]
+    sprite.add_component(MovementComponent())
+    sprite.add_component(
+        AnimationComponent(
+            idle=AnimationSequence(frames, loop=True), walk=AnimationSequence(frames, loop=True)
+        )
+    )
+    machine = AnimationStateMachine(
+        states={"standing": "idle", "walking": "walk"},
+        transitions=[
+            ("standing", "walking", lambda entity: entity.is_moving),
+            ("*", "standing", lambda entity: not entity.is_moving),
+        ],
+    )
+    sprite.add_component(machine)
+    animation = sprite.get_component(AnimationComponent)
+    assert isinstance(animation, AnimationComponent)
+
+    switches: list[str] = []
+    original_switch_to = AnimationComponent.switch_to
+
+    def record_switch(component: AnimationComponent, key: str) -> None:
+        switches.append(key)
+        original_switch_to(component, key)
+
+    monkeypatch.setattr(AnimationComponent, "switch_to", record_switch)
+
+    machine.update()
+    machine.update()
+    assert switches == []
+
+    sprite.move(Directions.RIGHT, loop=True)
+    machine.update()
+    machine.update()
+    assert machine.animation_state == "walking"
+    assert animation.current_sequence == "walk"
+    assert switches == ["walk"]
+
+    sprite.stop(Directions.RIGHT)
+    machine.update()
+    assert switches == ["walk", "idle"]
+
+    with pytest.raises(KeyError):
+        AnimationStateMachine(states={"a": "idle"}, transitions=[("a", "b", lambda _: True)])
+
+
+def test_basesprite_delegates_attributes_through_dispatch_table() -> None:
+    sprite = BaseSprite(position=(0, 0))
+    assert not hasattr(sprite, "hitboxes")
+
+    body = SolidBodyComponent(box1=HitBox(pygame.Rect(0, 0, 4, 4)))
+    movement = MovementComponent(speed=3)
+    sprite.add_component(body)
+    sprite.add_component(movement)
+
+    assert sprite.hitboxes is body.hitboxes
+    assert sprite.speed == 3
+    assert sprite.on_added == body.on_added
+
+    sprite.move(Directions.UP)
+    assert sprite.is_moving
+
+    sprite.remove_component(SolidBodyComponent)
+    assert not hasattr(sprite, "hitboxes")
+    assert sprite.on_added == movement.on_added
+    with pytest.raises(AttributeError, match="no attribute missing"):
+        _ = sprite.missing
+
+
+def test_basesprite_delegates_attributes_created_after_indexing() -> None:
+    class HealthComponent(SolidBodyComponent):
+        hp: int
+        shield: int
+
+        @override
+        def on_added(self) -> None:
+            super().on_added()
+            self.hp = 3
+
+    sprite = BaseSprite(position=(0, 0))
+    health = HealthComponent()
+    sprite.add_component(health)
+    sprite.add_component(MovementComponent(speed=2))
+    assert sprite.hp == 3
+
+    health.shield = 1
+    assert sprite.shield == 1
+    assert sprite._dispatch["shield"] == "HealthComponent"
+    health.shield = 2
+    assert sprite.shield == 2
+
+
+def test_compact_sprite_has_no_instance_dict() -> None:
+    sprite = CompactSprite(position=(4, 8), layer=2)
+    assert not hasattr(sprite, "__dict__")
+    assert sprite.position == (4, 8)
+    assert sprite.layer == 2
+    with pytest.raises(AttributeError):
+        sprite.speed = 3  # type: ignore[attr-defined]
+
+    body = SolidBodyComponent(box1=HitBox(pygame.Rect(0, 0, 4, 4)))
+    sprite.add_component(body)
+    assert not hasattr(body, "__dict__")
+    assert sprite.hitboxes is body.hitboxes
+    assert sprite.get_component(SolidBodyComponent) is body
+
+    other = CompactSprite(position=(0, 0))
+    other.add_component(SolidBodyComponent())
+    assert other._dispatch is sprite._dispatch
+
+
+def test_hitbox_dict_binds_hitboxes_to_body() -> None:
+    body = SolidBodyComponent()
+    first = HitBox(pygame.Rect(0, 0, 1, 1))
+    second = HitBox(pygame.Rect(0, 0, 2, 2))
+
+    body.hitboxes.update(first=first)
+    assert body.hitboxes.setdefault("second", second) is second
+    assert body.hitboxes.setdefault("second", first) is second
+    assert first._body is body
+    assert second._body is body
+    assert isinstance(body.hitboxes, dict)
+
+    copied = body.hitboxes.copy()
+    third = HitBox(pygame.Rect(0, 0, 3, 3))
+    copied["third"] = third
+    assert isinstance(copied, HitBoxDict)
+    assert third._body is body
+    assert "third" not in body.hitboxes
+
+
+def test_component_index_tracks_entities_by_component_type() -> None:
+    class TriggerComponent(SolidBodyComponent):
+        pass
+
+    index = ComponentIndex()
+    solid = BaseSprite(position=(0, 0))
+    moving = CompactSprite(position=(0, 0))
+    body = SolidBodyComponent()
+    trigger = TriggerComponent()
+    movement = MovementComponent()
+    solid.add_component(body)
+    moving.add_component(movement)
+
+    index.track(solid)
+    index.track(moving)
+    moving.add_component(trigger)
+    assert solid in index
+    assert index.entities(TriggerComponent) == [moving]
+    assert index.components(MovementComponent) == [movement]
+    assert list(index.items(MovementComponent)) == [(moving, movement)]
+    assert index.count(SolidBodyComponent) == 2
+    assert index.count(AnimationComponent) == 0
+
+    with pytest.raises(ValueError, match="another component index"):
+        ComponentIndex().track(solid)
+    index.untrack(solid)
+    assert solid not in index
+    assert index.entities(SolidBodyComponent) == [moving]
+
+
+@pytest.mark.parametrize("factory", [BaseSprite, CompactSprite])
+def test_component_index_drops_discarded_entities(factory: type[BaseSprite]) -> None:
+    index = ComponentIndex()
+    sprite = factory(position=(0, 0))
+    sprite.add_component(MovementComponent())
+    sprite.add_component(SolidBodyComponent())
+    index.track(sprite)
+    assert index.count(MovementComponent) == 1
+
+    del sprite
+    gc.collect()
+    assert index.count(MovementComponent) == 0
+    assert index.count(SolidBodyComponent) == 0
+
+
+def test_add_and_remove_component_update_the_component_index() -> None:
+    index = ComponentIndex()
+    sprite = CompactSprite(position=(0, 0))
+    index.track(sprite)
+    body = SolidBodyComponent()
+    sprite.add_component(body)
+    assert sprite in index.entities(SolidBodyComponent)
+
+    replacement = SolidBodyComponent()
+    sprite.add_component(replacement)
+    assert index.components(SolidBodyComponent) == [replacement]
+
+    sprite.remove_component(SolidBodyComponent)
+    assert sprite not in index.entities(SolidBodyComponent)
+
+    untracked = CompactSprite(position=(0, 0))
+    untracked.add_component(SolidBodyComponent())
+    assert untracked not in index.entities(SolidBodyComponent)
+
+
+@pytest.mark.parametrize("factory", [BaseSprite, CompactSprite])
+def test_position_version_counts_position_changes(factory: type[BaseSprite]) -> None:
+    sprite = factory((10, 20))
+    version = sprite.position_version
+
+    assert sprite.position_version == version
+    sprite.x += 1
+    sprite.y = 3
+    assert sprite.position_version == version + 2
+    assert sprite.position == (11, 3)
+
+
+@pytest.mark.parametrize("factory", [BaseSprite, CompactSprite])
+def test_sprites_without_image_get_their_own_empty_surface(factory: type[BaseSprite]) -> None:
+    first, second = factory((0, 0)), factory((0, 0))
+    assert first.image is not None
+    assert first.image.get_size() == (0, 0)
+    assert first.image is not second.image
@@ -0,0 +1,86 @@
+from collections.abc import Generator
+
+import pygame
+import pytest
+
+from apu.collision import HitBox, check_collision
+from apu.core.spritesheet import AnimationSequence
+from apu.events import AnimationFinished, Collision, EventBus, Trigger
+from apu.objects.components import AnimationComponent, SolidBodyComponent
+from apu.objects.entities import BaseSprite
+from apu.systems.animation import AnimationSystem
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_channel_emits_immediately_and_flushes_posted_events() -> None:
+    bus = EventBus()
+    triggers = bus.channel("trigger", Trigger)
+    assert bus.channel("trigger", Trigger) is triggers
+    with pytest.raises(TypeError, match="delivers Trigger events"):
+        bus.channel("trigger", Collision)
+
+    received: list[str] = []
+
+    @triggers.subscribe
+    def on_trigger(event: Trigger) -> None:
+        received.append(event.name)
+        if event.name == "door":
+            triggers.post(Trigger("echo"))
+
+    triggers.emit(Trigger("now"))
+    assert received == ["now"]
+
+    triggers.post(Trigger("door"))
+    triggers.post(Trigger("chest"))
+    assert received == ["now"]
+    assert bus.flush() == 2
+    assert received == ["now", "door", "chest"]
+    assert len(triggers) == 1
+
+    triggers.unsubscribe(on_trigger)
+    assert bus.flush() == 1
+    assert received == ["now", "door", "chest"]
+
+
+def test_check_collision_posts_collision_events() -> None:
+    bus = EventBus()
+    collisions = bus.channel("collision", Collision)
+    received: list[Collision] = []
+    collisions.subscribe(received.append)
+
+    first, second = BaseSprite((0, 0)), BaseSprite((3, 0))
+    hitbox_a, hitbox_b = HitBox(pygame.Rect(0, 0, 4, 4)), HitBox(pygame.Rect(0, 0, 4, 4))
+    body_a, body_b = SolidBodyComponent(box=hitbox_a), SolidBodyComponent(box=hitbox_b)
+    first.add_component(body_a)
+    second.add_component(body_b)
+
+    assert check_collision(body_a, body_b, collisions) == 1
+    assert received == []
+    bus.flush()
+    assert received == [Collision(body_a, body_b, hitbox_a, hitbox_b)]
+
+
+def test_animation_system_posts_animation_finished_once() -> None:
+    bus = EventBus()
+    finished = bus.channel("animation_finished", AnimationFinished)
+    received: list[AnimationFinished] = []
+    finished.subscribe(received.append)
+
+    frames = [pygame.Surface((1, 1)) for _ in range(2)]
+    sprite = BaseSprite((0, 0))
+    component = AnimationComponent(attack=AnimationSequence(frames, frame_duration=100))
+    sprite.add_component(component)
+    system = AnimationSystem(finished)
+    system.register(component)
+
+    system.update(150)
+    system.update(100)
+    system.update(100)
+    bus.flush()
+    assert received == [AnimationFinished(component, "attack")]
@@ -7,6 +7,7 @@ import xml.etree.ElementTree as ET
 import pygame
 import pytest
 
+from apu.core.enums import TileKind
 from apu.loading import JSONMapLoader, TiledMapLoader, TMXMapLoader
 from apu.objects.components import AnimationComponent, SolidBodyComponent
 from apu.objects.entities import BaseSprite
@@ -81,6 +82,7 @@ def test_json_map_loader_load_basic(monkeypatch: pytest.MonkeyPatch) -> None:
     sprites = loader.load("map.json", "assets/")
     assert len(sprites) == 1
     mock_sprite.add_component.assert_not_called()
+    assert mock_sprite.kind == TileKind.STATIC
 
 
 def test_tmx_map_loader_load_basic(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -112,6 +114,7 @@ def test_tmx_map_loader_load_basic(monkeypatch: pytest.MonkeyPatch) -> None:
     sprites = loader.load("map.tmx", "assets/")
     assert len(sprites) == 1
     mock_sprite.add_component.assert_not_called()
+    assert mock_sprite.kind == TileKind.STATIC
 
 
 # Test per il caricamento di hitbox
@@ -154,6 +157,7 @@ def test_json_map_loader_load_with_hitbox(monkeypatch: pytest.MonkeyPatch) -> No
     assert len(sprites) == 1
     mock_sprite.add_component.assert_called_once()
     assert isinstance(mock_sprite.add_component.call_args[0][0], SolidBodyComponent)
+    assert mock_sprite.kind == TileKind.SOLID
 
 
 def test_tmx_map_loader_load_with_hitbox(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -188,6 +192,7 @@ def test_tmx_map_loader_load_with_hitbox(monkeypatch: pytest.MonkeyPatch) -> Non
     assert len(sprites) == 1
     mock_sprite.add_component.assert_called_once()
     assert isinstance(mock_sprite.add_component.call_args[0][0], SolidBodyComponent)
+    assert mock_sprite.kind == TileKind.SOLID
 
 
 def test_json_map_loader_load_with_animation(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -216,7 +221,7 @@ def test_json_map_loader_load_with_animation(monkeypatch: pytest.MonkeyPatch) ->
                         "id": 0,
                         "animation": [
                             {"duration": 100, "tileid": 0},
-                            {"duration": 100, "tileid": 1},
+                            {"duration": 200, "tileid": 1},
                         ],
                     }
                 ],
@@ -232,7 +237,10 @@ def test_json_map_loader_load_with_animation(monkeypatch: pytest.MonkeyPatch) ->
     sprites = loader.load("map.json", "assets/")
     assert len(sprites) == 1
     mock_sprite.add_component.assert_called_once()
-    assert isinstance(mock_sprite.add_component.call_args[0][0], AnimationComponent)
+    component = mock_sprite.add_component.call_args[0][0]
+    assert isinstance(component, AnimationComponent)
+    assert component.animations["animation1"].frame_durations == [100, 200]
+    assert mock_sprite.kind == TileKind.ANIMATED
 
 
 def test_tmx_map_loader_load_with_animation(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -253,7 +261,7 @@ def test_tmx_map_loader_load_with_animation(monkeypatch: pytest.MonkeyPatch) ->
     tile_with_anim = ET.SubElement(tileset, "tile", id="0")
     animation = ET.SubElement(tile_with_anim, "animation")
     ET.SubElement(animation, "frame", tileid="0", duration="100")
-    ET.SubElement(animation, "frame", tileid="1", duration="100")
+    ET.SubElement(animation, "frame", tileid="1", duration="200")
     layer = ET.SubElement(root, "layer")
     data = ET.SubElement(layer, "data", encoding="csv")
     data.text = "1"
@@ -267,4 +275,7 @@ def test_tmx_map_loader_load_with_animation(monkeypatch: pytest.MonkeyPatch) ->
     sprites = loader.load("map.tmx", "assets/")
     assert len(sprites) == 1
     mock_sprite.add_component.assert_called_once()
-    assert isinstance(mock_sprite.add_component.call_args[0][0], AnimationComponent)
+    component = mock_sprite.add_component.call_args[0][0]
+    assert isinstance(component, AnimationComponent)
+    assert component.animations["animation1"].frame_durations == [100, 200]
+    assert mock_sprite.kind == TileKind.ANIMATED
@@ -0,0 +1,77 @@
+import pytest
+
+from apu.loop import GameLoop
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_game_loop_consumes_elapsed_time_in_fixed_steps() -> None:
+    clock = FakeClock()
+    steps: list[float] = []
+    alphas: list[float] = []
+    loop = GameLoop(
+        steps.append, alphas.append, tick_rate=10, frame_rate=0, clock=clock, wait=clock.sleep
+    )
+
+    loop.tick()
+    assert steps == []
+
+    clock.now += 0.25
+    loop.tick()
+    assert steps == [100.0, 100.0]
+    assert alphas[-1] == pytest.approx(0.5)
+
+    # Updates are capped per frame and the time that could not be simulated is dropped.
+    clock.now += 1.0
+    loop.tick()
+    assert len(steps) == 7
+    assert alphas[-1] == pytest.approx(0.5)
+    assert loop.time == 700.0
+    assert clock.sleeps == []
+
+
+def test_game_loop_sleeps_until_the_next_frame() -> None:
+    clock = FakeClock()
+    loop = GameLoop(lambda dt: None, tick_rate=10, spin_time=0.0, clock=clock, wait=clock.sleep)
+
+    loop.run(max_frames=3)
+
+    assert clock.sleeps == pytest.approx([0.1, 0.1, 0.1])
+    assert loop.ticks == 2
+    assert loop.frames == 3
+    assert not loop.running
+
+
+def test_game_loop_headless_runs_one_step_per_frame_without_rendering() -> None:
+    steps: list[float] = []
+    rendered: list[float] = []
+    loop = GameLoop(steps.append, rendered.append, tick_rate=50, headless=True)
+
+    def stop_after_100_steps(dt: float) -> None:
+        steps.append(dt)
+        if len(steps) == 100:
+            loop.stop()
+
+    loop.update_hook = stop_after_100_steps
+    loop.run()
+
+    assert steps == [20.0] * 100
+    assert rendered == []
+    assert loop.time == 2000.0
+
+
+def test_game_loop_interpolation_and_validation() -> None:
+    assert GameLoop.interpolate((0, 10), (10, 20), 0.25) == (2.5, 12.5)
+    with pytest.raises(ValueError, match="Tick rate"):
+        GameLoop(lambda dt: None, tick_rate=0)
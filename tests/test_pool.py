@@ -0,0 +1,122 @@
+from collections.abc import Generator
+
+import pygame
+import pytest
+
+from apu.collision import CollisionWorld, HitBox
+from apu.core.enums import Directions
+from apu.objects.components import MovementComponent, SolidBodyComponent
+from apu.objects.entities import BaseSprite, ComponentIndex
+from apu.objects.pool import EntityPool
+from apu.systems.movement import MovementSystem
+from apu.systems.scheduler import UpdateScheduler
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _projectile() -> BaseSprite:
+    sprite = BaseSprite(position=(0, 0))
+    sprite.add_component(MovementComponent(speed=4))
+    return sprite
+
+
+def test_entity_pool_reuses_released_entities() -> None:
+    pool = EntityPool(_projectile, prefill=1)
+    assert pool.stats["created"] == 1
+
+    first = pool.acquire((10, 20))
+    second = pool.acquire()
+    assert first.position == (10, 20)
+    assert pool.stats == {
+        "created": 2,
+        "reused": 1,
+        "discarded": 0,
+        "free": 0,
+        "in_use": 2,
+        "peak": 2,
+    }
+
+    group = pygame.sprite.Group(first)
+    first.move(Directions.RIGHT, loop=True)
+    pool.release(first)
+    assert not first.alive()
+    assert not first.is_moving
+    assert group.sprites() == []
+
+    assert pool.acquire((0, 5)) is first
+    assert pool.created == 2
+    assert pool.reused == 2
+
+    with pytest.raises(ValueError, match="not in use"):
+        pool.release(_projectile())
+    pool.release(second)
+    with pytest.raises(ValueError, match="not in use"):
+        pool.release(second)
+
+
+def test_entity_pool_capacity_and_reset_hook() -> None:
+    resets: list[BaseSprite] = []
+    pool = EntityPool(_projectile, reset=resets.append, capacity=1)
+    sprites = [pool.acquire() for _ in range(3)]
+    for sprite in sprites:
+        pool.release(sprite)
+
+    assert resets == sprites
+    assert pool.free == 1
+    assert pool.discarded == 2
+    assert len(pool) == 1
+
+
+def test_entity_pool_releases_entities_registered_to_a_movement_system() -> None:
+    pool = EntityPool(_projectile)
+    system = MovementSystem()
+
+    sprite = pool.acquire((0, 0))
+    movement = sprite.get_component(MovementComponent)
+    assert isinstance(movement, MovementComponent)
+    system.register(movement)
+    movement.move(Directions.RIGHT, loop=True)
+    system.update()
+    assert sprite.position == (4, 0)
+
+    pool.release(sprite)
+    assert not movement.is_moving
+    assert movement not in system
+
+    assert pool.acquire((20, 0)) is sprite
+    system.register(movement)
+    movement.move(Directions.RIGHT, loop=True)
+    system.update()
+    assert sprite.position == (24, 0)
+
+
+def test_entity_pool_detaches_released_entities() -> None:
+    def factory() -> BaseSprite:
+        sprite = _projectile()
+        sprite.add_component(SolidBodyComponent(box=HitBox(pygame.Rect(0, 0, 4, 4))))
+        return sprite
+
+    pool = EntityPool(factory)
+    index = ComponentIndex()
+    scheduler = UpdateScheduler()
+    world = CollisionWorld()
+
+    sprite = pool.acquire()
+    movement = sprite.get_component(MovementComponent)
+    body = sprite.get_component(SolidBodyComponent)
+    assert isinstance(movement, MovementComponent)
+    assert isinstance(body, SolidBodyComponent)
+    index.track(sprite)
+    scheduler.register(movement)
+    world.add(body)
+
+    pool.release(sprite)
+    assert sprite not in index
+    assert index.count(MovementComponent) == 0
+    assert movement not in scheduler
+    assert body not in world
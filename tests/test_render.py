@@ -0,0 +1,57 @@
+from collections.abc import Generator
+
+import pygame
+import pytest
+
+from apu.render import Presenter
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_presenter_integer_scaling_with_letterbox() -> None:
+    window = pygame.Surface((70, 40))
+    presenter = Presenter((16, 9), window=window, background=(0, 0, 255))
+    presenter.virtual_display.fill((255, 0, 0))
+    presenter.virtual_display.set_at((0, 0), (0, 255, 0))
+
+    presenter.scale()
+
+    assert presenter.viewport == pygame.Rect(3, 2, 64, 36)
+    assert window.get_at((3, 2)) == pygame.Color(0, 255, 0)
+    assert window.get_at((6, 5)) == pygame.Color(0, 255, 0)
+    assert window.get_at((7, 6)) == pygame.Color(255, 0, 0)
+    assert window.get_at((66, 37)) == pygame.Color(255, 0, 0)
+    assert window.get_at((1, 20)) == pygame.Color(0, 0, 255)
+    assert window.get_at((30, 39)) == pygame.Color(0, 0, 255)
+    assert presenter.to_virtual((7, 6)) == (1, 1)
+    assert presenter.timings["scale"] >= 0
+
+
+def test_presenter_stretches_and_follows_window_resizes() -> None:
+    presenter = Presenter((10, 10), window=pygame.Surface((25, 15)), letterbox=False)
+    presenter.virtual_display.fill((255, 0, 0))
+
+    presenter.scale()
+    assert presenter.viewport == pygame.Rect(0, 0, 25, 15)
+
+    presenter._window = pygame.Surface((30, 30))
+    presenter.scale()
+    assert presenter.viewport == pygame.Rect(0, 0, 30, 30)
+    assert presenter.window.get_at((29, 29)) == pygame.Color(255, 0, 0)
+
+
+def test_presenter_present_flips_display(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((64, 36))
+    presenter = Presenter((32, 18))
+
+    presenter.present()
+
+    assert presenter.viewport == pygame.Rect(0, 0, 64, 36)
+    assert set(presenter.timings) == {"scale", "flip"}
@@ -0,0 +1,68 @@
+from collections.abc import Generator
+
+import pygame
+import pytest
+
+from apu.collision import HitBox
+from apu.core.enums import TileKind
+from apu.core.spritesheet import AnimationSequence
+from apu.objects.components import AnimationComponent, SolidBodyComponent
+from apu.objects.entities import BaseSprite, CompactSprite
+from apu.scene import TiledScene
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _tile(position: tuple[int, int], color: tuple[int, int, int]) -> CompactSprite:
+    image = pygame.Surface((4, 4))
+    image.fill(color)
+    tile = CompactSprite(position, image=image)
+    tile.kind = TileKind.STATIC
+    return tile
+
+
+def test_tiled_scene_bakes_static_tiles_into_chunks() -> None:
+    tiles = [_tile((0, 0), (255, 0, 0)), _tile((4, 0), (0, 255, 0)), _tile((8, 8), (0, 0, 255))]
+    scene = TiledScene(4, *tiles, chunk_size=8)
+    window = pygame.Surface((16, 16))
+
+    scene.render(window)
+
+    assert len(scene._baked[0]) == 2
+    assert scene._dynamic[0] == []
+    assert window.get_at((1, 1)) == pygame.Color(255, 0, 0)
+    assert window.get_at((5, 1)) == pygame.Color(0, 255, 0)
+    assert window.get_at((9, 9)) == pygame.Color(0, 0, 255)
+    assert window.get_at((1, 6)) == pygame.Color(0, 0, 0)
+
+    image = tiles[0].image
+    assert image is not None
+    image.fill((255, 255, 255))
+    scene.render(window)
+    assert window.get_at((1, 1)) == pygame.Color(255, 0, 0)
+    scene.invalidate(0)
+    scene.render(window)
+    assert window.get_at((1, 1)) == pygame.Color(255, 255, 255)
+
+
+def test_tiled_scene_updates_only_animated_tiles() -> None:
+    frames = [pygame.Surface((4, 4)) for _ in range(2)]
+    animated = BaseSprite((0, 0))
+    animated.add_component(AnimationComponent(idle=AnimationSequence(frames, True, 0)))
+    solid = BaseSprite((4, 0), image=pygame.Surface((4, 4)))
+    solid.add_component(SolidBodyComponent(box1=HitBox(pygame.Rect(0, 0, 4, 4))))
+    static = _tile((8, 0), (255, 0, 0))
+    scene = TiledScene(4, animated, solid, static)
+
+    assert TiledScene.kind(animated) == TileKind.ANIMATED
+    assert TiledScene.kind(solid) == TileKind.SOLID
+
+    scene.update()
+    assert scene._dynamic[0] == [animated, solid]
+    assert scene._animated[0] == [animated]
+    assert animated.image is frames[0]
@@ -0,0 +1,117 @@
+from collections.abc import Generator
+from pathlib import Path
+
+import pygame
+import pytest
+
+from apu.core.spritesheet import AnimationSequence, SpriteSheet
+
+
+@pytest.fixture(autouse=True)
+def pygame_init(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def sheet_path(tmp_path: Path) -> str:
+    surface = pygame.Surface((64, 16))
+    for x in range(4):
+        surface.fill((x * 60, 0, 0), pygame.Rect(x * 16, 0, 16, 16))
+    path = tmp_path / "sheet.png"
+    pygame.image.save(surface, str(path))
+    return str(path)
+
+
+def test_spritesheet_image_at_is_memoized(sheet_path: str) -> None:
+    sheet = SpriteSheet(sheet_path)
+    first = sheet.image_at(pygame.Rect(0, 0, 16, 16))
+
+    assert sheet.image_at(pygame.Rect(0, 0, 16, 16)) is first
+    assert sheet.image_at(pygame.Rect(0, 0, 16, 16), pygame.Color(0, 0, 0)) is not first
+    assert sheet.cached_images == 2
+
+    sheet.clear_cache()
+    assert sheet.cached_images == 0
+    assert sheet.image_at(pygame.Rect(0, 0, 16, 16)) is not first
+
+
+def test_spritesheet_load_sequence_reuses_frames(sheet_path: str) -> None:
+    sheet = SpriteSheet(sheet_path)
+    frames = sheet.load_sequence(pygame.Rect(0, 0, 16, 16), 4, pygame.Color(0, 0, 0))
+    again = sheet.load_sequence(pygame.Rect(0, 0, 16, 16), 4, pygame.Color(0, 0, 0))
+
+    assert all(a is b for a, b in zip(frames, again, strict=True))
+    assert sheet.cached_images == 4
+
+
+def test_spritesheet_cache_size_bounds_memo(sheet_path: str) -> None:
+    sheet = SpriteSheet(sheet_path, cache_size=2)
+    first = sheet.image_at(pygame.Rect(0, 0, 16, 16))
+    sheet.image_at(pygame.Rect(16, 0, 16, 16))
+    sheet.image_at(pygame.Rect(0, 0, 16, 16))
+    sheet.image_at(pygame.Rect(32, 0, 16, 16))
+
+    assert sheet.cached_images == 2
+    assert sheet.image_at(pygame.Rect(0, 0, 16, 16)) is first
+
+
+def test_animation_sequence_advance_skips_frames() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(4)]
+    sequence = AnimationSequence(frames, loop=True, frame_duration=100)
+    iter(sequence)
+
+    assert sequence.advance(50) is frames[0]
+    assert sequence.advance(60) is frames[1]
+    assert sequence.advance(250) is frames[3]
+    assert sequence.advance(100) is frames[0]
+    assert sequence.elapsed == pytest.approx(60)
+
+
+def test_animation_sequence_advance_without_loop_stops_on_last_frame() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(3)]
+    sequence = AnimationSequence(frames, frame_duration=100)
+
+    assert sequence.advance(1000) is frames[2]
+    assert sequence.finished
+    assert sequence.seek(150) is frames[1]
+    assert not sequence.finished
+
+    sequence.running = False
+    assert sequence.advance(100) is frames[1]
+
+
+def test_animation_sequence_per_frame_durations() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(3)]
+    sequence = AnimationSequence(frames, loop=True, frame_duration=[100, 0, 300])
+
+    assert sequence.duration == 400
+    assert sequence.frame_index(99) == 0
+    assert sequence.frame_index(100) == 2
+    assert sequence.frame_index(399) == 2
+    assert sequence.frame_index(450) == 0
+    assert sequence.seek(1350) is frames[2]
+
+    sequence += AnimationSequence([pygame.Surface((1, 1))], frame_duration=50)
+    assert sequence.frame_durations == [100, 0, 300, 50]
+    assert sequence.frame_index(420) == 3
+
+    with pytest.raises(ValueError, match="frame durations"):
+        AnimationSequence(frames, frame_duration=[100])
+
+
+def test_animation_sequence_fits_durations_to_changed_frames() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(2)]
+    sequence = AnimationSequence(frames, frame_duration=[100, 300])
+    timeline = sequence.timeline
+
+    frames.append(pygame.Surface((1, 1)))
+    assert sequence.frame_durations == [100, 300, 200]
+    assert sequence.duration == 600
+    assert timeline == [100, 400, 600]
+
+    del frames[1:]
+    assert sequence.timeline == [100]
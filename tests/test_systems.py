@@ -0,0 +1,291 @@
+from collections.abc import Callable, Generator
+
+import pygame
+import pytest
+from typing_extensions import override
+
+from apu.collision import HitBox
+from apu.core.enums import Directions
+from apu.core.spritesheet import AnimationSequence
+from apu.objects.components import AnimationComponent, MovementComponent, SolidBodyComponent
+from apu.objects.entities import BaseSprite
+from apu.systems.animation import AnimationSystem
+from apu.systems.movement import MovementSystem
+from apu.systems.pipeline import SystemPipeline
+from apu.systems.scheduler import UpdateScheduler
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _animated_sprite(sequence: AnimationSequence) -> tuple[BaseSprite, AnimationComponent]:
+    sprite = BaseSprite(position=(0, 0))
+    component = AnimationComponent(idle=sequence)
+    sprite.add_component(component)
+    return sprite, component
+
+
+def test_animation_system_ticks_shared_sequences_independently() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(3)]
+    sequence = AnimationSequence(frames, loop=True, frame_duration=[100, 50, 100])
+    system = AnimationSystem()
+    first, first_component = _animated_sprite(sequence)
+    second, second_component = _animated_sprite(sequence)
+    system.register(first_component)
+
+    system.update(120)
+    system.register(second_component)
+    system.update(0)
+    assert first.image is frames[1]
+    assert second.image is frames[0]
+
+    system.update(200)
+    assert first.image is frames[0]
+    assert second.image is frames[2]
+
+    first.update()
+    assert first.image is frames[0]
+
+
+def test_animation_system_follows_animation_speed_changes() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(3)]
+    sequence = AnimationSequence(frames, loop=True, frame_duration=100)
+    system = AnimationSystem()
+    sprite, component = _animated_sprite(sequence)
+    system.register(component)
+
+    system.update(50)
+    assert sprite.image is frames[0]
+    component.set_animation_speed(20)
+    system.update(0)
+    assert sprite.image is frames[2]
+
+    mirrored = sequence.mirror()
+    mirrored.frame_duration = 1000
+    assert sequence.timeline == [20, 40, 60]
+
+
+def test_animation_system_restarts_on_switch_and_unregisters() -> None:
+    idle = [pygame.Surface((1, 1)) for _ in range(2)]
+    walk = [pygame.Surface((1, 1)) for _ in range(2)]
+    system = AnimationSystem()
+    sprite, component = _animated_sprite(AnimationSequence(idle, frame_duration=100))
+    component.add_animation(walk=AnimationSequence(walk, loop=True, frame_duration=100))
+    system.register(component)
+
+    system.update(500)
+    assert sprite.image is idle[1]
+
+    component.switch_to("walk")
+    system.update(10)
+    assert sprite.image is walk[0]
+
+    other, other_component = _animated_sprite(AnimationSequence(idle, frame_duration=100))
+    system.register(other_component)
+    sprite.remove_component(AnimationComponent)
+    assert component not in system
+    assert other_component in system
+    assert len(system) == 1
+
+    system.update(150)
+    assert sprite.image is walk[0]
+    assert other.image is idle[1]
+
+
+def test_movement_system_integrates_subpixel_positions() -> None:
+    system = MovementSystem()
+    sprite = BaseSprite(position=(10, 10))
+    component = MovementComponent(speed=1)
+    sprite.add_component(component)
+    system.register(component)
+
+    sprite.move(Directions.RIGHT, loop=True)
+    sprite.move(Directions.UP, loop=True)
+    system.update(0.5)
+    assert sprite.position == (10, 9)
+    assert system.position(component) == (10.5, 9.5)
+
+    system.update(0.5)
+    sprite.update()
+    assert sprite.position == (11, 9)
+
+    sprite.stop(Directions.UP)
+    sprite.x = 40
+    system.update(2)
+    assert sprite.position == (42, 9)
+
+    sprite.stop(Directions.RIGHT)
+    system.update(5)
+    assert sprite.position == (42, 9)
+
+
+def test_movement_system_follows_speed_changes() -> None:
+    system = MovementSystem()
+    sprite = BaseSprite(position=(0, 0))
+    component = MovementComponent(speed=1)
+    sprite.add_component(component)
+    system.register(component)
+
+    sprite.move(Directions.RIGHT, loop=True)
+    system.update()
+    component.speed = 3
+    system.update()
+    assert sprite.position == (4, 0)
+
+    component.acceleration = 2
+    system.update()
+    assert sprite.position == (9, 0)
+
+
+def test_movement_system_applies_single_steps_and_unregisters() -> None:
+    system = MovementSystem()
+    sprites = [BaseSprite(position=(0, 0)) for _ in range(2)]
+    components = [MovementComponent(speed=2) for _ in sprites]
+    for sprite, component in zip(sprites, components, strict=True):
+        sprite.add_component(component)
+        system.register(component)
+
+    sprites[1].move(Directions.DOWN)
+    system.update()
+    system.update()
+    assert sprites[1].position == (0, 2)
+    assert not sprites[1].is_moving
+
+    sprites[0].remove_component(MovementComponent)
+    assert len(system) == 1
+    sprites[1].move(Directions.LEFT, loop=True)
+    system.update()
+    assert sprites[1].position == (-2, 2)
+
+    with pytest.raises(ValueError, match="added to an entity"):
+        system.register(MovementComponent())
+
+
+def test_update_scheduler_skips_sleeping_components_until_woken() -> None:
+    scheduler = UpdateScheduler()
+    walls = [BaseSprite(position=(0, 0)) for _ in range(3)]
+    for wall in walls:
+        wall.add_component(SolidBodyComponent(box1=HitBox(pygame.Rect(0, 0, 1, 1))))
+        scheduler.register_entity(wall)
+    player = BaseSprite(position=(0, 0))
+    movement = MovementComponent(speed=2)
+    player.add_component(movement)
+    scheduler.register_entity(player)
+
+    assert len(scheduler) == 4
+    assert scheduler.active_count == 0
+
+    movement.move(Directions.RIGHT)
+    assert scheduler.active_count == 1
+    scheduler.update()
+    assert player.position == (2, 0)
+    # One-shot moves stop during the update, putting the component back to sleep.
+    assert scheduler.active_count == 0
+
+    movement.move(Directions.DOWN, loop=True)
+    scheduler.update()
+    scheduler.update()
+    assert player.position == (2, 4)
+    assert scheduler.active_count == 1
+
+    player.remove_component(MovementComponent)
+    assert movement not in scheduler
+    assert scheduler.active_count == 0
+
+
+def test_update_scheduler_updates_solid_bodies_overriding_update() -> None:
+    class PlatformComponent(SolidBodyComponent):
+        @override
+        def update(self) -> None:
+            if self.entity is not None:
+                self.entity.x += 1
+
+    scheduler = UpdateScheduler()
+    platform = BaseSprite(position=(0, 0))
+    platform.add_component(PlatformComponent())
+    scheduler.register_entity(platform)
+    assert scheduler.active_count == 1
+
+    scheduler.update()
+    scheduler.update()
+    assert platform.position == (2, 0)
+
+
+def test_update_scheduler_wakes_animations_on_switch() -> None:
+    frames = [pygame.Surface((1, 1)) for _ in range(2)]
+    sequence = AnimationSequence(frames, loop=True, frame_duration=100)
+    _, component = _animated_sprite(sequence)
+    scheduler = UpdateScheduler()
+    scheduler.register(component)
+    assert scheduler.active_count == 1
+
+    component.pause(False)
+    scheduler.update()
+    assert scheduler.sleeping_count == 1
+
+    component.pause(True)
+    assert scheduler.active_count == 1
+    component.pause(False)
+    scheduler.update()
+    component.switch_to("idle")
+    assert scheduler.active_count == 1
+    scheduler.update()
+    assert scheduler.active_count == 0
+
+    component.animations["idle"].running = True
+    scheduler.wake(component)
+    scheduler.update()
+    assert scheduler.active_count == 1
+
+
+def test_system_pipeline_orders_and_times_systems() -> None:
+    calls: list[tuple[str, float]] = []
+
+    def step(name: str) -> Callable[[float], None]:
+        return lambda dt: calls.append((name, dt))
+
+    pipeline = SystemPipeline()
+    pipeline.add("render", step("render"), priority=10)
+    pipeline.add("animation", step("animation"), after=["movement"])
+    pipeline.add("collision", step("collision"), after=["movement"], before=["animation"])
+    pipeline.add("movement", step("movement"), scale=0.5)
+
+    assert pipeline.order == ["movement", "collision", "animation", "render"]
+    pipeline.update(16)
+    assert calls == [("movement", 8), ("collision", 16), ("animation", 16), ("render", 16)]
+    assert set(pipeline.timings) == {"movement", "collision", "animation", "render"}
+    assert pipeline.total >= 0
+
+    pipeline.remove("movement")
+    assert pipeline.order == ["collision", "animation", "render"]
+
+    with pytest.raises(KeyError, match="already registered"):
+        pipeline.add("render", step("render"))
+    pipeline.add("physics", step("physics"), after=["missing"])
+    with pytest.raises(KeyError, match="missing is not registered"):
+        pipeline.update(16)
+    pipeline.remove("physics")
+    pipeline.add("input", step("input"), after=["animation"], before=["collision"])
+    with pytest.raises(ValueError, match="Circular"):
+        _ = pipeline.order
+
+
+def test_system_pipeline_runs_system_objects() -> None:
+    sprite = BaseSprite(position=(0, 0))
+    movement = MovementComponent(speed=60)
+    sprite.add_component(movement)
+    movement_system = MovementSystem()
+    movement_system.register(movement)
+    scheduler = UpdateScheduler()
+
+    pipeline = SystemPipeline()
+    pipeline.add("movement", movement_system, scale=1 / 1000)
+    pipeline.add("scheduler", scheduler)
+    movement.move(Directions.RIGHT, loop=True)
+    pipeline.update(500)
+
+    assert sprite.x == 30
@@ -0,0 +1,61 @@
+from collections.abc import Generator
+
+import pygame
+import pytest
+
+from apu.core.tools import ImageTools
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_optimize_drops_unused_color_key() -> None:
+    surface = pygame.Surface((4, 4))
+    surface.fill((10, 20, 30))
+
+    image, offset = ImageTools.optimize(surface, pygame.Color(0, 0, 0))
+
+    assert image.get_colorkey() is None
+    assert not image.get_flags() & pygame.SRCALPHA
+    assert offset == (0, 0)
+
+
+def test_optimize_uses_rle_color_key_when_needed() -> None:
+    surface = pygame.Surface((4, 4))
+    surface.fill((10, 20, 30), pygame.Rect(0, 0, 2, 4))
+
+    image, _ = ImageTools.optimize(surface, pygame.Color(0, 0, 0))
+
+    assert image.get_colorkey() == (0, 0, 0, 255)
+    assert image.get_flags() & pygame.RLEACCELOK
+    assert surface.get_colorkey() is None
+
+
+def test_optimize_picks_representation_for_alpha_surfaces() -> None:
+    binary = pygame.Surface((4, 4), pygame.SRCALPHA)
+    binary.fill((0, 0, 0, 255), pygame.Rect(0, 0, 2, 2))
+    image, _ = ImageTools.optimize(binary)
+    assert image.get_colorkey() is not None
+    assert not image.get_flags() & pygame.SRCALPHA
+    assert image.get_at((0, 0))[:3] == (0, 0, 0)
+
+    translucent = binary.copy()
+    translucent.set_at((3, 3), (255, 255, 255, 100))
+    image, _ = ImageTools.optimize(translucent)
+    assert image.get_flags() & pygame.SRCALPHA
+    assert image.get_at((3, 3)) == pygame.Color(255, 255, 255, 100)
+
+
+def test_optimize_crops_mostly_transparent_images() -> None:
+    surface = pygame.Surface((16, 16))
+    surface.fill((200, 0, 0), pygame.Rect(4, 6, 3, 2))
+
+    image, offset = ImageTools.optimize(surface, pygame.Color(0, 0, 0), crop=True)
+
+    assert image.get_size() == (3, 2)
+    assert offset == (4, 6)
+    assert image.get_at((0, 0)) == pygame.Color(200, 0, 0)
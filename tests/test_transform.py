@@ -0,0 +1,149 @@
+from collections.abc import Generator
+import gc
+import weakref
+
+import pygame
+import pytest
+
+from apu.core.masks import MaskCache
+from apu.core.spritesheet import AnimationSequence
+from apu.core.transform import TransformCache
+
+
+@pytest.fixture(autouse=True)
+def pygame_init() -> Generator[None, None, None]:
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _marked_surface() -> pygame.Surface:
+    surface = pygame.Surface((4, 2))
+    surface.fill((255, 255, 255))
+    surface.set_at((0, 0), (255, 0, 0))
+    return surface
+
+
+def test_transform_cache_computes_each_variant_once() -> None:
+    cache = TransformCache()
+    surface = _marked_surface()
+
+    flipped = cache.variant(surface, flip_x=True)
+    assert flipped.get_at((3, 0)) == pygame.Color(255, 0, 0)
+    assert cache.variant(surface, flip_x=True) is flipped
+    assert cache.variant(surface) is surface
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    rotated = cache.variant(surface, rotation=-270, scale=2)
+    assert rotated.get_size() == (4, 8)
+    assert cache.variant(surface, rotation=90, scale=2) is rotated
+
+    tinted = cache.variant(surface, tint=pygame.Color(0, 255, 0))
+    assert tinted.get_at((1, 0)) == pygame.Color(0, 255, 0)
+    assert surface.get_at((1, 0)) == pygame.Color(255, 255, 255)
+
+
+def test_transform_cache_rejects_invalid_transforms() -> None:
+    cache = TransformCache()
+    with pytest.raises(ValueError, match="multiple of 90"):
+        cache.variant(_marked_surface(), rotation=45)
+    with pytest.raises(ValueError, match="positive integer"):
+        cache.variant(_marked_surface(), scale=0)
+
+
+def test_transform_cache_respects_memory_budget() -> None:
+    surface = _marked_surface()
+    cache = TransformCache(budget=surface.get_pitch() * surface.get_height() * 2)
+
+    first = cache.variant(surface, flip_x=True)
+    cache.variant(surface, flip_y=True)
+    cache.variant(surface, flip_x=True, flip_y=True)
+
+    assert len(cache) == 2
+    assert cache.memory <= cache.budget
+    assert cache.variant(surface, flip_x=True) is not first
+
+
+def test_transform_cache_does_not_keep_sources_alive() -> None:
+    cache = TransformCache()
+    surface = _marked_surface()
+    source = weakref.ref(surface)
+    cache.variant(surface, flip_x=True)
+    assert cache.memory > 0
+
+    del surface
+    gc.collect()
+    assert source() is None
+    assert len(cache) == 0
+    assert cache.memory == 0
+
+
+def test_animation_sequence_variants_share_frames() -> None:
+    frames = [_marked_surface() for _ in range(3)]
+    cache = TransformCache()
+    sequence = AnimationSequence(frames, loop=True, frame_duration=100)
+
+    left = sequence.variant(flip_x=True, cache=cache)
+    other_left = AnimationSequence(list(frames), frame_duration=50).variant(
+        flip_x=True, cache=cache
+    )
+
+    assert left.frames is not sequence.frames
+    assert all(a is b for a, b in zip(left.frames, other_left.frames, strict=True))
+    assert left.frame_duration == 100
+    assert len(sequence.mirror().frames) == 3
+
+
+def _corner_surface() -> pygame.Surface:
+    surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+    surface.fill((255, 255, 255, 255), pygame.Rect(0, 0, 2, 2))
+    return surface
+
+
+def test_mask_cache_computes_each_mask_once_per_variant() -> None:
+    cache = MaskCache(transforms=TransformCache())
+    surface = _corner_surface()
+
+    mask = cache.mask(surface)
+    assert mask.count() == 4
+    assert mask.get_at((0, 0))
+    assert not mask.get_at((3, 0))
+    assert cache.mask(surface) is mask
+
+    mirrored = cache.mask(surface, flip_x=True)
+    assert mirrored is not mask
+    assert mirrored.get_at((3, 0))
+    assert not mirrored.get_at((0, 0))
+
+    area = cache.mask(surface, pygame.Rect(1, 1, 8, 8))
+    assert area.get_size() == (3, 3)
+    assert area.count() == 1
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    assert cache.filled((2, 3)).count() == 6
+    assert cache.filled((2, 3)) is cache.filled((2, 3))
+
+
+def test_mask_cache_evicts_least_recently_used_masks() -> None:
+    cache = MaskCache(budget=2 * 4, transforms=TransformCache())
+    surfaces = [_corner_surface() for _ in range(3)]
+    for surface in surfaces:
+        cache.mask(surface)
+
+    assert len(cache) == 2
+    assert cache.memory == 2 * 4
+    cache.clear()
+    assert (len(cache), cache.memory) == (0, 0)
+
+
+def test_mask_cache_does_not_keep_sources_alive() -> None:
+    cache = MaskCache(transforms=TransformCache())
+    surface = _corner_surface()
+    source = weakref.ref(surface)
+    cache.mask(surface)
+
+    del surface
+    gc.collect()
+    assert source() is None
+    assert len(cache) == 0
+    assert cache.memory == 0